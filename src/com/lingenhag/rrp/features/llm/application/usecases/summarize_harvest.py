@@ -101,133 +101,23 @@ class SummarizeHarvest:
             print(f"[process-harvest] nothing to process for {asset_symbol}.")
             return ProcessResult(0, 0, 0, 0, 0)
 
-        for h in batch:
-            processed += 1
-            try:
-                url: str = h["url"]
-                title: Optional[str] = h.get("title")
-                h_published = self.news_repo.parse_datetime(h.get("published_at"))
-                harvest_id = int(h.get("id", 0)) if isinstance(h.get("id"), (str, int)) else 0
-
-                ai, _, _ = self.llm.summarize_and_score(
-                    asset_symbol=asset_symbol,
-                    url=url,
-                    published_at=h_published.isoformat() if h_published else None,
-                    title=title or "",
-                )
-
-                # WICHTIG: Nur bei True speichern; None/False → ablehnen.
-                ai_relevance = self._to_bool_strict(ai.get("relevance"))
-                model_name = getattr(self.llm, "model", "unknown")
-
-                article_id: Optional[int] = None
-                if ai_relevance is True:
-                    art = self._make_article(h_row=h, asset_symbol=asset_symbol, ai=ai, model_name=model_name)
-                    if not dry_run:
-                        article_id = self.votes_repo.save_summary(art)
-                    saved += 1
-                    self._record_llm_domain_stat(url, asset_symbol, accepted=True)
-                else:
-                    if not dry_run:
-                        self.votes_repo.save_rejection(
-                            url=url,
-                            asset_symbol=asset_symbol,
-                            reason="no_asset_relation",
-                            source=h.get("source"),
-                            context="summarize",
-                            article_id=None,
-                            model="ensemble",
-                            details_json=self._compact_votes_json(ai.get("votes")),
-                        )
-                    rejected_irrelevant += 1
-                    self._record_llm_domain_stat(url, asset_symbol, accepted=False)
-
-                # Persistiere *nur* Einzel-Votes je Modell (keine Ensemble-Zeile)
-                for v in (ai.get("votes") or []):
-                    if not dry_run:
-                        v_rel = self._to_bool_strict(v.get("relevance")) is True
-                        self.votes_repo.save_vote(
-                            url=url if article_id is None else None,  # URL nur, wenn kein Artikel gespeichert wurde
-                            asset_symbol=asset_symbol,
-                            model=str(v.get("model") or "unknown"),
-                            relevance=v_rel,
-                            sentiment=self._round2_opt(v.get("sentiment")),
-                            summary=v.get("summary"),
-                            harvest_id=harvest_id,
-                            article_id=article_id if ai_relevance is True else None,
-                        )
-
-                if not dry_run:
-                    self.news_repo.delete_url_harvest(harvest_id)
-                deleted += 1
-
-            except Exception as exc:
-                errors += 1
-                print(f"[process-harvest] ERROR on url_id={h.get('id', 'unknown')}: {exc}")
-                continue
-
-            if progress_every > 0 and processed % progress_every == 0:
-                print(f"[process-harvest] {processed} URLs processed...")
-
-        if processed % (progress_every or 1) != 0:
-            print(f"[process-harvest] {processed} URLs processed (batch complete).")
-
-        return ProcessResult(processed, saved, deleted, errors, rejected_irrelevant)
-
-    def process_batch_parallel(
-            self,
-            *,
-            asset_symbol: str,
-            limit: int = 25,
-            since_utc: Optional[datetime] = None,
-            workers: int = 8,
-            rate_limit_per_min: int = 60,
-            progress_every: int = 25,
-            dry_run: bool = False,
-    ) -> ProcessResult:
-        batch = self.news_repo.fetch_url_harvest_batch(
-            asset_symbol=asset_symbol, limit=limit, since_utc=since_utc
-        )
-        if not batch:
-            print(f"[process-harvest] nothing to process for {asset_symbol}.")
-            return ProcessResult(0, 0, 0, 0, 0)
-
-        limiter = _RateLimiter(rate_limit_per_min)
-
-        def _llm_task(h: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-            try:
-                url: str = h["url"]
-                title: Optional[str] = h.get("title")
-                h_published = self.news_repo.parse_datetime(h.get("published_at"))
-                limiter.wait()
-                ai, _, _ = self.llm.summarize_and_score(
-                    asset_symbol=asset_symbol,
-                    url=url,
-                    published_at=h_published.isoformat() if h_published else None,
-                    title=title or "",
-                )
-                return h, {"ok": True, "ai": ai}
-            except Exception as exc:
-                return h, {"ok": False, "error": exc}
-
-        processed = saved = deleted = errors = rejected_irrelevant = 0
-
-        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
-            futures = [pool.submit(_llm_task, h) for h in batch]
-
-            for fut in as_completed(futures):
+        try:
+            for h in batch:
                 processed += 1
-                h, res = fut.result()
-                url = h.get("url")
-                harvest_id = int(h.get("id", 0)) if isinstance(h.get("id"), (str, int)) else 0
-
-                if not res.get("ok"):
-                    errors += 1
-                    print(f"[process-harvest] ERROR on url_id={h.get('id', 'unknown')}: {res.get('error')}")
-                    continue
-
-                ai = res["ai"]
                 try:
+                    url: str = h["url"]
+                    title: Optional[str] = h.get("title")
+                    h_published = self.news_repo.parse_datetime(h.get("published_at"))
+                    harvest_id = int(h.get("id", 0)) if isinstance(h.get("id"), (str, int)) else 0
+
+                    ai, _, _ = self.llm.summarize_and_score(
+                        asset_symbol=asset_symbol,
+                        url=url,
+                        published_at=h_published.isoformat() if h_published else None,
+                        title=title or "",
+                    )
+
+                    # WICHTIG: Nur bei True speichern; None/False → ablehnen.
                     ai_relevance = self._to_bool_strict(ai.get("relevance"))
                     model_name = getattr(self.llm, "model", "unknown")
 
@@ -253,11 +143,12 @@ class SummarizeHarvest:
                         rejected_irrelevant += 1
                         self._record_llm_domain_stat(url, asset_symbol, accepted=False)
 
+                    # Persistiere *nur* Einzel-Votes je Modell (keine Ensemble-Zeile)
                     for v in (ai.get("votes") or []):
                         if not dry_run:
                             v_rel = self._to_bool_strict(v.get("relevance")) is True
                             self.votes_repo.save_vote(
-                                url=url if article_id is None else None,
+                                url=url if article_id is None else None,  # URL nur, wenn kein Artikel gespeichert wurde
                                 asset_symbol=asset_symbol,
                                 model=str(v.get("model") or "unknown"),
                                 relevance=v_rel,
@@ -279,9 +170,122 @@ class SummarizeHarvest:
                 if progress_every > 0 and processed % progress_every == 0:
                     print(f"[process-harvest] {processed} URLs processed...")
 
-        if processed % (progress_every or 1) != 0:
-            print(f"[process-harvest] {processed} URLs processed (batch complete).")
+            if processed % (progress_every or 1) != 0:
+                print(f"[process-harvest] {processed} URLs processed (batch complete).")
+        finally:
+            self._flush_domain_stats()
+        return ProcessResult(processed, saved, deleted, errors, rejected_irrelevant)
 
+    def process_batch_parallel(
+            self,
+            *,
+            asset_symbol: str,
+            limit: int = 25,
+            since_utc: Optional[datetime] = None,
+            workers: int = 8,
+            rate_limit_per_min: int = 60,
+            progress_every: int = 25,
+            dry_run: bool = False,
+    ) -> ProcessResult:
+        batch = self.news_repo.fetch_url_harvest_batch(
+            asset_symbol=asset_symbol, limit=limit, since_utc=since_utc
+        )
+        if not batch:
+            print(f"[process-harvest] nothing to process for {asset_symbol}.")
+            return ProcessResult(0, 0, 0, 0, 0)
+
+        try:
+            limiter = _RateLimiter(rate_limit_per_min)
+
+            def _llm_task(h: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+                try:
+                    url: str = h["url"]
+                    title: Optional[str] = h.get("title")
+                    h_published = self.news_repo.parse_datetime(h.get("published_at"))
+                    limiter.wait()
+                    ai, _, _ = self.llm.summarize_and_score(
+                        asset_symbol=asset_symbol,
+                        url=url,
+                        published_at=h_published.isoformat() if h_published else None,
+                        title=title or "",
+                    )
+                    return h, {"ok": True, "ai": ai}
+                except Exception as exc:
+                    return h, {"ok": False, "error": exc}
+
+            processed = saved = deleted = errors = rejected_irrelevant = 0
+
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                futures = [pool.submit(_llm_task, h) for h in batch]
+
+                for fut in as_completed(futures):
+                    processed += 1
+                    h, res = fut.result()
+                    url = h.get("url")
+                    harvest_id = int(h.get("id", 0)) if isinstance(h.get("id"), (str, int)) else 0
+
+                    if not res.get("ok"):
+                        errors += 1
+                        print(f"[process-harvest] ERROR on url_id={h.get('id', 'unknown')}: {res.get('error')}")
+                        continue
+
+                    ai = res["ai"]
+                    try:
+                        ai_relevance = self._to_bool_strict(ai.get("relevance"))
+                        model_name = getattr(self.llm, "model", "unknown")
+
+                        article_id: Optional[int] = None
+                        if ai_relevance is True:
+                            art = self._make_article(h_row=h, asset_symbol=asset_symbol, ai=ai, model_name=model_name)
+                            if not dry_run:
+                                article_id = self.votes_repo.save_summary(art)
+                            saved += 1
+                            self._record_llm_domain_stat(url, asset_symbol, accepted=True)
+                        else:
+                            if not dry_run:
+                                self.votes_repo.save_rejection(
+                                    url=url,
+                                    asset_symbol=asset_symbol,
+                                    reason="no_asset_relation",
+                                    source=h.get("source"),
+                                    context="summarize",
+                                    article_id=None,
+                                    model="ensemble",
+                                    details_json=self._compact_votes_json(ai.get("votes")),
+                                )
+                            rejected_irrelevant += 1
+                            self._record_llm_domain_stat(url, asset_symbol, accepted=False)
+
+                        for v in (ai.get("votes") or []):
+                            if not dry_run:
+                                v_rel = self._to_bool_strict(v.get("relevance")) is True
+                                self.votes_repo.save_vote(
+                                    url=url if article_id is None else None,
+                                    asset_symbol=asset_symbol,
+                                    model=str(v.get("model") or "unknown"),
+                                    relevance=v_rel,
+                                    sentiment=self._round2_opt(v.get("sentiment")),
+                                    summary=v.get("summary"),
+                                    harvest_id=harvest_id,
+                                    article_id=article_id if ai_relevance is True else None,
+                                )
+
+                        if not dry_run:
+                            self.news_repo.delete_url_harvest(harvest_id)
+                        deleted += 1
+
+                    except Exception as exc:
+                        errors += 1
+                        print(f"[process-harvest] ERROR on url_id={h.get('id', 'unknown')}: {exc}")
+                        continue
+
+                    if progress_every > 0 and processed % progress_every == 0:
+                        print(f"[process-harvest] {processed} URLs processed...")
+
+            if processed % (progress_every or 1) != 0:
+                print(f"[process-harvest] {processed} URLs processed (batch complete).")
+        finally:
+            self._flush_domain_stats()
         return ProcessResult(processed, saved, deleted, errors, rejected_irrelevant)
 
     def _make_article(
@@ -323,6 +327,15 @@ class SummarizeHarvest:
             # Domain-Statistik ist "best effort" – keine Hard-Failure
             pass
 
+    def _flush_domain_stats(self) -> None:
+        if not self.domain_policy:
+            return
+        try:
+            self.domain_policy.flush()
+        except Exception:
+            # Domain-Statistik ist "best effort" – keine Hard-Failure
+            pass
+
     @staticmethod
     def _round2_opt(val: Optional[float]) -> Optional[float]:
         if val is None:
@@ -86,10 +86,12 @@ def add_llm_subparser(
 # Helpers (Parsing & Export)
 # ---------------------------------------------------------------------------
 def _parse_iso(value: str) -> datetime:
-    v = value.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(v)
+    try:
+        dt = datetime.fromisoformat(value)  # ab 3.11 inkl. "Z" – ohne String-Kopie
+    except ValueError:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
@@ -147,8 +149,7 @@ def _export_votes_csv(
     with open(out_path, "w", encoding="utf-8", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(cols)
-        for r in rows:
-            writer.writerow(_stringify_row(r))
+        writer.writerows(map(_stringify_row, rows))
 
     return len(rows)
 
@@ -195,36 +196,39 @@ def _cmd_llm_process(args: argparse.Namespace, config: Settings, metrics: Metric
         domain_policy=domain_policy,
     )
 
-    start_time = time.time()
-    if args.parallel:
-        res = proc.process_batch_parallel(
-            asset_symbol=asset_obj.symbol,
-            limit=args.limit,
-            since_utc=time_range.start,
-            workers=args.workers,
-            rate_limit_per_min=args.rate_limit,
-            dry_run=bool(getattr(args, "dry_run", False)),
-        )
-        metrics.track_summarize_duration(asset_obj.symbol, "parallel", time.time() - start_time)
-        print(
-            f"[llm-process-par] asset={asset_obj.symbol} processed={res.processed} "
-            f"saved={res.saved} deleted={res.deleted_from_harvest} errors={res.errors} "
-            f"rejected={res.rejected_irrelevant} workers={args.workers} rate_limit={args.rate_limit}/min "
-            f"dry_run={bool(getattr(args, 'dry_run', False))}"
-        )
-    else:
-        res = proc.process_batch(
-            asset_symbol=asset_obj.symbol,
-            limit=args.limit,
-            since_utc=time_range.start,
-            dry_run=bool(getattr(args, "dry_run", False)),
-        )
-        metrics.track_summarize_duration(asset_obj.symbol, "sequential", time.time() - start_time)
-        print(
-            f"[llm-process] asset={asset_obj.symbol} processed={res.processed} "
-            f"saved={res.saved} deleted={res.deleted_from_harvest} errors={res.errors} "
-            f"rejected={res.rejected_irrelevant} dry_run={bool(getattr(args, 'dry_run', False))}"
-        )
+    try:
+        start_time = time.time()
+        if args.parallel:
+            res = proc.process_batch_parallel(
+                asset_symbol=asset_obj.symbol,
+                limit=args.limit,
+                since_utc=time_range.start,
+                workers=args.workers,
+                rate_limit_per_min=args.rate_limit,
+                dry_run=bool(getattr(args, "dry_run", False)),
+            )
+            metrics.track_summarize_duration(asset_obj.symbol, "parallel", time.time() - start_time)
+            print(
+                f"[llm-process-par] asset={asset_obj.symbol} processed={res.processed} "
+                f"saved={res.saved} deleted={res.deleted_from_harvest} errors={res.errors} "
+                f"rejected={res.rejected_irrelevant} workers={args.workers} rate_limit={args.rate_limit}/min "
+                f"dry_run={bool(getattr(args, 'dry_run', False))}"
+            )
+        else:
+            res = proc.process_batch(
+                asset_symbol=asset_obj.symbol,
+                limit=args.limit,
+                since_utc=time_range.start,
+                dry_run=bool(getattr(args, "dry_run", False)),
+            )
+            metrics.track_summarize_duration(asset_obj.symbol, "sequential", time.time() - start_time)
+            print(
+                f"[llm-process] asset={asset_obj.symbol} processed={res.processed} "
+                f"saved={res.saved} deleted={res.deleted_from_harvest} errors={res.errors} "
+                f"rejected={res.rejected_irrelevant} dry_run={bool(getattr(args, 'dry_run', False))}"
+            )
+    finally:
+        domain_repo.close()
 
     # Optionaler CSV-Export der Votes (Auditing)
     if getattr(args, "export_votes_csv", None):
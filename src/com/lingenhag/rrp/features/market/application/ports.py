@@ -34,6 +34,12 @@ class MarketRepositoryPort(Protocol):
     def last_stored_day(self, asset_symbol: str, provider: str, vs_currency: str) -> Optional[date]:
         ...
 
+    def last_stored_days(
+            self, asset_symbols: List[str], provider: str, vs_currency: str
+    ) -> Dict[str, Optional[date]]:
+        """Batch-Variante von last_stored_day() (ein Roundtrip)."""
+        ...
+
     def fetch_range(
             self,
             asset_symbol: str,
@@ -44,12 +50,31 @@ class MarketRepositoryPort(Protocol):
     ) -> List[DailyCandle]:
         ...
 
+    def range_summary(
+            self,
+            asset_symbol: str,
+            provider: str,
+            vs_currency: str,
+            start: date,
+            end: date,
+    ) -> Tuple[int, Optional[float], Optional[float]]:
+        """(Anzahl Tage, erster Close, letzter Close) im Zeitraum."""
+        ...
+
     def get_provider_id(self, asset_symbol: str, provider: str) -> Optional[str]:
         ...
 
+    def get_provider_ids(self, asset_symbols: List[str], provider: str) -> Dict[str, Optional[str]]:
+        """Batch-Variante von get_provider_id() (ein Roundtrip)."""
+        ...
+
     def upsert_asset_provider(self, asset_symbol: str, provider: str, provider_id: str) -> None:
         ...
 
+    def upsert_asset_providers_bulk(self, rows: List[Tuple[str, str, str]]) -> None:
+        """Bulk-Upsert von (asset_symbol, provider, provider_id) in einem Roundtrip."""
+        ...
+
     def list_provider_pairs(self, provider: str, asset_symbols: List[str]) -> List[tuple[str, str]]:
         ...
 
@@ -78,6 +103,17 @@ class MarketRepositoryPort(Protocol):
         """Alias für upsert_market_factors(), Backwards-Compat."""
         ...
 
+    def export_market_factors_csv(
+            self,
+            path: str,
+            asset_symbol: str,
+            start: date,
+            end: date,
+            rows: Optional[List[object]] = None,
+    ) -> None:
+        """CSV-Export der Faktoren; ohne rows aus market_factors_daily, sonst aus den übergebenen Zeilen."""
+        ...
+
 
 class SeedingRepositoryPort(Protocol):
     """
@@ -1,11 +1,16 @@
 # src/com/lingenhag/rrp/features/market/application/usecases/ingest_spot.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from com.lingenhag.rrp.domain.models import MarketSnapshot
 from com.lingenhag.rrp.features.market.application.ports import MarketDataPort, MarketRepositoryPort
 
+# CoinGecko /coins/markets liefert max. 250 ids pro Request (per_page-Maximum)
+_SPOT_CHUNK = 250
+
 
 @dataclass(frozen=True)
 class IngestSpotResult:
@@ -21,11 +26,34 @@ class IngestSpot:
         self.source = source
 
     def execute(self, assets: List[Tuple[str, str]], vs_currency: str = "usd") -> IngestSpotResult:
+        return self.execute_parallel(assets, vs_currency=vs_currency, workers=1)
+
+    def execute_parallel(
+            self,
+            assets: List[Tuple[str, str]],
+            vs_currency: str = "usd",
+            workers: int = 4,
+    ) -> IngestSpotResult:
+        """
+        Wie execute(), aber die provider_ids werden in Requests à _SPOT_CHUNK ids geteilt
+        und parallel geholt (I/O-bound). Persistiert wird einmal gebündelt.
+        `workers` wirkt erst ab mehr als _SPOT_CHUNK ids; kleinere Listen sind ein einziger Request.
+        """
         if not assets:
             return IngestSpotResult(requested=0, fetched=0, saved=0, duplicates=0)
 
-        provider_ids = [pid for _, pid in assets]
-        snapshots = self.source.fetch_spot(provider_ids=provider_ids, vs_currency=vs_currency)
+        provider_ids = list(dict.fromkeys(pid for _, pid in assets))
+        chunks = [provider_ids[i:i + _SPOT_CHUNK] for i in range(0, len(provider_ids), _SPOT_CHUNK)]
+
+        def _fetch(ids: List[str]) -> List[MarketSnapshot]:
+            return self.source.fetch_spot(provider_ids=ids, vs_currency=vs_currency)
+
+        if workers <= 1 or len(chunks) == 1:
+            parts = [_fetch(ids) for ids in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                parts = list(pool.map(_fetch, chunks))
+        snapshots = [s for part in parts for s in part]
 
         inserted, dupes = self.repo.upsert_snapshots(snapshots)
 
@@ -34,4 +62,4 @@ class IngestSpot:
             fetched=len(snapshots),
             saved=inserted,
             duplicates=dupes,
-        )
\ No newline at end of file
+        )
@@ -3,12 +3,20 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # optional: Rust-basierter JSON-Parser (deutlich schneller bei langen History-Arrays)
+    import orjson
+except ImportError:  # pragma: no cover - Fallback auf requests/stdlib-json
+    orjson = None  # type: ignore[assignment]
 
 from com.lingenhag.rrp.domain.models import MarketSnapshot
 from com.lingenhag.rrp.features.market.application.ports import MarketDataPort
@@ -18,14 +26,27 @@ _LOG = logging.getLogger(__name__)
 
 
 def _maybe_float(v: Any) -> Optional[float]:
+    # Fast-Path: CoinGecko liefert praktisch immer None/float/int
+    if v is None:
+        return None
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
     try:
-        return float(v) if v is not None else None
+        return float(v)
     except Exception:
         return None
 
 
-def _pct_to_float(v: Any) -> Optional[float]:
-    return _maybe_float(v)
+def _decode_json(resp: requests.Response) -> Any:
+    """Parst den Body via orjson (falls installiert); Parse-Fehler bleiben RequestExceptions (→ Retry)."""
+    if orjson is None:
+        return resp.json()
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), resp.text, 0) from e
 
 
 def _classify_endpoint_hint(status_code: int, body_text: str) -> Optional[str]:
@@ -37,6 +58,68 @@ def _classify_endpoint_hint(status_code: int, body_text: str) -> Optional[str]:
     return None
 
 
+class CircuitOpenError(requests.RequestException):
+    """CoinGecko gilt nach wiederholten Fehlschlägen als down; Requests werden bis zum Cool-off abgewiesen."""
+
+
+@dataclass
+class _CircuitState:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    threshold: int = 5
+    cool_off: float = 60.0
+    # Half-open: genau ein Probe-Request läuft; alle anderen werden bis zu dessen Ausgang abgewiesen
+    probe_in_flight: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def check(self) -> bool:
+        """Wirft CircuitOpenError, solange offen; True, wenn der Aufrufer der Half-open-Probe ist."""
+        with self.lock:
+            if self.probe_in_flight:
+                raise CircuitOpenError("CoinGecko circuit half-open (probe request in flight)")
+            if self.opened_at is None:
+                return False
+            remaining = self.cool_off - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"CoinGecko circuit open ({remaining:.0f}s cool-off remaining)")
+            # Half-open: ein Versuch darf durch; scheitert er, öffnet der Breaker sofort wieder
+            self.opened_at = None
+            self.failures = self.threshold - 1
+            self.probe_in_flight = True
+            return True
+
+    def release_probe(self) -> None:
+        # Probe ohne Outage-Urteil beendet (z. B. 4xx): nur Flag lösen, Zähler unverändert
+        with self.lock:
+            self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.failures >= self.threshold and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                _LOG.warning(
+                    "CoinGecko circuit opened after %s consecutive failures; fail-fast for %.0fs",
+                    self.failures,
+                    self.cool_off,
+                )
+
+
+def _is_outage(exc: requests.RequestException) -> bool:
+    # Nur Netzwerkfehler, 429 und 5xx zählen für den Breaker; 4xx (z. B. unbekannte id) nicht
+    resp = getattr(exc, "response", None)
+    if resp is None:
+        return True
+    return resp.status_code == 429 or resp.status_code >= 500
+
+
 @dataclass(frozen=True)
 class CoinGeckoClient(MarketDataPort):
     api_base: str = os.getenv("COINGECKO_API_BASE", "https://api.coingecko.com/api/v3")
@@ -45,6 +128,28 @@ class CoinGeckoClient(MarketDataPort):
     max_retries: int = 3
     initial_backoff: float = 1.0
     metrics: Optional[Metrics] = None
+    # Obergrenze gleichzeitiger HTTP-Requests (alle Threads teilen sich diese Schranke)
+    max_in_flight: int = 4
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+    _in_flight: threading.Semaphore = field(init=False, repr=False, compare=False)
+    # Circuit-Breaker: nach N Fehlschlägen in Folge für cool_off Sekunden fail-fast
+    breaker_threshold: int = 5
+    breaker_cool_off: float = 60.0
+    _circuit: _CircuitState = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Geteilte Session (Keep-Alive); urllib3-Pool ist thread-safe, solange pool_maxsize >= Worker.
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(1, self.max_in_flight))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_in_flight", threading.Semaphore(max(1, self.max_in_flight)))
+        object.__setattr__(
+            self,
+            "_circuit",
+            _CircuitState(threshold=max(1, self.breaker_threshold), cool_off=self.breaker_cool_off),
+        )
 
     def _bases_for_key(self) -> tuple[str, str]:
         # (public, pro)
@@ -63,19 +168,36 @@ class CoinGeckoClient(MarketDataPort):
         public_base, pro_base = self._bases_for_key()
         use_pro = bool(self.api_key)
         backoff = self.initial_backoff
+        is_probe = self._circuit.check()
+        try:
+            return self._request_with_retries(method, path, params, public_base, pro_base, use_pro, backoff)
+        finally:
+            if is_probe:
+                self._circuit.release_probe()
 
+    def _request_with_retries(
+            self,
+            method: str,
+            path: str,
+            params: Dict[str, Any],
+            public_base: str,
+            pro_base: str,
+            use_pro: bool,
+            backoff: float,
+    ) -> Any:
         for attempt in range(1, self.max_retries + 1):
             base = pro_base if use_pro else public_base
             url = f"{base.rstrip('/')}/{path.lstrip('/')}"
             start_time = time.time()
             try:
-                resp = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    headers=self._headers(use_pro=use_pro),
-                    timeout=self.timeout,
-                )
+                with self._in_flight:
+                    resp = self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        headers=self._headers(use_pro=use_pro),
+                        timeout=self.timeout,
+                    )
                 if resp.status_code in (429, 500, 502, 503, 504):
                     if attempt < self.max_retries:
                         _LOG.warning(
@@ -112,7 +234,8 @@ class CoinGeckoClient(MarketDataPort):
                         body_text,
                     )
                     resp.raise_for_status()
-                data = resp.json()
+                data = _decode_json(resp)
+                self._circuit.record_success()
                 if self.metrics:
                     self.metrics.track_api_request("coingecko", "success")
                     self.metrics.track_api_duration("coingecko", time.time() - start_time)
@@ -122,6 +245,8 @@ class CoinGeckoClient(MarketDataPort):
                     self.metrics.track_api_request("coingecko", "error")
                     self.metrics.track_api_duration("coingecko", time.time() - start_time)
                 if attempt >= self.max_retries:
+                    if _is_outage(e):
+                        self._circuit.record_failure()
                     raise
                 _LOG.warning(
                     "CoinGecko request error '%s' (attempt %s/%s); retry in %.1fs",
@@ -166,9 +291,9 @@ class CoinGeckoClient(MarketDataPort):
                     price=float(item.get("current_price")) if item.get("current_price") is not None else 0.0,
                     market_cap=_maybe_float(item.get("market_cap")),
                     volume_24h=_maybe_float(item.get("total_volume")),
-                    change_1h=_pct_to_float(item.get("price_change_percentage_1h_in_currency")),
-                    change_24h=_pct_to_float(item.get("price_change_percentage_24h_in_currency")),
-                    change_7d=_pct_to_float(item.get("price_change_percentage_7d_in_currency")),
+                    change_1h=_maybe_float(item.get("price_change_percentage_1h_in_currency")),
+                    change_24h=_maybe_float(item.get("price_change_percentage_24h_in_currency")),
+                    change_7d=_maybe_float(item.get("price_change_percentage_7d_in_currency")),
                     observed_at=observed_at,
                     source="CoinGecko",
                 )
@@ -205,23 +330,55 @@ class CoinGeckoClient(MarketDataPort):
         total_volumes = data.get("total_volumes") or []
         mcap_map = {int(x[0]): _maybe_float(x[1]) for x in market_caps if isinstance(x, list) and len(x) == 2}
         vol_map = {int(x[0]): _maybe_float(x[1]) for x in total_volumes if isinstance(x, list) and len(x) == 2}
-        out: List[MarketSnapshot] = []
-        for p in prices:
-            if not isinstance(p, list) or len(p) != 2:
-                continue
-            ts_ms, price = int(p[0]), _maybe_float(p[1])
-            observed_at = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
-            out.append(
-                MarketSnapshot(
-                    asset_symbol=(provider_id or "").upper(),
-                    price=price or 0.0,
-                    market_cap=mcap_map.get(ts_ms),
-                    volume_24h=vol_map.get(ts_ms),
-                    change_1h=None,
-                    change_24h=None,
-                    change_7d=None,
-                    observed_at=observed_at,
-                    source="CoinGecko",
-                )
+        points = [(int(p[0]), p[1]) for p in prices if isinstance(p, list) and len(p) == 2]
+        # Zeitstempel in einem Durchgang bauen (gebundene Referenzen, positionale tz → kein kwargs-Overhead)
+        fromts, utc = datetime.fromtimestamp, timezone.utc
+        observed = [fromts(ts_ms / 1000, utc) for ts_ms, _ in points]
+        symbol = (provider_id or "").upper()
+        return [
+            MarketSnapshot(
+                asset_symbol=symbol,
+                price=_maybe_float(price) or 0.0,
+                market_cap=mcap_map.get(ts_ms),
+                volume_24h=vol_map.get(ts_ms),
+                change_1h=None,
+                change_24h=None,
+                change_7d=None,
+                observed_at=observed_at,
+                source="CoinGecko",
             )
-        return out
\ No newline at end of file
+            for (ts_ms, price), observed_at in zip(points, observed)
+        ]
+
+    def fetch_histories(
+            self,
+            provider_ids: Sequence[str],
+            vs_currency: str,
+            ts_from: int,
+            ts_to: int,
+            max_workers: int = 8,
+    ) -> Dict[str, List[MarketSnapshot]]:
+        """
+        Paralleles Backfill mehrerer provider_ids via fetch_history_range().
+        Netzwerk-Wartezeiten überlappen (I/O gibt den GIL frei); die Semaphore
+        max_in_flight begrenzt trotzdem die gleichzeitigen Requests gegen CoinGecko.
+        Ergebnisse in Completion-Order; der erste Fehler wird weitergereicht.
+        """
+        ids = list(dict.fromkeys(pid for pid in provider_ids if pid))
+        if not ids:
+            return {}
+        out: Dict[str, List[MarketSnapshot]] = {}
+        workers = max(1, min(max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="coingecko") as pool:
+            futures = {
+                pool.submit(self.fetch_history_range, pid, vs_currency, ts_from, ts_to): pid
+                for pid in ids
+            }
+            try:
+                for fut in as_completed(futures):
+                    out[futures[fut]] = fut.result()
+            except BaseException:
+                for f in futures:
+                    f.cancel()
+                raise
+        return out
@@ -26,6 +26,8 @@ def _get(field: str, row: object, default: Any = None) -> Any:
 class DuckDBMarketRepository(MarketRepositoryPort):
     def __init__(self, db_path: str | Path) -> None:
         self.db_path = str(db_path)
+        # Bereits bestätigte Tabellen (Tabellen verschwinden zur Laufzeit nicht) → Check nur einmal
+        self._tables_ok: set[str] = set()
 
     def _connect(self) -> duckdb.DuckDBPyConnection:
         con = duckdb.connect(self.db_path)
@@ -36,53 +38,80 @@ class DuckDBMarketRepository(MarketRepositoryPort):
         return con
 
     def _ensure_table(self, con: duckdb.DuckDBPyConnection, table: str) -> None:
-        info = con.execute(f"PRAGMA table_info('{table}')").fetchall()
-        if not info:
+        if table in self._tables_ok:
+            return
+        # Parametrisierte Katalog-Abfrage nur für diese Tabelle (PRAGMA table_info lädt alle Spalten
+        # und wirft bei fehlender Tabelle eine CatalogException statt der Hinweis-Meldung)
+        row = con.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = ? LIMIT 1",
+            [table],
+        ).fetchone()
+        if not row:
             raise RuntimeError(f"{table} fehlt. Migration ausführen.")
+        self._tables_ok.add(table)
 
     # -------- Snapshots (intraday) --------
     def upsert_snapshots(self, snapshots: Sequence[MarketSnapshot]) -> Tuple[int, int]:
         if not snapshots:
             return 0, 0
-        inserted = 0
-        skipped = 0
+        rows = [
+            (
+                s.asset_symbol,
+                s.price,
+                s.market_cap,
+                s.volume_24h,
+                s.change_1h,
+                s.change_24h,
+                s.change_7d,
+                _ts_utc_naive(s.observed_at),
+                s.source or "CoinGecko",
+            )
+            for s in snapshots
+        ]
         with self._connect() as con:
             self._ensure_table(con, "market_snapshots")
-            for s in snapshots:
-                row = con.execute(
-                    """
-                    SELECT 1 FROM market_snapshots
-                    WHERE asset_symbol=? AND observed_at=? AND source=?
-                    """,
-                    [
-                        s.asset_symbol,
-                        _ts_utc_naive(s.observed_at),
-                        s.source or "CoinGecko",
-                        ],
-                ).fetchone()
-                if row:
-                    skipped += 1
-                    continue
-                con.execute(
-                    """
-                    INSERT INTO market_snapshots
-                    (asset_symbol, price, market_cap, volume_24h, change_1h, change_24h, change_7d, observed_at, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        s.asset_symbol,
-                        s.price,
-                        s.market_cap,
-                        s.volume_24h,
-                        s.change_1h,
-                        s.change_24h,
-                        s.change_7d,
-                        _ts_utc_naive(s.observed_at),
-                        s.source or "CoinGecko",
+            # begin() vor dem try: scheitert es, gibt es nichts zurückzurollen
+            con.begin()  # ein Commit/WAL-Flush für den ganzen Batch
+            try:
+                # Bestehende Schlüssel des Zeitfensters einmalig laden (statt SELECT pro Zeile)
+                existing = set(
+                    con.execute(
+                        """
+                        SELECT asset_symbol, observed_at, source FROM market_snapshots
+                        WHERE observed_at BETWEEN ? AND ?
+                          AND asset_symbol IN (SELECT * FROM UNNEST(?))
+                          AND source IN (SELECT * FROM UNNEST(?))
+                        """,
+                        [
+                            min(r[7] for r in rows),
+                            max(r[7] for r in rows),
+                            sorted({r[0] for r in rows}),
+                            sorted({r[8] for r in rows}),
                         ],
+                    ).fetchall()
                 )
-                inserted += 1
-        return inserted, skipped
+                to_insert = []
+                for r in rows:
+                    key = (r[0], r[7], r[8])
+                    if key in existing:
+                        continue
+                    existing.add(key)  # Duplikate innerhalb des Batches ebenfalls überspringen
+                    to_insert.append(r)
+                if to_insert:
+                    con.executemany(
+                        """
+                        INSERT INTO market_snapshots
+                        (asset_symbol, price, market_cap, volume_24h, change_1h, change_24h, change_7d, observed_at, source)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        to_insert,
+                    )
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
+        inserted = len(to_insert)
+        return inserted, len(rows) - inserted
 
     # -------- Candles (daily) --------
     def upsert_candles(self, candles: Sequence[DailyCandle]) -> Tuple[int, int]:
@@ -92,80 +121,107 @@ class DuckDBMarketRepository(MarketRepositoryPort):
         updated = 0
         with self._connect() as con:
             self._ensure_table(con, "market_history")
-            for c in candles:
-                exists = con.execute(
-                    """
-                    SELECT 1 FROM market_history
-                    WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date=?
-                    """,
-                    [c.asset_symbol, c.provider, c.vs_currency, c.day],
-                ).fetchone()
-                if exists:
-                    con.execute(
+            con.begin()  # ein Commit/WAL-Flush für den ganzen Batch
+            try:
+                for c in candles:
+                    exists = con.execute(
                         """
-                        UPDATE market_history
-                        SET open=COALESCE(?, open),
-                            high=COALESCE(?, high),
-                            low=COALESCE(?, low),
-                            close=COALESCE(?, close),
-                            market_cap=COALESCE(?, market_cap),
-                            volume=COALESCE(?, volume),
-                            source=COALESCE(?, source),
-                            updated_at=CURRENT_TIMESTAMP
+                        SELECT 1 FROM market_history
                         WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date=?
                         """,
-                        [
-                            c.open,
-                            c.high,
-                            c.low,
-                            c.close,
-                            c.market_cap,
-                            c.volume,
-                            c.source,
-                            c.asset_symbol,
-                            c.provider,
-                            c.vs_currency,
-                            c.day,
-                        ],
-                    )
-                    updated += 1
-                else:
-                    con.execute(
-                        """
-                        INSERT INTO market_history
-                        (asset_symbol, provider, provider_id, vs_currency, date,
-                         open, high, low, close, market_cap, volume, source, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                        """,
-                        [
-                            c.asset_symbol,
-                            c.provider,
-                            c.provider_id,
-                            c.vs_currency,
-                            c.day,
-                            c.open,
-                            c.high,
-                            c.low,
-                            c.close,
-                            c.market_cap,
-                            c.volume,
-                            c.source,
-                        ],
-                    )
-                    inserted += 1
+                        [c.asset_symbol, c.provider, c.vs_currency, c.day],
+                    ).fetchone()
+                    if exists:
+                        con.execute(
+                            """
+                            UPDATE market_history
+                            SET open=COALESCE(?, open),
+                                high=COALESCE(?, high),
+                                low=COALESCE(?, low),
+                                close=COALESCE(?, close),
+                                market_cap=COALESCE(?, market_cap),
+                                volume=COALESCE(?, volume),
+                                source=COALESCE(?, source),
+                                updated_at=CURRENT_TIMESTAMP
+                            WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date=?
+                            """,
+                            [
+                                c.open,
+                                c.high,
+                                c.low,
+                                c.close,
+                                c.market_cap,
+                                c.volume,
+                                c.source,
+                                c.asset_symbol,
+                                c.provider,
+                                c.vs_currency,
+                                c.day,
+                            ],
+                        )
+                        updated += 1
+                    else:
+                        con.execute(
+                            """
+                            INSERT INTO market_history
+                            (asset_symbol, provider, provider_id, vs_currency, date,
+                             open, high, low, close, market_cap, volume, source, created_at, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                            """,
+                            [
+                                c.asset_symbol,
+                                c.provider,
+                                c.provider_id,
+                                c.vs_currency,
+                                c.day,
+                                c.open,
+                                c.high,
+                                c.low,
+                                c.close,
+                                c.market_cap,
+                                c.volume,
+                                c.source,
+                            ],
+                        )
+                        inserted += 1
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
         return inserted, updated
 
     def last_stored_day(self, asset_symbol: str, provider: str, vs_currency: str) -> Optional[date]:
+        return self.last_stored_days([asset_symbol], provider, vs_currency).get(asset_symbol)
+
+    def last_stored_days(
+            self, asset_symbols: List[str], provider: str, vs_currency: str
+    ) -> Dict[str, Optional[date]]:
+        """Batch-Variante: {asset_symbol -> max(date)} in einem Roundtrip; fehlende Symbole → None."""
+        if not asset_symbols:
+            return {}
         with self._connect() as con:
             self._ensure_table(con, "market_history")
-            row = con.execute(
+            rows = con.execute(
                 """
-                SELECT max(date) FROM market_history
-                WHERE asset_symbol=? AND provider=? AND vs_currency=?
+                SELECT asset_symbol, max(date)
+                FROM market_history
+                WHERE provider=? AND vs_currency=?
+                  AND asset_symbol IN (SELECT * FROM UNNEST(?))
+                GROUP BY asset_symbol
                 """,
-                [asset_symbol, provider, vs_currency],
-            ).fetchone()
-            return row[0] if row and row[0] is not None else None
+                [provider, vs_currency, list(asset_symbols)],
+            ).fetchall()
+        out: Dict[str, Optional[date]] = dict.fromkeys(asset_symbols)
+        out.update(rows)
+        return out
+
+    _FETCH_RANGE_SQL = """
+        SELECT asset_symbol, provider, provider_id, vs_currency, date,
+            open, high, low, close, market_cap, volume, source
+        FROM market_history
+        WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date BETWEEN ? AND ?
+        ORDER BY date ASC
+    """
 
     def fetch_range(
             self, asset_symbol: str, provider: str, vs_currency: str, start: date, end: date
@@ -173,62 +229,76 @@ class DuckDBMarketRepository(MarketRepositoryPort):
         with self._connect() as con:
             self._ensure_table(con, "market_history")
             rows = con.execute(
-                """
-                SELECT asset_symbol, provider, provider_id, vs_currency, date,
-                    open, high, low, close, market_cap, volume, source
-                FROM market_history
-                WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date BETWEEN ? AND ?
-                ORDER BY date ASC
-                """,
+                self._FETCH_RANGE_SQL,
                 [asset_symbol, provider, vs_currency, start, end],
             ).fetchall()
-        return [
-            DailyCandle(
-                asset_symbol=r[0],
-                provider=r[1],
-                provider_id=r[2],
-                vs_currency=r[3],
-                day=r[4],
-                open=r[5],
-                high=r[6],
-                low=r[7],
-                close=r[8],
-                market_cap=r[9],
-                volume=r[10],
-                source=r[11],
-            )
-            for r in rows
-        ]
+        # Spaltenreihenfolge == Feldreihenfolge von DailyCandle → positionale Konstruktion
+        return [DailyCandle(*r) for r in rows]
 
-    def get_provider_id(self, asset_symbol: str, provider: str) -> Optional[str]:
+    def fetch_range_arrow(
+            self, asset_symbol: str, provider: str, vs_currency: str, start: date, end: date
+    ) -> Any:
+        """
+        Wie fetch_range(), liefert aber eine pyarrow.Table (spaltenorientiert, ohne
+        Python-Objekte pro Zeile). Für vektorisierte Konsumenten; benötigt pyarrow.
+        """
         with self._connect() as con:
-            self._ensure_table(con, "asset_providers")
+            self._ensure_table(con, "market_history")
+            return con.execute(
+                self._FETCH_RANGE_SQL,
+                [asset_symbol, provider, vs_currency, start, end],
+            ).fetch_arrow_table()
+
+    def range_summary(
+            self, asset_symbol: str, provider: str, vs_currency: str, start: date, end: date
+    ) -> Tuple[int, Optional[float], Optional[float]]:
+        """(Anzahl Tage, erster Close, letzter Close) im Zeitraum – aggregiert in SQL statt Candles zu laden."""
+        with self._connect() as con:
+            self._ensure_table(con, "market_history")
             row = con.execute(
                 """
-                SELECT provider_id FROM asset_providers
-                WHERE asset_symbol=? AND provider=?
+                SELECT count(*), first(close ORDER BY date), last(close ORDER BY date)
+                FROM market_history
+                WHERE asset_symbol=? AND provider=? AND vs_currency=? AND date BETWEEN ? AND ?
                 """,
-                [asset_symbol, provider],
+                [asset_symbol, provider, vs_currency, start, end],
             ).fetchone()
-            return row[0] if row else None
+        return (int(row[0]), row[1], row[2]) if row else (0, None, None)
+
+    def get_provider_id(self, asset_symbol: str, provider: str) -> Optional[str]:
+        return self.get_provider_ids([asset_symbol], provider).get(asset_symbol)
+
+    def get_provider_ids(self, asset_symbols: List[str], provider: str) -> Dict[str, Optional[str]]:
+        """Batch-Variante: {asset_symbol -> provider_id} in einem Roundtrip; fehlende Symbole → None."""
+        if not asset_symbols:
+            return {}
+        out: Dict[str, Optional[str]] = dict.fromkeys(asset_symbols)
+        out.update(self.list_provider_pairs(provider, list(asset_symbols)))
+        return out
 
     def upsert_asset_provider(self, asset_symbol: str, provider: str, provider_id: str) -> None:
+        self.upsert_asset_providers_bulk([(asset_symbol, provider, provider_id)])
+
+    def upsert_asset_providers_bulk(self, rows: Sequence[Tuple[str, str, str]]) -> None:
+        """
+        Upsert vieler (asset_symbol, provider, provider_id) in einem Statement
+        (multi-row VALUES + ON CONFLICT) statt INSERT/UPDATE pro Symbol.
+        """
+        # Letzter Eintrag pro Schlüssel gewinnt; doppelte Keys im selben Statement wären ein Conflict-Fehler
+        dedup = {(sym, prov): pid for sym, prov, pid in rows}
+        if not dedup:
+            return
+        values = ", ".join(["(?, ?, ?)"] * len(dedup))
+        params = [v for (sym, prov), pid in dedup.items() for v in (sym, prov, pid)]
         with self._connect() as con:
             self._ensure_table(con, "asset_providers")
             con.execute(
-                """
-                INSERT OR IGNORE INTO asset_providers (asset_symbol, provider, provider_id)
-                VALUES (?, ?, ?)
-                """,
-                [asset_symbol, provider, provider_id],
-            )
-            con.execute(
-                """
-                UPDATE asset_providers
-                SET provider_id=?
-                WHERE asset_symbol=? AND provider=?
+                f"""
+                INSERT INTO asset_providers (asset_symbol, provider, provider_id)
+                VALUES {values}
+                ON CONFLICT (asset_symbol, provider) DO UPDATE SET provider_id = excluded.provider_id
                 """,
-                [provider_id, asset_symbol, provider],
+                params,
             )
 
     def list_provider_pairs(self, provider: str, asset_symbols: List[str]) -> List[Tuple[str, str]]:
@@ -263,7 +333,7 @@ class DuckDBMarketRepository(MarketRepositoryPort):
                 """,
                 [asset_symbol, start, end],
             ).fetchall()
-        return [(r[0], r[1]) for r in rows]
+        return rows
 
     def fetch_daily_sentiment(self, asset_symbol: str, start: date, end: date) -> Dict[date, Optional[float]]:
         with self._connect() as con:
@@ -276,7 +346,7 @@ class DuckDBMarketRepository(MarketRepositoryPort):
                 """,
                 [asset_symbol, start, end],
             ).fetchall()
-        return {r[0]: r[1] for r in rows}
+        return dict(rows)
 
     def fetch_daily_sentiment_stats(self, asset_symbol: str, start: date, end: date) -> Dict[date, int]:
         with self._connect() as con:
@@ -298,85 +368,148 @@ class DuckDBMarketRepository(MarketRepositoryPort):
         updated = 0
         with self._connect() as con:
             self._ensure_table(con, "market_factors_daily")
-            for row in rows:
-                asset_symbol = _get("asset_symbol", row)
-                day = _get("date", row) or _get("day", row)
-                ret_1d = _get("ret_1d", row)
-                vol_30d = _get("vol_30d", row)
-                sharpe_30d = _get("sharpe_30d", row)
-                exp_return_30d = _get("exp_return_30d", row)
-                sentiment_mean = _get("sentiment_mean", row)
-                sentiment_norm = _get("sentiment_norm", row)
-                p_alpha = _get("p_alpha", row)
-                alpha = _get("alpha", row)
-                sortino_30d = _get("sortino_30d", row)
-                var_1d_95 = _get("var_1d_95", row)
-
-                exists = con.execute(
-                    "SELECT 1 FROM market_factors_daily WHERE asset_symbol=? AND date=?",
-                    [asset_symbol, day],
-                ).fetchone()
-                if exists:
-                    con.execute(
-                        """
-                        UPDATE market_factors_daily
-                        SET ret_1d=?,
-                            vol_30d=?,
-                            sharpe_30d=?,
-                            exp_return_30d=?,
-                            sentiment_mean=?,
-                            sentiment_norm=?,
-                            p_alpha=?,
-                            alpha=?,
-                            sortino_30d=?,
-                            var_1d_95=?,
-                            updated_at=CURRENT_TIMESTAMP
-                        WHERE asset_symbol=? AND date=?
-                        """,
-                        [
-                            ret_1d,
-                            vol_30d,
-                            sharpe_30d,
-                            exp_return_30d,
-                            sentiment_mean,
-                            sentiment_norm,
-                            p_alpha,
-                            alpha,
-                            sortino_30d,
-                            var_1d_95,
-                            asset_symbol,
-                            day,
-                        ],
-                    )
-                    updated += 1
-                else:
-                    con.execute(
-                        """
-                        INSERT INTO market_factors_daily
-                        (asset_symbol, date,
-                         ret_1d, vol_30d, sharpe_30d, exp_return_30d,
-                         sentiment_mean, sentiment_norm,
-                         p_alpha, alpha, sortino_30d, var_1d_95,
-                         created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                        """,
-                        [
-                            asset_symbol,
-                            day,
-                            ret_1d,
-                            vol_30d,
-                            sharpe_30d,
-                            exp_return_30d,
-                            sentiment_mean,
-                            sentiment_norm,
-                            p_alpha,
-                            alpha,
-                            sortino_30d,
-                            var_1d_95,
-                        ],
-                    )
-                    inserted += 1
+            con.begin()  # ein Commit/WAL-Flush für den ganzen Batch
+            try:
+                for row in rows:
+                    asset_symbol = _get("asset_symbol", row)
+                    day = _get("date", row) or _get("day", row)
+                    ret_1d = _get("ret_1d", row)
+                    vol_30d = _get("vol_30d", row)
+                    sharpe_30d = _get("sharpe_30d", row)
+                    exp_return_30d = _get("exp_return_30d", row)
+                    sentiment_mean = _get("sentiment_mean", row)
+                    sentiment_norm = _get("sentiment_norm", row)
+                    p_alpha = _get("p_alpha", row)
+                    alpha = _get("alpha", row)
+                    sortino_30d = _get("sortino_30d", row)
+                    var_1d_95 = _get("var_1d_95", row)
+
+                    exists = con.execute(
+                        "SELECT 1 FROM market_factors_daily WHERE asset_symbol=? AND date=?",
+                        [asset_symbol, day],
+                    ).fetchone()
+                    if exists:
+                        con.execute(
+                            """
+                            UPDATE market_factors_daily
+                            SET ret_1d=?,
+                                vol_30d=?,
+                                sharpe_30d=?,
+                                exp_return_30d=?,
+                                sentiment_mean=?,
+                                sentiment_norm=?,
+                                p_alpha=?,
+                                alpha=?,
+                                sortino_30d=?,
+                                var_1d_95=?,
+                                updated_at=CURRENT_TIMESTAMP
+                            WHERE asset_symbol=? AND date=?
+                            """,
+                            [
+                                ret_1d,
+                                vol_30d,
+                                sharpe_30d,
+                                exp_return_30d,
+                                sentiment_mean,
+                                sentiment_norm,
+                                p_alpha,
+                                alpha,
+                                sortino_30d,
+                                var_1d_95,
+                                asset_symbol,
+                                day,
+                            ],
+                        )
+                        updated += 1
+                    else:
+                        con.execute(
+                            """
+                            INSERT INTO market_factors_daily
+                            (asset_symbol, date,
+                             ret_1d, vol_30d, sharpe_30d, exp_return_30d,
+                             sentiment_mean, sentiment_norm,
+                             p_alpha, alpha, sortino_30d, var_1d_95,
+                             created_at, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                            """,
+                            [
+                                asset_symbol,
+                                day,
+                                ret_1d,
+                                vol_30d,
+                                sharpe_30d,
+                                exp_return_30d,
+                                sentiment_mean,
+                                sentiment_norm,
+                                p_alpha,
+                                alpha,
+                                sortino_30d,
+                                var_1d_95,
+                            ],
+                        )
+                        inserted += 1
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
         return inserted, updated
 
     def upsert_factors(self, rows: List[object]) -> tuple[int, int]:
-        return self.upsert_market_factors(rows)
\ No newline at end of file
+        return self.upsert_market_factors(rows)
+
+    _FACTOR_EXPORT_COLUMNS = (
+        "asset_symbol",
+        "day",
+        "ret_1d",
+        "vol_30d",
+        "sharpe_30d",
+        "sortino_30d",
+        "var_1d_95",
+        "exp_return_30d",
+        "sentiment_mean",
+        "sentiment_norm",
+        "p_alpha",
+        "alpha",
+    )
+    _FACTOR_EXPORT_TYPES = {"asset_symbol": "TEXT", "day": "DATE"}  # Rest: DOUBLE
+
+    def export_market_factors_csv(
+            self,
+            path: str,
+            asset_symbol: str,
+            start: date,
+            end: date,
+            rows: Optional[Sequence[object]] = None,
+    ) -> None:
+        """
+        CSV-Export via DuckDB COPY ... TO (engine-seitig, kein Python-Writer pro Zeile).
+        Ohne rows: liest persistierte market_factors_daily; mit rows (z. B. --dry-run):
+        übergibt die Zeilen spaltenweise als Listen und exportiert sie ohne Zwischentabelle.
+        """
+        persisted_cols = ", ".join("date AS day" if c == "day" else c for c in self._FACTOR_EXPORT_COLUMNS)
+        target = "'" + str(path).replace("'", "''") + "'"  # COPY TO akzeptiert keinen Parameter als Ziel
+        with self._connect() as con:
+            if rows is None:
+                self._ensure_table(con, "market_factors_daily")
+                con.execute(
+                    f"""
+                    COPY (
+                        SELECT {persisted_cols}
+                        FROM market_factors_daily
+                        WHERE asset_symbol=? AND date BETWEEN ? AND ?
+                        ORDER BY date
+                    ) TO {target} (HEADER, FORMAT CSV)
+                    """,
+                    [asset_symbol, start, end],
+                )
+                return
+            # Spaltenweise als Listen-Parameter übergeben (ein Statement, UNNEST baut die Zeilen in DuckDB)
+            columns = [
+                [(_get("date", r) or _get("day", r)) if c == "day" else _get(c, r) for r in rows]
+                for c in self._FACTOR_EXPORT_COLUMNS
+            ]
+            select = ", ".join(
+                f"UNNEST(?::{self._FACTOR_EXPORT_TYPES.get(c, 'DOUBLE')}[]) AS {c}"
+                for c in self._FACTOR_EXPORT_COLUMNS
+            )
+            con.execute(f"COPY (SELECT {select}) TO {target} (HEADER, FORMAT CSV)", columns)
@@ -2,22 +2,19 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
+import sys
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
-import duckdb
-
-from com.lingenhag.rrp.platform.config.settings import Settings
-from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
-from com.lingenhag.rrp.platform.persistence.migrator import apply_migrations
-from com.lingenhag.rrp.features.market.application.usecases.ingest_spot import IngestSpot
-from com.lingenhag.rrp.features.market.application.usecases.ingest_history_range import IngestHistoryRange
-from com.lingenhag.rrp.features.market.application.usecases.compute_market_factors import ComputeMarketFactors
-from com.lingenhag.rrp.features.market.application.usecases.dashboard_queries import DashboardQueries
-from com.lingenhag.rrp.features.market.application.ports import MarketDataPort, MarketRepositoryPort
+# Schwere Abhängigkeiten (duckdb, Migrator, Use-Cases) werden erst im jeweiligen Kommando
+# importiert → `rrp market ... --help` bleibt schnell.
+if TYPE_CHECKING:
+    from com.lingenhag.rrp.platform.config.settings import Settings
+    from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
+    from com.lingenhag.rrp.features.market.application.ports import MarketDataPort, MarketRepositoryPort
 
 
 def add_market_subparser(root_subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -35,6 +32,15 @@ def add_market_subparser(root_subparsers: argparse._SubParsersAction[argparse.Ar
         help="Path to DuckDB (Default aus config.yaml: database.default_path oder 'data/rrp.duckdb')",
     )
     p_spot.add_argument("--auto-migrate", action="store_true", help="Apply migrations if schema is missing")
+    p_spot.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help=(
+            "Parallel provider requests of 250 ids each; only takes effect above 250 provider ids, "
+            "smaller lists are fetched in a single request (default: 4)"
+        ),
+    )
     p_spot.set_defaults(func=_cmd_ingest_spot)
 
     # History ingest
@@ -82,6 +88,7 @@ def add_market_subparser(root_subparsers: argparse._SubParsersAction[argparse.Ar
     p_over.add_argument("--end", required=True, help="ISO end date (YYYY-MM-DD)")
     p_over.add_argument("--vs", default="usd", help="Currency (default: usd) — aligns with stored candles")
     p_over.add_argument("--format", choices=["table", "json"], default="table", help="Output format")
+    p_over.add_argument("--pretty", action="store_true", help="Indent JSON output (default: compact single line)")
     p_over.add_argument(
         "--db",
         help="Path to DuckDB (Default aus config.yaml: database.default_path oder 'data/rrp.duckdb')",
@@ -92,50 +99,54 @@ def add_market_subparser(root_subparsers: argparse._SubParsersAction[argparse.Ar
 
 def _parse_iso(value: str) -> datetime:
     try:
-        v = value.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(v)
+        try:
+            dt = datetime.fromisoformat(value)  # ab 3.11 inkl. "Z" – ohne String-Kopie
+        except ValueError:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+            return dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
     except ValueError as e:
         raise SystemExit(f"Ungültiges Datumsformat: {value}") from e
 
 
-def _build_time_range(days: int, from_ts: Optional[int], to_ts: Optional[int]) -> tuple[datetime, datetime]:
-    if from_ts is not None and to_ts is not None:
-        if from_ts >= to_ts:
-            raise SystemExit("--from-ts muss kleiner als --to-ts sein")
-        start = datetime.fromtimestamp(from_ts, tz=timezone.utc)
-        end = datetime.fromtimestamp(to_ts, tz=timezone.utc)
-        return start, end
-    if from_ts or to_ts:
+def _build_time_range(days: int, from_ts: Optional[int], to_ts: Optional[int]) -> tuple[int, int]:
+    """Liefert (from_ts, to_ts) als Unix-Sekunden; explizite Timestamps werden unverändert durchgereicht."""
+    if from_ts is None and to_ts is None:
+        if days < 1:
+            raise SystemExit("--days muss positiv sein")
+        now_ts = int(time.time())
+        return now_ts - days * 86400, now_ts
+    if from_ts is None or to_ts is None:
         raise SystemExit("Bitte beide angeben (--from-ts und --to-ts) oder keins")
-    if days < 1:
-        raise SystemExit("--days muss positiv sein")
-    now = datetime.now(timezone.utc)
-    return now - timedelta(days=days), now
+    if from_ts >= to_ts:
+        raise SystemExit("--from-ts muss kleiner als --to-ts sein")
+    return from_ts, to_ts
+
+
+_MIGRATIONS_PATH = Path("src/com/lingenhag/rrp/platform/persistence/migrations")
+
+# Prozess-Cache: bereits verifizierte DB-Pfade (absolut) überspringen den Check komplett
+_SCHEMA_OK: set[str] = set()
 
 
 def _ensure_schema(db_path: str, auto_migrate: bool) -> None:
     if not auto_migrate:
         return
+    key = str(Path(db_path).resolve())
+    if key in _SCHEMA_OK:
+        return
+    import duckdb
+
+    from com.lingenhag.rrp.platform.persistence.migrator import apply_migrations, pending_migrations
+
     try:
-        with duckdb.connect(db_path) as con:
-            tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
-        required = {
-            "assets",
-            "asset_providers",
-            "market_history",
-            "market_snapshots",
-            "summarized_articles",
-            "llm_votes",
-            "rejections",
-        }
-        if not required.issubset(tables):
-            migrations_path = Path("src/com/lingenhag/rrp/platform/persistence/migrations")
-            applied = apply_migrations(db_path, str(migrations_path))
+        # Single-Source-of-Truth ist die migrations-Tabelle (statt SHOW TABLES + Tabellen-Heuristik)
+        if pending_migrations(db_path, str(_MIGRATIONS_PATH)):
+            applied = apply_migrations(db_path, str(_MIGRATIONS_PATH))
             if not applied:
                 print("[migrations] Keine Migrationen angewendet (vermutlich bereits aktuell).")
+        _SCHEMA_OK.add(key)
     except duckdb.IOException as e:
         raise SystemExit(f"Database error: {e}") from e
 
@@ -148,16 +159,19 @@ def _cmd_ingest_spot(
         repo: MarketRepositoryPort,
 ) -> None:
     _ensure_schema(args.db, args.auto_migrate)
-    assets: List[str] = [a.upper() for a in args.asset]
+    assets: List[str] = list(dict.fromkeys(a.upper() for a in args.asset))
     pairs = repo.list_provider_pairs(provider=args.provider, asset_symbols=assets)
     known = {sym for sym, _ in pairs}
-    for sym in assets:
-        if sym not in known:
-            pid = args.provider_id if len(assets) == 1 and args.provider_id else sym.lower()
-            repo.upsert_asset_provider(asset_symbol=sym, provider=args.provider, provider_id=pid)
-            pairs.append((sym, pid))
+    missing = [sym for sym in assets if sym not in known]
+    if missing:
+        single_pid = args.provider_id if len(assets) == 1 and args.provider_id else None
+        repo.upsert_asset_providers_bulk([(sym, args.provider, single_pid or sym.lower()) for sym in missing])
+        # Source-of-Truth bleibt SQL: Paare nach dem Bulk-Upsert einmal neu lesen
+        pairs = repo.list_provider_pairs(provider=args.provider, asset_symbols=assets)
+    from com.lingenhag.rrp.features.market.application.usecases.ingest_spot import IngestSpot
+
     svc = IngestSpot(repo=repo, source=source)
-    res = svc.execute(assets=pairs, vs_currency=args.vs)
+    res = svc.execute_parallel(assets=pairs, vs_currency=args.vs, workers=int(args.workers))
     print(
         f"[market-spot] assets={pairs} requested={res.requested} "
         f"fetched={res.fetched} saved={res.saved} duplicates={res.duplicates}"
@@ -173,14 +187,16 @@ def _cmd_ingest_history(
 ) -> None:
     _ensure_schema(args.db, args.auto_migrate)
     asset_sym = args.asset.upper()
-    start, end = _build_time_range(args.days, args.from_ts, args.to_ts)
+    from_ts, to_ts = _build_time_range(args.days, args.from_ts, args.to_ts)
     provider_id = args.provider_id or repo.get_provider_id(asset_symbol=asset_sym, provider=args.provider) or asset_sym.lower()
+    from com.lingenhag.rrp.features.market.application.usecases.ingest_history_range import IngestHistoryRange
+
     svc = IngestHistoryRange(repo=repo, source=source)
     res = svc.execute(
         asset_symbol=asset_sym,
         provider_id=provider_id,
-        from_ts=int(start.timestamp()),
-        to_ts=int(end.timestamp()),
+        from_ts=from_ts,
+        to_ts=to_ts,
         vs_currency=args.vs,
     )
     print(
@@ -211,6 +227,8 @@ def _cmd_compute_factors(
     else:
         end_d = datetime.now(timezone.utc).date()
 
+    from com.lingenhag.rrp.features.market.application.usecases.compute_market_factors import ComputeMarketFactors
+
     svc = ComputeMarketFactors(
         repo=repo,
         window_vol=int(args.window_vol),
@@ -233,40 +251,14 @@ def _cmd_compute_factors(
     )
 
     if args.export:
-        fieldnames = [
-            "asset_symbol",
-            "day",
-            "ret_1d",
-            "vol_30d",
-            "sharpe_30d",
-            "sortino_30d",
-            "var_1d_95",
-            "exp_return_30d",
-            "sentiment_mean",
-            "sentiment_norm",
-            "p_alpha",
-            "alpha",
-        ]
-        with open(args.export, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in result.rows:
-                writer.writerow(
-                    {
-                        "asset_symbol": r.asset_symbol,
-                        "day": r.day.isoformat(),
-                        "ret_1d": r.ret_1d,
-                        "vol_30d": r.vol_30d,
-                        "sharpe_30d": r.sharpe_30d,
-                        "sortino_30d": r.sortino_30d,
-                        "var_1d_95": r.var_1d_95,
-                        "exp_return_30d": r.exp_return_30d,
-                        "sentiment_mean": r.sentiment_mean,
-                        "sentiment_norm": r.sentiment_norm,
-                        "p_alpha": r.p_alpha,
-                        "alpha": r.alpha,
-                    }
-                )
+        # Persistierte Zeilen direkt aus DuckDB exportieren; bei --dry-run die berechneten Zeilen
+        repo.export_market_factors_csv(
+            args.export,
+            asset_symbol=asset,
+            start=start_d,
+            end=end_d,
+            rows=result.rows if args.dry_run else None,
+        )
         print(f"[market-factors] exported CSV → {args.export}")
 
 
@@ -282,14 +274,15 @@ def _cmd_market_overview(
     start_d = _parse_iso(args.start).date()
     end_d = _parse_iso(args.end).date()
 
+    from com.lingenhag.rrp.features.market.application.usecases.dashboard_queries import DashboardQueries
+
     dq = DashboardQueries(repo=repo)
     ov = dq.market_overview(asset_symbol=asset, start=start_d, end=end_d)
 
-    # Zusatzmetriken aus Candles (kein weiterer DB-Zugriff)
-    candles = repo.fetch_range(asset_symbol=asset, provider="CoinGecko", vs_currency=args.vs, start=start_d, end=end_d)
-    n_days = len(candles)
-    first_close = candles[0].close if candles else None
-    last_close = candles[-1].close if candles else None
+    # Zusatzmetriken aggregiert in SQL (keine Candle-Objekte materialisieren)
+    n_days, first_close, last_close = repo.range_summary(
+        asset_symbol=asset, provider="CoinGecko", vs_currency=args.vs, start=start_d, end=end_d
+    )
     ret_period = ((last_close / first_close) - 1.0) if (first_close and last_close) else None
 
     if args.format == "json":
@@ -303,7 +296,11 @@ def _cmd_market_overview(
             "avg_market_cap": ov.avg_market_cap,
             "return_period": ret_period,
         }
-        print(json.dumps(out, indent=2))
+        if args.pretty:
+            sys.stdout.write(json.dumps(out, indent=2, default=str))
+        else:
+            sys.stdout.write(json.dumps(out, separators=(",", ":"), default=str))
+        sys.stdout.write("\n")
     else:
         print("[market-overview]")
         print(f"  asset         : {ov.asset_symbol}")
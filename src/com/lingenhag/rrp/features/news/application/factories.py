@@ -1,80 +1,92 @@
 # src/com/lingenhag/rrp/features/news/application/factories.py
 from __future__ import annotations
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from com.lingenhag.rrp.platform.config.settings import Settings
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
-from com.lingenhag.rrp.features.news.application.ports import NewsSourcePort
+from com.lingenhag.rrp.features.news.application.ports import FeedCachePort, NewsSourcePort, ResolvedUrlCachePort
 from com.lingenhag.rrp.features.news.infrastructure.gdelt_client import GdeltClient
 from com.lingenhag.rrp.features.news.infrastructure.sources.google_rss_source import GoogleRssNewsSource
 from com.lingenhag.rrp.features.news.infrastructure.google_news_rss_client import GoogleNewsRssClient
 
 class NewsSourceFactory:
-    def __init__(self, config: Settings, metrics: Metrics):
+    def __init__(
+            self,
+            config: Settings,
+            metrics: Metrics,
+            url_cache: Optional[ResolvedUrlCachePort] = None,
+            feed_cache: Optional[FeedCachePort] = None,
+    ):
         self.config = config
         self.metrics = metrics
+        self.url_cache = url_cache
+        self.feed_cache = feed_cache
+        # Kontext-Policy ändert sich innerhalb eines Prozesses nicht → einmal lesen
+        self._context_policy: Optional[tuple[Set[str], Set[str]]] = None
 
     def _read_context_policy(self) -> tuple[Set[str], Set[str]]:
-        majors = set(self.config.get("news_query", "major_assets_without_context", []) or [])
-        enforce = set(self.config.get("news_query", "enforce_context_assets", []) or [])
-        majors = {s.upper() for s in majors}
-        enforce = {s.upper() for s in enforce}
-        return majors, enforce
+        if self._context_policy is None:
+            nq = self.config.section("news_query")
+            majors = {s.upper() for s in nq.get("major_assets_without_context") or []}
+            enforce = {s.upper() for s in nq.get("enforce_context_assets") or []}
+            self._context_policy = (majors, enforce)
+        return self._context_policy
 
-    def create_sources(self, source: str, rss_workers: int) -> List[NewsSourcePort]:
-        sources: List[NewsSourcePort] = []
-        gdelt_enabled = self.config.get("gdelt", "enabled", True)
-        google_news_enabled = self.config.get("google_news", "enabled", True)
+    @staticmethod
+    def build_query_cores(asset_symbol: str, sources: List[NewsSourcePort]) -> Dict[str, str]:
+        """
+        Query-Kerne (ohne Datum) einmal pro Harvest-Lauf, je Quelle genau die Query,
+        die sie sonst selbst bauen würde.
+        """
+        return {src.SOURCE_NAME: src.build_query_core(asset_symbol) for src in sources}
+
+    def _build_gdelt(self, gd: Dict[str, Any]) -> NewsSourcePort:
+        majors, enforce = self._read_context_policy()
+        return GdeltClient(
+            timeout=gd.get("timeout", 30),
+            max_retries=gd.get("max_retries", 3),
+            metrics=self.metrics,
+            major_assets_without_context=majors,
+            enforce_context_assets=enforce,
+            max_workers=gd.get("max_workers", 4),
+        )
 
+    def _build_google_rss(self, gn: Dict[str, Any], rss_workers: int) -> NewsSourcePort:
         majors, enforce = self._read_context_policy()
+        return GoogleRssNewsSource(
+            client=GoogleNewsRssClient(
+                hl=gn.get("hl", "en-US"),
+                gl=gn.get("gl", "US"),
+                ceid=gn.get("ceid", "US:en"),
+                timeout=gn.get("timeout", 60),
+                resolve_redirects=gn.get("resolve_redirects", True),
+                max_workers=int(rss_workers),
+                metrics=self.metrics,
+                major_assets_without_context=majors,
+                enforce_context_assets=enforce,
+                url_cache=self.url_cache,
+                feed_cache=self.feed_cache,
+            )
+        )
+
+    def create_sources(self, source: str, rss_workers: int) -> List[NewsSourcePort]:
+        sources: List[NewsSourcePort] = []
+        gd = self.config.section("gdelt")
+        gn = self.config.section("google_news")
+        gdelt_enabled = gd.get("enabled", True)
+        google_news_enabled = gn.get("enabled", True)
 
         if source == "all":
             if gdelt_enabled:
-                sources.append(GdeltClient(
-                    timeout=self.config.get("gdelt", "timeout", 30),
-                    max_retries=self.config.get("gdelt", "max_retries", 3),
-                    metrics=self.metrics,
-                    major_assets_without_context=majors,
-                    enforce_context_assets=enforce,
-                ))
+                sources.append(self._build_gdelt(gd))
             if google_news_enabled:
-                sources.append(GoogleRssNewsSource(
-                    client=GoogleNewsRssClient(
-                        hl=self.config.get("google_news", "hl", "en-US"),
-                        gl=self.config.get("google_news", "gl", "US"),
-                        ceid=self.config.get("google_news", "ceid", "US:en"),
-                        timeout=self.config.get("google_news", "timeout", 60),
-                        resolve_redirects=self.config.get("google_news", "resolve_redirects", True),
-                        max_workers=int(rss_workers),
-                        metrics=self.metrics,
-                        major_assets_without_context=majors,
-                        enforce_context_assets=enforce,
-                    )
-                ))
+                sources.append(self._build_google_rss(gn, rss_workers))
         elif source == "gdelt" and gdelt_enabled:
-            sources.append(GdeltClient(
-                timeout=self.config.get("gdelt", "timeout", 30),
-                max_retries=self.config.get("gdelt", "max_retries", 3),
-                metrics=self.metrics,
-                major_assets_without_context=majors,
-                enforce_context_assets=enforce,
-            ))
+            sources.append(self._build_gdelt(gd))
         elif source in ("rss", "google_rss") and google_news_enabled:
-            sources.append(GoogleRssNewsSource(
-                client=GoogleNewsRssClient(
-                    hl=self.config.get("google_news", "hl", "en-US"),
-                    gl=self.config.get("google_news", "gl", "US"),
-                    ceid=self.config.get("google_news", "ceid", "US:en"),
-                    timeout=self.config.get("google_news", "timeout", 60),
-                    resolve_redirects=self.config.get("google_news", "resolve_redirects", True),
-                    max_workers=int(rss_workers),
-                    metrics=self.metrics,
-                    major_assets_without_context=majors,
-                    enforce_context_assets=enforce,
-                )
-            ))
+            sources.append(self._build_google_rss(gn, rss_workers))
         else:
             valid = ", ".join(("all", "gdelt", "google_rss", "rss"))
             raise SystemExit(f"Ungültige News-Quelle '{source}'. Erlaubt: {valid}")
 
-        return sources
\ No newline at end of file
+        return sources
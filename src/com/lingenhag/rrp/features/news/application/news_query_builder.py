@@ -2,19 +2,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
+
+# search_query hat keine Abhängigkeiten zurück in den Application-Layer → Import auf Modulebene
+# (statt pro build_*-Aufruf) ist zyklenfrei.
+from com.lingenhag.rrp.features.news.infrastructure.search_query import (
+    QuerySpec,
+    build_boolean_core,
+    build_gdelt_query,
+)
 
 from .ports_asset_registry import AssetRegistryPort
 
 
 def _uniq_norm(values: Sequence[str]) -> List[str]:
-    seen = set()
+    seen: set[str] = set()
     out: List[str] = []
     for v in values:
-        t = (v or "").strip()
+        t = v.strip() if v else ""
         if not t:
             continue
-        key = t.lower()
+        key = t.casefold()
         if key in seen:
             continue
         seen.add(key)
@@ -24,7 +32,15 @@ def _uniq_norm(values: Sequence[str]) -> List[str]:
 
 # Single-Word-Eigennamen, die wir bewusst quoten, um Tests zu erfüllen und
 # die Semantik stabil zu halten (Google/GDELT tolerieren überflüssige Quotes).
-_PROPER_SINGLE_WORDS = {s.lower() for s in ("Bitcoin", "Ethereum", "Polkadot", "Solana")}
+_PROPER_SINGLE_WORDS = frozenset({"bitcoin", "ethereum", "polkadot", "solana"})
+
+# harte Synonyme für Top-Assets (konservativ; als „Proper“ gequotet)
+_HARD_SYNONYMS = {"BTC": "Bitcoin", "ETH": "Ethereum", "DOT": "Polkadot", "SOL": "Solana"}
+
+
+def _norm_symbol(asset_symbol: str) -> str:
+    """Einheitliche Symbol-Normalisierung (einmal am Eingang; Cache-Keys & Registry nutzen dieselbe Form)."""
+    return (asset_symbol or "").strip().upper()
 
 
 def _quote_if_phrase_or_proper(term: str) -> str:
@@ -37,11 +53,7 @@ def _quote_if_phrase_or_proper(term: str) -> str:
       - kurze Token/Symbole (BTC, SOL) oder generische Wörter.
     """
     t = term.strip()
-    if not t:
-        return ""
-    if " " in t:
-        return f'"{t}"'
-    if t.lower() in _PROPER_SINGLE_WORDS:
+    if t and (" " in t or t.casefold() in _PROPER_SINGLE_WORDS):
         return f'"{t}"'
     return t
 
@@ -89,22 +101,46 @@ class NewsQueryBuilder:
     ) -> None:
         self.registry = asset_registry or AssetRegistryPortNull()
         self.params = params or QueryBuildParams()
+        # Pro-Instanz-Caches: Specs/Strings hängen nur vom Symbol ab (Registry-Lookups einmal pro Symbol)
+        self._spec_cache: Dict[str, QuerySpec] = {}
+        self._core_cache: Dict[str, str] = {}
+        self._gdelt_cache: Dict[str, str] = {}
+
+    def warm(self, asset_symbols: Sequence[str]) -> None:
+        """Baut Specs/Kerne für bekannte Assets vorab (z. B. beim Start), damit Harvest-Läufe nur noch formatieren."""
+        for sym in asset_symbols:
+            self.build_core_boolean(sym)
+            self.build_for_gdelt(sym)
+
+    def clear_cache(self) -> None:
+        """Verwirft gecachte Specs/Queries (z. B. nach Änderungen an Aliases/Negativbegriffen)."""
+        self._spec_cache.clear()
+        self._core_cache.clear()
+        self._gdelt_cache.clear()
 
     # ---------------------------
     # öffentliche API
     # ---------------------------
-    def build_query_spec(self, asset_symbol: str) -> "QuerySpec":
-        """Erzeugt QuerySpec mit Registry-Daten."""
-        # FIX: absolute Imports auf Infrastruktur-Layer
-        from com.lingenhag.rrp.features.news.infrastructure.search_query import QuerySpec
+    def build_query_spec(self, asset_symbol: str) -> QuerySpec:
+        """Erzeugt QuerySpec mit Registry-Daten (pro Symbol gecacht)."""
+        asset_symbol = _norm_symbol(asset_symbol)
+        cached = self._spec_cache.get(asset_symbol)
+        if cached is not None:
+            return cached
         aliases = self.registry.get_aliases(asset_symbol)
         negatives = self.registry.get_negative_terms(asset_symbol)
-        return QuerySpec(
-            asset_symbol=asset_symbol,
-            aliases=aliases,
-            require_crypto_context=self.params.require_crypto_context,
-            negative_terms=negatives,
-        )
+        if not aliases and not negatives:
+            # Ohne Registry-Daten: geteilte Instanz → Treffer im build_boolean_core-Cache über Builder hinweg
+            spec = QuerySpec.canonical(asset_symbol, self.params.require_crypto_context)
+        else:
+            spec = QuerySpec(
+                asset_symbol=asset_symbol,
+                aliases=aliases,
+                require_crypto_context=self.params.require_crypto_context,
+                negative_terms=negatives,
+            )
+        self._spec_cache[asset_symbol] = spec
+        return spec
 
     def build_core_boolean(self, asset_symbol: str) -> str:
         """
@@ -112,51 +148,49 @@ class NewsQueryBuilder:
         Form:
           (POSITIVE) [AND (CRYPTO_CTX)] [NOT (NEGATIVE)]
         """
-        from com.lingenhag.rrp.features.news.infrastructure.search_query import build_boolean_core
-        spec = self.build_query_spec(asset_symbol)
-        return build_boolean_core(spec)
+        asset_symbol = _norm_symbol(asset_symbol)
+        cached = self._core_cache.get(asset_symbol)
+        if cached is None:
+            cached = self._core_cache[asset_symbol] = build_boolean_core(self.build_query_spec(asset_symbol))
+        return cached
 
     def build_for_gdelt(self, asset_symbol: str) -> str:
         """
         Liefert den Query-String für GDELT Doc API (Boolean-Logik kompatibel).
         """
-        from com.lingenhag.rrp.features.news.infrastructure.search_query import build_gdelt_query
-        spec = self.build_query_spec(asset_symbol)
-        return build_gdelt_query(spec)
+        asset_symbol = _norm_symbol(asset_symbol)
+        cached = self._gdelt_cache.get(asset_symbol)
+        if cached is None:
+            cached = self._gdelt_cache[asset_symbol] = build_gdelt_query(self.build_query_spec(asset_symbol))
+        return cached
 
     def build_for_rss(self, asset_symbol: str, start_iso_date: str, end_iso_date: str) -> str:
         """
         Liefert den Query-String für Google News RSS inkl. Datumsfilter.
         """
-        from com.lingenhag.rrp.features.news.infrastructure.search_query import build_google_news_query
-        spec = self.build_query_spec(asset_symbol)
-        return build_google_news_query(spec, start_iso_date=start_iso_date, end_iso_date=end_iso_date)
+        # Gleiche Form wie build_google_news_query, aber auf dem gecachten Kern: pro Aufruf nur der Datums-Suffix
+        return f"{self.build_core_boolean(asset_symbol)} after:{start_iso_date} before:{end_iso_date}"
 
     # ---------------------------
     # intern
     # ---------------------------
     def _positive_terms(self, asset_symbol: str) -> List[str]:
-        sym = (asset_symbol or "").strip()
-        base = [sym, sym.upper(), sym.lower()]
-        # harte Synonyme für Top-Assets (konservativ; als „Proper“ gequotet)
-        if sym.upper() == "BTC":
-            base.append("Bitcoin")
-        elif sym.upper() == "ETH":
-            base.append("Ethereum")
-        elif sym.upper() == "DOT":
-            base.append("Polkadot")
-        elif sym.upper() == "SOL":
-            base.append("Solana")
+        sym = _norm_symbol(asset_symbol)
+        # Upper/Lower-Varianten von sym fallen in _uniq_norm (case-insensitiv) ohnehin weg
+        base = [sym]
+        synonym = _HARD_SYNONYMS.get(sym)
+        if synonym:
+            base.append(synonym)
 
         aliases = list(self.registry.get_aliases(sym))
         return _uniq_norm([*base, *aliases])
 
     def _negative_terms(self, asset_symbol: str) -> List[str]:
-        return _uniq_norm(list(self.registry.get_negative_terms(asset_symbol)))
+        return _uniq_norm(list(self.registry.get_negative_terms(_norm_symbol(asset_symbol))))
 
     @staticmethod
     def _or_block(terms: Sequence[str]) -> str:
-        rendered = [t for t in (_quote_if_phrase_or_proper(x) for x in terms) if t]
+        rendered = list(filter(None, map(_quote_if_phrase_or_proper, terms)))
         if not rendered:
             return ""
         if len(rendered) == 1:
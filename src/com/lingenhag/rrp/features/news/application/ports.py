@@ -2,10 +2,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional, Protocol, Sequence, Dict
+from typing import Any, List, Mapping, Optional, Protocol, Sequence, Dict, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HarvestCriteriaDTO:
     """
     Kapselt die für einen Harvest-Lauf relevanten Parameter.
@@ -14,6 +14,9 @@ class HarvestCriteriaDTO:
     start: datetime
     end: datetime
     limit: int = 100
+    # Optional einmal pro Lauf vorberechnete Query-Kerne (ohne Datum) je SOURCE_NAME; Quellen hängen
+    # nur noch ihre Datums-/API-Teile an. Fehlt der Eintrag -> Quelle baut dieselbe Query selbst.
+    query_cores: Optional[Mapping[str, str]] = None
 
 
 # Hinweis: In der Praxis liefern die Infrastruktur-Adapter rohe Dicts
@@ -22,7 +25,7 @@ class HarvestCriteriaDTO:
 # Der frühere DocumentDTO ist für diese Vielfalt zu starr – wir lassen
 # ihn bewusst als Marker für spätere Typisierung bestehen, nutzen aber
 # im Port Sequenzen von Dicts.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentDTO:  # optional/legacy
     url: str
     title: Optional[str]
@@ -35,12 +38,18 @@ class NewsSourcePort(Protocol):
     Abstrakte Quelle für News-Dokumente (z. B. GDELT, Google RSS).
     Adapter im Infrastruktur-Layer implementieren dieses Protokoll und
     liefern normalisierte Dicts mit mindestens: url, title, source, published_at.
+    Optional können Adapter zusätzlich `iter_documents(criteria)` anbieten, das
+    dieselben Dokumente in Batches (z. B. pro Tag) streamt.
     """
     SOURCE_NAME: str
 
     def fetch_documents(self, criteria: HarvestCriteriaDTO) -> Sequence[Dict[str, Any]]:
         ...
 
+    def build_query_core(self, asset_symbol: str) -> str:
+        """Query ohne Datum, exakt wie fetch_documents sie ohne query_cores bauen würde."""
+        ...
+
 
 class UrlResolverPort(Protocol):
     """
@@ -51,6 +60,40 @@ class UrlResolverPort(Protocol):
         ...
 
 
+class ResolvedUrlCachePort(Protocol):
+    """
+    Persistenter Cache für aufgelöste Redirect-URLs (RSS-Link -> Publisher-URL),
+    damit wiederkehrende Links über Läufe hinweg ohne Netzwerk auskommen.
+    """
+    def get_many(self, links: Sequence[str]) -> Dict[str, str]:
+        """Bekannte Auflösungen für `links` (fehlende Links fehlen im Dict)."""
+        ...
+
+    def put_many(self, pairs: Sequence[tuple[str, str]]) -> None:
+        """Speichert/aktualisiert (rss_link, final_url)-Paare."""
+        ...
+
+
+# Ein Feed-Item ohne Netzwerk-Nacharbeit: (title, link, pubDate, publisher)
+FeedEntry = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class FeedCachePort(Protocol):
+    """
+    Persistenter Conditional-GET-Cache für RSS-Feeds: Validatoren (ETag, Last-Modified)
+    plus alle Items der letzten 200-Antwort, je Feed-URL.
+    """
+    def get(self, feed_url: str) -> Optional[Tuple[Optional[str], Optional[str], List[FeedEntry]]]:
+        """(etag, last_modified, entries) oder None, falls der Feed unbekannt ist."""
+        ...
+
+    def put(
+            self, feed_url: str, etag: Optional[str], last_modified: Optional[str], entries: Sequence[FeedEntry]
+    ) -> None:
+        """Speichert/ersetzt Validatoren und Items eines Feeds."""
+        ...
+
+
 class NewsRepositoryPort(Protocol):
     """
     Persistenz-Schnittstelle für News-Daten (z. B. url_harvests, rejections).
@@ -66,6 +109,29 @@ class NewsRepositoryPort(Protocol):
     ) -> tuple[int, bool]:
         ...
 
+    def filter_existing(self, asset_symbol: str, urls: Sequence[str]) -> set[str]:
+        """
+        Teilmenge von `urls`, die für das Asset bereits bekannt ist (ein Query pro Batch).
+        """
+        ...
+
+    def save_url_harvests_bulk(
+            self,
+            rows: Sequence[tuple[str, str, Optional[str], Optional[datetime], Optional[str]]],
+    ) -> set[str]:
+        """
+        Bulk-Variante von save_url_harvest: Zeilen (url, asset_symbol, source, published_at, title).
+        Liefert die Menge der neu gespeicherten URLs; der Rest sind Duplikate.
+        """
+        ...
+
+    def existing_urls(self, asset_symbol: str, since: Optional[datetime] = None) -> set[str]:
+        """
+        Für das Asset bereits bekannte URLs (geharvestet, verarbeitet oder verworfen);
+        mit `since` nur Einträge ab diesem Zeitpunkt.
+        """
+        ...
+
     def save_rejection(
             self,
             *,
@@ -107,6 +173,12 @@ class DomainPolicyPort(Protocol):
         """
         ...
 
+    def record_harvest_bulk(self, asset_symbol: str, outcomes: Sequence[tuple[str, bool]]) -> None:
+        """
+        Aggregierte Variante von record_harvest für (domain, stored)-Paare eines Laufs.
+        """
+        ...
+
     def record_llm_decision(self, *, asset_symbol: str, domain: str, relevant: bool) -> None:
         """
         LLM-Statistik:
@@ -115,12 +187,19 @@ class DomainPolicyPort(Protocol):
         """
         ...
 
+    def flush(self) -> None:
+        """
+        Schreibt gepufferte Statistik-Zähler in die Datenbank (Ende eines Laufs).
+        """
+        ...
+
 
 __all__ = [
     "HarvestCriteriaDTO",
     "DocumentDTO",
     "NewsSourcePort",
     "UrlResolverPort",
+    "ResolvedUrlCachePort",
     "NewsRepositoryPort",
     "DomainPolicyPort",
 ]
\ No newline at end of file
@@ -1,9 +1,15 @@
 # src/com/lingenhag/rrp/features/news/application/usecases/harvest_urls.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import logging
+import queue
+import re
+import sys
+import threading
 from urllib.parse import urlparse
 
 from com.lingenhag.rrp.domain.models import UrlHarvest, HarvestSummary
@@ -16,8 +22,48 @@ from com.lingenhag.rrp.features.news.application.ports import (
 
 _LOG = logging.getLogger(__name__)
 
+# scheme / host / path (ohne Query/Fragment) für _hostname; userinfo und IPv6 fallen auf urlparse zurück
+_URL_RE = re.compile(r"^(https?)://([^/?#:@\[\]]+)(?::\d+)?(/[^?#]*)?(?:[?#]|$)", re.IGNORECASE)
 
-def pick_fields(doc: Dict, asset_symbol: str) -> UrlHarvest:
+# Keine Artikel: Bild-/Dokument-Endungen (Set -> ein Hash-Lookup, unabhängig von der Anzahl)
+_INVALID_EXTS = frozenset({"jpg", "png", "gif", "pdf"})
+
+# Batch-Größe für save_url_harvests_bulk
+_FLUSH_EVERY = 500
+
+# Max. wartende Dokument-Batches zwischen Quellen-Threads und Verarbeitung (Backpressure)
+_MAX_QUEUED_BATCHES = 8
+
+# Vorab-Set bekannter URLs nur für dieses Zeitfenster laden (Speicher begrenzt);
+# ältere Duplikate fängt filter_existing pro Flush ab.
+_KNOWN_LOOKBACK = timedelta(days=14)
+
+
+# fromisoformat akzeptiert "Z" erst ab Python 3.11
+_ISO_Z_NATIVE = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    ISO-8601 -> UTC-aware datetime; None bei ungültigem Format.
+    Gecacht, da viele Dokumente denselben Zeitstempel tragen.
+    """
+    s = value.strip()
+    if not s[:4].isdigit():
+        return None
+    if not _ISO_Z_NATIVE and s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def pick_fields(doc: Dict, asset_symbol: str, discovered_at: Optional[datetime] = None) -> UrlHarvest:
     url = doc.get("og_url") or doc.get("url") or doc.get("link")
     title = doc.get("title") or doc.get("name")
     source = doc.get("source") or doc.get("source_name")
@@ -27,16 +73,8 @@ def pick_fields(doc: Dict, asset_symbol: str) -> UrlHarvest:
     if isinstance(published, datetime):
         published_at = published.astimezone(timezone.utc)
     elif isinstance(published, str) and published.strip():
-        try:
-            s = published
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            published_at = datetime.fromisoformat(s)
-            if published_at.tzinfo is None:
-                published_at = published_at.replace(tzinfo=timezone.utc)
-            else:
-                published_at = published_at.astimezone(timezone.utc)
-        except ValueError:
+        published_at = _parse_iso(published)
+        if published_at is None:
             _LOG.warning("Invalid published_at format: %s", published)
 
     return UrlHarvest(
@@ -45,7 +83,7 @@ def pick_fields(doc: Dict, asset_symbol: str) -> UrlHarvest:
         source=source,
         published_at=published_at,
         title=title,
-        discovered_at=datetime.now(timezone.utc),
+        discovered_at=discovered_at or datetime.now(timezone.utc),
     )
 
 
@@ -54,13 +92,18 @@ def is_valid_news_url(url: Optional[str]) -> bool:
         return False
     if not url.startswith(("http://", "https://")):
         return False
-    # Query-Teil ignorieren, nur Pfad-Endung prüfen
+    # Query-Teil ignorieren, nur Endung prüfen (Fragment und reine Hosts bewusst inklusive)
     base = url.lower().split("?", 1)[0]
-    invalid_extensions = {".jpg", ".png", ".gif", ".pdf"}
-    return not any(base.endswith(ext) for ext in invalid_extensions)
+    # Alles nach dem letzten Punkt; ohne Punkt der ganze Pfad (nie in der Menge)
+    return base.rpartition(".")[2] not in _INVALID_EXTS
 
 
+@lru_cache(maxsize=8192)
 def _hostname(u: str) -> Optional[str]:
+    m = _URL_RE.match(u)
+    if m is not None:
+        return m.group(2).lower()
+    # Sonderfälle (userinfo, IPv6, ...) -> urlparse
     try:
         host = (urlparse(u).hostname or "").lower()
         return host or None
@@ -118,90 +161,83 @@ class HarvestUrls:
         rejected_invalid = 0
 
         processed = 0  # nur für Progress-Logging
+        now_utc = datetime.now(timezone.utc)  # ein Zeitstempel pro Lauf
 
-        for source in self.sources:
-            try:
-                docs = source.fetch_documents(criteria)
-                total_docs += len(docs)
-                _LOG.debug(
-                    "Fetched %d documents from source %s",
-                    len(docs),
-                    source.SOURCE_NAME,
-                )
-            except Exception:
-                _LOG.exception(
-                    "fetch_documents failed for source=%s",
-                    getattr(source, "SOURCE_NAME", "unknown"),
-                )
-                continue
+        # Validierte Harvests und Domain-Statistik werden gesammelt und gebündelt persistiert.
+        pending: List[Tuple[UrlHarvest, Optional[str]]] = []
+        # Bekannte URLs einmalig laden; Duplikate werden im Speicher erkannt.
+        known = self._known_urls(criteria.asset_symbol, min(criteria.start, now_utc) - _KNOWN_LOOKBACK)
+        outcomes: List[Tuple[str, bool]] = []
+
+        def flush() -> None:
+            nonlocal after_dedupe, saved, skipped_duplicates, rejected_invalid
+            n_saved, n_dup, n_failed, flushed = self._flush(pending)
+            # after_dedupe zählt Eintritt in Dedupe/Persist-Stufe (auch Duplikate)
+            after_dedupe += n_saved + n_dup
+            saved += n_saved
+            skipped_duplicates += n_dup
+            rejected_invalid += n_failed
+            pending.clear()
+            # Domain-Statistik gebündelt verbuchen (pro Quelle bzw. alle _FLUSH_EVERY Dokumente)
+            outcomes.extend(flushed)
+            if has_policy and outcomes:
+                try:
+                    policy.record_harvest_bulk(criteria.asset_symbol, list(outcomes))
+                except Exception:
+                    _LOG.exception("Failed to record harvest stats for %s", criteria.asset_symbol)
+                outcomes.clear()
+
+        # Loop-Invarianten: ohne Policy wird der Host gar nicht erst bestimmt.
+        policy = self.domain_policy
+        has_policy = policy is not None
+        enforce = self.enforce_domain_filter
+        # Hot-Loop: Funktionen/Methoden als Locals binden (LOAD_FAST statt Global-/Attribut-Lookup)
+        asset_symbol = criteria.asset_symbol
+        pick = pick_fields
+        is_valid = is_valid_news_url
+        hostname = _hostname
+        add_outcome = outcomes.append
+        add_pending = pending.append
+        is_known = known.__contains__
+        mark_known = known.add
+
+        # Quellen parallel abrufen (IO-bound); Verarbeitung bleibt single-threaded.
+        for source, docs in self._fetch_all(criteria):
+            total_docs += len(docs)
 
             for doc in docs:
                 processed += 1
                 try:
-                    harvest = pick_fields(doc, criteria.asset_symbol)
-                    host = _hostname(harvest.url or "")
+                    harvest = pick(doc, asset_symbol, discovered_at=now_utc)
+                    host = hostname(harvest.url or "") if has_policy else None
 
                     # Grundvalidierung URL
-                    if not is_valid_news_url(harvest.url):
+                    if not is_valid(harvest.url):
                         rejected_invalid += 1
-                        if self.domain_policy and host:
-                            self.domain_policy.record_harvest(
-                                asset_symbol=harvest.asset_symbol,
-                                domain=host,
-                                stored=False,
-                            )
+                        if host:
+                            add_outcome((host, False))
                         continue
 
                     # Domain-Filter (optional erzwingen)
-                    if self.domain_policy and host:
-                        allowed = self.domain_policy.is_allowed(
-                            harvest.asset_symbol, host
-                        )
-                        if self.enforce_domain_filter and allowed is False:
-                            self.domain_policy.record_harvest(
-                                asset_symbol=harvest.asset_symbol,
-                                domain=host,
-                                stored=False,
-                            )
+                    if has_policy and host:
+                        allowed = policy.is_allowed(asset_symbol, host)
+                        if enforce and allowed is False:
+                            add_outcome((host, False))
                             rejected_invalid += 1
                             continue
 
                     # assembled
                     after_assemble += 1
-
-                    try:
-                        _, is_duplicate = self.repo.save_url_harvest(
-                            url=harvest.url,
-                            asset_symbol=harvest.asset_symbol,
-                            source=harvest.source,
-                            published_at=harvest.published_at,
-                            title=harvest.title,
-                        )
-
-                        # after_dedupe zählt Eintritt in Dedupe/Persist-Stufe (auch Duplikate)
+                    if is_known(harvest.url):
                         after_dedupe += 1
-
-                        stored_now = not is_duplicate
-                        if is_duplicate:
-                            skipped_duplicates += 1
-                        else:
-                            saved += 1
-
-                        if self.domain_policy and host:
-                            self.domain_policy.record_harvest(
-                                asset_symbol=harvest.asset_symbol,
-                                domain=host,
-                                stored=stored_now,
-                            )
-                    except Exception:
-                        _LOG.exception("Failed to save URL %s", harvest.url)
-                        rejected_invalid += 1
-                        if self.domain_policy and host:
-                            self.domain_policy.record_harvest(
-                                asset_symbol=harvest.asset_symbol,
-                                domain=host,
-                                stored=False,
-                            )
+                        skipped_duplicates += 1
+                        if host:
+                            add_outcome((host, False))
+                        continue
+                    mark_known(harvest.url)
+                    add_pending((harvest, host))
+                    if len(pending) >= _FLUSH_EVERY:
+                        flush()
 
                 except Exception:
                     _LOG.exception(
@@ -218,6 +254,8 @@ class HarvestUrls:
                         source.SOURCE_NAME,
                     )
 
+            flush()
+
         if verbose and (progress_every <= 0 or processed % progress_every != 0):
             _LOG.info("Processed %d documents (batch complete)", processed)
 
@@ -230,6 +268,107 @@ class HarvestUrls:
             rejected_invalid=rejected_invalid,
         )
 
+    def _fetch_all(
+            self, criteria: HarvestCriteriaDTO
+    ) -> Iterator[Tuple[NewsSourcePort, List[Dict]]]:
+        """
+        Ruft die Quellen im Thread-Pool ab und liefert (source, docs)-Batches, sobald sie
+        vorliegen. Streamende Quellen (iter_documents) liefern mehrere Batches; die
+        begrenzte Queue hält nur wenige davon gleichzeitig im Speicher.
+        Fehlerhafte Quellen werden übersprungen.
+        """
+        if not self.sources:
+            return
+        batches: queue.Queue = queue.Queue(maxsize=_MAX_QUEUED_BATCHES)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def drain(source: NewsSourcePort) -> None:
+            try:
+                iter_docs = getattr(source, "iter_documents", None)
+                chunks = iter_docs(criteria) if iter_docs is not None else (source.fetch_documents(criteria),)
+                for docs in chunks:
+                    _LOG.debug("Fetched %d documents from source %s", len(docs), source.SOURCE_NAME)
+                    if not put((source, docs)):
+                        return
+            except Exception:
+                _LOG.exception(
+                    "fetch_documents failed for source=%s",
+                    getattr(source, "SOURCE_NAME", "unknown"),
+                )
+            finally:
+                put(done)
+
+        workers = min(self.max_workers, len(self.sources))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for s in self.sources:
+                ex.submit(drain, s)
+            try:
+                pending_sources = len(self.sources)
+                while pending_sources:
+                    item = batches.get()
+                    if item is done:
+                        pending_sources -= 1
+                        continue
+                    yield item
+            finally:
+                # Abbruch durch den Konsumenten: blockierte Producer freigeben
+                stop.set()
+
+    def _known_urls(self, asset_symbol: str, since: datetime) -> Set[str]:
+        try:
+            return set(self.repo.existing_urls(asset_symbol, since=since))
+        except Exception:
+            # Ohne Vorab-Set entscheidet allein die DB über Duplikate.
+            _LOG.exception("Failed to load known URLs for %s", asset_symbol)
+            return set()
+
+    def _flush(
+            self, pending: List[Tuple[UrlHarvest, Optional[str]]]
+    ) -> Tuple[int, int, int, List[Tuple[str, bool]]]:
+        """
+        Persistiert einen Batch: bekannte URLs per filter_existing (ein Query) aussortieren,
+        Rest per save_url_harvests_bulk einfügen.
+        Liefert (saved, duplicates, failed, [(domain, stored), ...]).
+        """
+        if not pending:
+            return 0, 0, 0, []
+        try:
+            existing = self.repo.filter_existing(
+                pending[0][0].asset_symbol, [h.url for h, _ in pending]
+            )
+            rows = [
+                (h.url, h.asset_symbol, h.source, h.published_at, h.title)
+                for h, _ in pending
+                if h.url not in existing
+            ]
+            inserted = self.repo.save_url_harvests_bulk(rows) if rows else set()
+        except Exception:
+            _LOG.exception("Failed to save %d URLs", len(pending))
+            return 0, 0, len(pending), [(host, False) for _, host in pending if host]
+
+        # Mehrfach gelieferte URLs zählen nur beim ersten Auftreten als gespeichert.
+        fresh = set(inserted)
+        n_saved = 0
+        outcomes: List[Tuple[str, bool]] = []
+        for harvest, host in pending:
+            stored = harvest.url in fresh
+            if stored:
+                fresh.discard(harvest.url)
+                n_saved += 1
+            if host:
+                outcomes.append((host, stored))
+        return n_saved, len(pending) - n_saved, 0, outcomes
+
     @staticmethod
     def storage_name(source: NewsSourcePort) -> str:
         return getattr(source, "storage_name", "unknown") or "unknown"
\ No newline at end of file
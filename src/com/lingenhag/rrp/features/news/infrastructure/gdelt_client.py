@@ -2,12 +2,21 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # optional: schneller JSON-Parser (Artikel-Listen bis MAX_ITEMS)
+    import orjson
+except ImportError:  # pragma: no cover - Fallback auf requests/stdlib-json
+    orjson = None  # type: ignore[assignment]
 
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
 from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
@@ -60,7 +69,48 @@ def _daily_ranges_utc_full_days(start: datetime, end: datetime) -> List[Tuple[da
     return slices
 
 
+_URL_KEYS = ("url", "DocumentIdentifier", "documentIdentifier")
+
+
+def _article_url(item: Dict) -> str:
+    return (
+            (item.get("url") or "")
+            or item.get("DocumentIdentifier")
+            or item.get("documentIdentifier")
+            or ""
+    ).strip()
+
+
+def _unique_trim(items: Sequence[Dict], limit: int) -> Iterator[Tuple[str, Dict]]:
+    """
+    Liefert (url, item) für eindeutige, nicht-leere URLs und bricht ab,
+    sobald `limit` Einträge geliefert wurden (Rest der Liste wird nicht mehr angefasst).
+    GDELT nutzt pro Antwort einen konsistenten URL-Key -> einmal am ersten Artikel bestimmen;
+    nur bei leerem Wert greift die volle Koaleszenz.
+    """
+    if limit <= 0 or not items:
+        return
+    first = items[0]
+    url_key = next((k for k in _URL_KEYS if k in first), "url")
+    seen: Set[str] = set()
+    for item in items:
+        url = (item.get(url_key) or "").strip() or _article_url(item)
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        yield url, item
+        if len(seen) >= limit:
+            return
+
+
 class GdeltClient:
+    """
+    GDELT-DOC-Client (synchroner NewsSourcePort).
+
+    Nebenläufigkeit: Tages-Slices laufen in einem kleinen Thread-Pool über eine geteilte
+    Keep-Alive-Session; der Durchsatz ist durch das globale Rate-Limit (RATE_LIMIT_DELAY)
+    begrenzt, nicht durch die Anzahl offener Requests.
+    """
     SOURCE_NAME = "gdelt"
     BASE_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
     MAX_ITEMS = 250
@@ -74,6 +124,7 @@ class GdeltClient:
             *,
             major_assets_without_context: Optional[Set[str]] = None,
             enforce_context_assets: Optional[Set[str]] = None,
+            max_workers: int = 4,
     ) -> None:
         self.timeout = int(timeout)
         self.max_retries = int(max_retries)
@@ -84,6 +135,15 @@ class GdeltClient:
         self.major_assets_without_context = {a.upper() for a in (major_assets_without_context or set())}
         self.enforce_context_assets = {a.upper() for a in (enforce_context_assets or set())}
         self.query_builder = NewsQueryBuilder()  # Inject Registry if needed
+        self.max_workers = max(1, int(max_workers))
+        self._rate_lock = threading.Lock()
+        self._next_slot = 0.0
+        # Geteilte Session (Keep-Alive) für alle Tages-Slices; Pool >= Worker.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _should_use_crypto_context(self, asset_symbol: str) -> bool:
         sym = (asset_symbol or "").upper()
@@ -93,104 +153,156 @@ class GdeltClient:
             return False
         return True  # Default: Kontext aktiv
 
+    def build_query_core(self, asset_symbol: str) -> str:
+        """GDELT-Query ohne Datum (Standard-Builder, Kontext immer aktiv)."""
+        return self.query_builder.build_for_gdelt(asset_symbol)
+
     def fetch_documents(self, criteria: HarvestCriteriaDTO) -> List[Dict]:
         """
         Tagesbasiertes Fetching (UTC). Für jeden Tages-Batch wird `published_at`
         synthetisch auf den Tagesbeginn 00:00:00Z gesetzt. `criteria.limit` gilt pro Tag.
         """
         results: List[Dict] = []
+        for day_docs in self.iter_documents(criteria):
+            results.extend(day_docs)
+        _LOG.info("GDELT total documents across days: %d", len(results))
+        return results
 
+    def iter_documents(self, criteria: HarvestCriteriaDTO) -> Iterator[List[Dict]]:
+        """
+        Wie fetch_documents, liefert aber einen Batch pro Tag, sobald er vorliegt:
+        Es laufen höchstens `max_workers` Tage voraus, lange Zeitfenster bleiben so speicherbeschränkt.
+        """
         now = datetime.now(timezone.utc)
         if criteria.start > now or criteria.end > now:
             _LOG.warning(
                 "GDELT: future range not supported (start=%s, end=%s, now=%s)",
                 criteria.start, criteria.end, now
             )
-            return results
+            return
 
-        query = self.query_builder.build_for_gdelt(criteria.asset_symbol)
+        query = (criteria.query_cores or {}).get(self.SOURCE_NAME) or self.build_query_core(criteria.asset_symbol)
         _LOG.info("GDELT query: %s", query)
 
         day_slices = _daily_ranges_utc_full_days(criteria.start, criteria.end)
         per_day_limit = max(1, int(criteria.limit))
+        asset_upper = criteria.asset_symbol.upper()
+
+        if not day_slices:
+            return
+
+        # Tages-Slices sind unabhängige GETs -> parallel; Reihenfolge der Tage bleibt erhalten.
+        # Höchstens `workers` Futures in Flug: der nächste Tag wird erst nach Abgabe eines
+        # fertigen Batches angestossen, sonst läge bei langsamen Konsumenten alles im Speicher.
+        workers = min(self.max_workers, len(day_slices))
+        slices = iter(day_slices)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            def submit_next() -> Optional[Future]:
+                sl = next(slices, None)
+                if sl is None:
+                    return None
+                return ex.submit(self._fetch_one_day, query, asset_upper, sl[0], sl[1], sl[2], per_day_limit)
 
-        for q_start, q_end, batch_day_start in day_slices:
-            seen_urls_day: Set[str] = set()
-            params = {
-                "query": query,
-                "mode": "ArtList",
-                "format": "json",
-                "maxrecords": str(min(self.MAX_ITEMS, per_day_limit)),
-                "startdatetime": q_start.strftime("%Y%m%d%H%M%S"),
-                "enddatetime": q_end.strftime("%Y%m%d%H%M%S"),
-            }
+            pending: Deque[Future] = deque()
+            for _ in range(workers):
+                fut = submit_next()
+                if fut is not None:
+                    pending.append(fut)
+            try:
+                while pending:
+                    day_docs = pending.popleft().result()
+                    yield day_docs
+                    fut = submit_next()
+                    if fut is not None:
+                        pending.append(fut)
+            finally:
+                for fut in pending:
+                    fut.cancel()
+
+    def close(self) -> None:
+        """Gibt die geteilte HTTP-Session frei."""
+        self._session.close()
+
+    def _throttle(self) -> None:
+        """
+        Globales Rate-Limit über alle Worker: vergibt Slots im Abstand von RATE_LIMIT_DELAY.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.RATE_LIMIT_DELAY
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def _fetch_one_day(
+            self,
+            query: str,
+            asset_upper: str,
+            q_start: datetime,
+            q_end: datetime,
+            batch_day_start: datetime,
+            per_day_limit: int,
+    ) -> List[Dict]:
+        """Ein Tages-Slice: Request + Mapping der Artikel (max. per_day_limit)."""
+        results: List[Dict] = []
+        params = {
+            "query": query,
+            "mode": "ArtList",
+            "format": "json",
+            "maxrecords": str(min(self.MAX_ITEMS, per_day_limit)),
+            "startdatetime": q_start.strftime("%Y%m%d%H%M%S"),
+            "enddatetime": q_end.strftime("%Y%m%d%H%M%S"),
+        }
 
-            _LOG.debug("GDELT request params (day): %s", params)
-            _LOG.info("GDELT day slice: %s .. %s (limit per day=%d)", q_start, q_end, per_day_limit)
+        _LOG.debug("GDELT request params (day): %s", params)
+        _LOG.info("GDELT day slice: %s .. %s (limit per day=%d)", q_start, q_end, per_day_limit)
 
-            time.sleep(self.RATE_LIMIT_DELAY)  # Rate-Limit
+        self._throttle()  # Rate-Limit (threadübergreifend)
 
-            t0 = time.time()
-            data = self._request_json(params, q_start, q_end)
-            duration = max(0.0, time.time() - t0)
-
-            # NEWS metrics per slice
-            if self.metrics:
-                outcome = "success" if (data and data.get("articles")) else ("no_data" if data else "error")
-                self.metrics.track_news_source_fetch(
-                    source=self.SOURCE_NAME,
-                    asset=criteria.asset_symbol.upper(),
-                    outcome=outcome,
-                )
-                self.metrics.track_news_source_duration(source=self.SOURCE_NAME, duration=duration)
+        t0 = time.time()
+        data = self._request_json(params, q_start, q_end)
+        duration = max(0.0, time.time() - t0)
 
-            if data is None:
-                _LOG.info("GDELT: no data (error) for day slice %s..%s", q_start, q_end)
-                continue
+        # NEWS metrics per slice
+        if self.metrics:
+            outcome = "success" if (data and data.get("articles")) else ("no_data" if data else "error")
+            self.metrics.track_news_source_fetch(
+                source=self.SOURCE_NAME,
+                asset=asset_upper,
+                outcome=outcome,
+            )
+            self.metrics.track_news_source_duration(source=self.SOURCE_NAME, duration=duration)
 
-            q_start_iso = q_start.astimezone(timezone.utc).isoformat()
-            q_end_iso = q_end.astimezone(timezone.utc).isoformat()
+        if data is None:
+            _LOG.info("GDELT: no data (error) for day slice %s..%s", q_start, q_end)
+            return results
 
-            day_results = 0
-            for item in data.get("articles", []):
-                if day_results >= per_day_limit:
-                    break
+        q_start_iso = q_start.astimezone(timezone.utc).isoformat()
+        q_end_iso = q_end.astimezone(timezone.utc).isoformat()
 
-                url = (
-                        (item.get("url") or "")
-                        or item.get("DocumentIdentifier")
-                        or item.get("documentIdentifier")
-                        or ""
-                ).strip()
+        for url, item in _unique_trim(data.get("articles", []), per_day_limit):
+            title = (item.get("title") or item.get("Title") or "").strip()
 
-                if not url or url in seen_urls_day:
-                    continue
-                seen_urls_day.add(url)
-
-                title = (item.get("title") or item.get("Title") or "").strip()
-
-                raw = dict(item)
-                raw["query"] = query
-                raw["query_start"] = q_start_iso
-                raw["query_end"] = q_end_iso
-
-                published_at = batch_day_start
-
-                results.append(
-                    {
-                        "url": url,
-                        "title": title,
-                        "source": self.SOURCE_NAME,
-                        "published_at": published_at,
-                        "content": "",
-                        "raw": raw,
-                    }
-                )
-                day_results += 1
+            raw = dict(item)
+            raw["query"] = query
+            raw["query_start"] = q_start_iso
+            raw["query_end"] = q_end_iso
 
-            _LOG.info("GDELT fetched %d documents for day %s", day_results, batch_day_start.date())
+            published_at = batch_day_start
 
-        _LOG.info("GDELT total documents across days: %d", len(results))
+            results.append(
+                {
+                    "url": url,
+                    "title": title,
+                    "source": self.SOURCE_NAME,
+                    "published_at": published_at,
+                    "content": "",
+                    "raw": raw,
+                }
+            )
+
+        _LOG.info("GDELT fetched %d documents for day %s", len(results), batch_day_start.date())
         return results
 
     def _request_json(self, params: Dict, start: datetime, end: datetime) -> Optional[Dict]:
@@ -201,10 +313,9 @@ class GdeltClient:
             t0 = time.time()
             resp: Optional[requests.Response] = None
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     self.BASE_URL,
                     params=params,
-                    headers=self.headers,
                     timeout=self.timeout,
                 )
                 ct = (resp.headers.get("Content-Type") or "").lower()
@@ -235,7 +346,8 @@ class GdeltClient:
                 if self.metrics:
                     self.metrics.track_api_request("gdelt", "success")
                     self.metrics.track_api_duration("gdelt", max(0.0, time.time() - t0))
-                return resp.json()
+                # orjson parst direkt aus den Bytes (kein Text-Decode); JSONDecodeError ist ein ValueError
+                return orjson.loads(resp.content) if orjson is not None else resp.json()
 
             except requests.RequestException as e:
                 if self.metrics:
@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+import threading
 import time
-from typing import Callable, Optional
-from urllib.parse import parse_qs, urlencode, unquote, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence
+from urllib.parse import ParseResult, parse_qs, urlencode, unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from com.lingenhag.rrp.features.news.application.ports import UrlResolverPort
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
@@ -22,8 +29,25 @@ _NEWS_HOST = "news.google.com"
 _RESOLVER_NAME = "google_news_resolver"
 
 
+# Gleiche URLs werden pro resolve() mehrfach geprüft -> urlparse/hostname memoisieren.
+_URL_CACHE_SIZE = int(os.getenv("RRP_URL_CACHE_SIZE", "8192"))
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _parsed(u: str) -> ParseResult:
+    return urlparse(u)
+
+
+# Fast-Path für den Host; userinfo/IPv6 fallen auf urlparse zurück
+_HOST_RE = re.compile(r"^https?://([^/?#:@\[\]]+)(?::\d+)?(?:[/?#]|$)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def _hostname(u: str) -> str:
-    return (urlparse(u).hostname or "").lower()
+    m = _HOST_RE.match(u)
+    if m is not None:
+        return m.group(1).lower()
+    return (_parsed(u).hostname or "").lower()
 
 
 def _is_consent(u: str) -> bool:
@@ -35,8 +59,8 @@ def _is_news(u: str) -> bool:
 
 
 def _is_google_interstitial(u: str) -> bool:
-    parsed = urlparse(u)
-    host = (parsed.hostname or "").lower()
+    parsed = _parsed(u)
+    host = _hostname(u)
     path = (parsed.path or "").lower()
     if not host.endswith("google.com"):
         return False
@@ -49,6 +73,26 @@ def _is_google_interstitial(u: str) -> bool:
     return False
 
 
+class _UrlKind(Enum):
+    CONSENT = "consent"
+    NEWS = "news"
+    INTERSTITIAL = "interstitial"
+    OTHER = "other"
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _classify(u: str) -> _UrlKind:
+    """Einmalige Host-/Pfad-Klassifikation; ersetzt die Kette aus _is_consent/_is_news/_is_google_interstitial."""
+    host = _hostname(u)
+    if host in _CONSENT_HOSTS:
+        return _UrlKind.CONSENT
+    if host == _NEWS_HOST:
+        return _UrlKind.NEWS
+    if _is_google_interstitial(u):
+        return _UrlKind.INTERSTITIAL
+    return _UrlKind.OTHER
+
+
 def _append_us_params(u: str) -> str:
     sep = "&" if "?" in u else "?"
     return f"{u}{sep}{urlencode({'hl': 'en-US', 'gl': 'US', 'ceid': 'US:en'})}"
@@ -59,7 +103,7 @@ class GoogleNewsResolver(UrlResolverPort):
     Resolver für Google-News-RSS-Artikel-URLs → Publisher-URL.
 
     Metriken:
-      - news_resolver_total{resolver="google_news_resolver", asset="-|<sym>", outcome=...}
+      - news_resolver_total{resolver="google_news_resolver", outcome=...}
       - news_resolver_duration_seconds{resolver="google_news_resolver"}
 
     Hinweis: Der Resolver kennt das Asset i. d. R. nicht. Wir labeln es deshalb mit "-" ;
@@ -75,12 +119,21 @@ class GoogleNewsResolver(UrlResolverPort):
             resolve_to_publisher: bool = True,
             http_get: Optional[Callable[[str, int, dict[str, str]], object]] = None,
             metrics: Optional[Metrics] = None,
+            max_concurrency: int = 32,
     ) -> None:
         self.timeout = int(timeout)
+        self._max_concurrency = max(1, int(max_concurrency))
         self._headless_resolve = headless_resolve
         self._resolve_to_publisher = bool(resolve_to_publisher)
         self._http_get = http_get or self._default_http_get
         self._metrics = metrics
+        self._playwright: Optional[_PlaywrightSession] = None
+        self._playwright_lock = threading.Lock()
+        # Geteilte Session (Keep-Alive) über alle Auflösungen; Redirects führen auf viele Hosts.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=self._max_concurrency, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def resolve(self, url: str) -> Optional[str]:
         if not url:
@@ -90,16 +143,18 @@ class GoogleNewsResolver(UrlResolverPort):
         outcome = "unknown"
         try:
             u = url
+            kind = _classify(u)
 
             # 1) consent.* → continue=
-            if _is_consent(u):
-                qs = parse_qs(urlparse(u).query)
+            if kind is _UrlKind.CONSENT:
+                qs = parse_qs(_parsed(u).query)
                 cont = qs.get("continue", [None])[0]
                 if not cont:
                     _LOG.debug("GoogleNewsResolver: no 'continue=' param on consent url")
                     outcome = "consent_missing_continue"
                     return None
                 u = unquote(cont)
+                kind = _classify(u)
 
                 if self._headless_resolve is not None or not self._resolve_to_publisher:
                     outcome = "returned_news_url"
@@ -107,17 +162,17 @@ class GoogleNewsResolver(UrlResolverPort):
                 # else: fall-through to news.google.com
 
             # 2) news.google.com → bis Publisher auflösen
-            if _is_news(u):
+            if kind is _UrlKind.NEWS:
                 res = self._resolve_news_to_publisher(u)
                 outcome = "resolved_publisher" if res and not _is_news(res) else "fallback_news"
                 return res
 
-            # 3) andere Hosts → wenn nicht Consent/Interstitial, direkt zurückgeben
-            if not _is_consent(u) and not _is_google_interstitial(u):
+            # 3) andere Hosts → direkt zurückgeben
+            if kind is _UrlKind.OTHER:
                 outcome = "passthrough"
                 return u
 
-            # Interstitial → Headless-Fallback
+            # Nur noch CONSENT (verschachtelt) / INTERSTITIAL → Headless-Fallback
             if self._is_headless_available():
                 res = self._resolve_headless(_append_us_params(u))
                 outcome = "headless_resolved" if res else "headless_failed"
@@ -135,6 +190,21 @@ class GoogleNewsResolver(UrlResolverPort):
                     resolver=_RESOLVER_NAME, duration=max(0.0, time.time() - t0)
                 )
 
+    def resolve_many(self, urls: Sequence[str]) -> List[Optional[str]]:
+        """
+        Löst eine ganze Liste auf (Reihenfolge bleibt). Gleiche URLs werden nur einmal
+        aufgelöst; die Auflösungen laufen mit bis zu `max_concurrency` Threads über die
+        geteilte Session (Pool-Größe = max_concurrency).
+        """
+        unique = list(dict.fromkeys(u for u in urls if u))
+        workers = min(self._max_concurrency, len(unique))
+        if workers <= 1:
+            resolved = {u: self.resolve(u) for u in unique}
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gn-resolve") as ex:
+                resolved = dict(zip(unique, ex.map(self.resolve, unique)))
+        return [resolved.get(u) if u else None for u in urls]
+
     def _resolve_news_to_publisher(self, news_url: str) -> Optional[str]:
         u2 = _append_us_params(news_url)
         try:
@@ -149,7 +219,7 @@ class GoogleNewsResolver(UrlResolverPort):
             _LOG.warning("GoogleNewsResolver: error resolving %s: %s", u2, e)
             return news_url
 
-        if (not _is_news(final)) and (not _is_consent(final)) and (not _is_google_interstitial(final)):
+        if _classify(final) is _UrlKind.OTHER:
             return final
 
         if self._is_headless_available():
@@ -169,7 +239,7 @@ class GoogleNewsResolver(UrlResolverPort):
                 return None
 
         try:
-            return _playwright_resolve(url_with_params)
+            return self._headless_session().resolve(url_with_params)
         except ImportError:
             _LOG.info("GoogleNewsResolver: playwright not installed; skip headless resolution.")
             return None
@@ -177,11 +247,25 @@ class GoogleNewsResolver(UrlResolverPort):
             _LOG.warning("GoogleNewsResolver: headless resolution error: %s", e)
             return None
 
-    @staticmethod
-    def _default_http_get(url: str, timeout: int, headers: dict[str, str]) -> object:
-        return requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    def _headless_session(self) -> _PlaywrightSession:
+        with self._playwright_lock:
+            if self._playwright is None:
+                self._playwright = _PlaywrightSession()
+            return self._playwright
+
+    def close(self) -> None:
+        """Gibt den (ggf. gestarteten) Headless-Browser und die HTTP-Session frei."""
+        with self._playwright_lock:
+            session, self._playwright = self._playwright, None
+        if session is not None:
+            session.close()
+        self._session.close()
 
+    def _default_http_get(self, url: str, timeout: int, headers: dict[str, str]) -> object:
+        return self._session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
 
+
+@lru_cache(maxsize=1)
 def _playwright_available() -> bool:
     try:
         import playwright  # type: ignore[unused-ignore,unused-import]
@@ -190,58 +274,92 @@ def _playwright_available() -> bool:
         return False
 
 
-def _playwright_resolve(url: str) -> Optional[str]:
-    from playwright.sync_api import sync_playwright
-    from urllib.parse import parse_qs, unquote, urlparse
-
-    def _click_if_present(page, selectors: list[str]) -> bool:
-        for sel in selectors:
-            try:
-                btn = page.locator(sel)
-                if btn and btn.first and btn.first.count() >= 0:
-                    btn.first.click(timeout=3000)
-                    return True
-            except Exception:
-                continue
-        return False
+# Consent-Button in einem einzigen IPC-Hop suchen und klicken (statt mehrerer Locator-Roundtrips)
+_CLICK_CONSENT_JS = """
+(() => {
+  const rx = /Accept all|I agree|Agree/i;
+  for (const b of document.querySelectorAll('button, [role=button]')) {
+    if (rx.test((b.textContent || '').trim())) { b.click(); return true; }
+  }
+  return false;
+})()
+"""
 
-    def _is_news(u: str) -> bool:
-        return (urlparse(u).hostname or "").lower() == _NEWS_HOST
 
-    def _is_consent(u: str) -> bool:
-        return (urlparse(u).hostname or "").lower() in _CONSENT_HOSTS
+def _resolve_on_page(page, url: str) -> Optional[str]:
+    page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=True)
+    if "consent.google.com" in (page.url or ""):
         try:
-            ctx = browser.new_context()
-            page = ctx.new_page()
-            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-            if "consent.google.com" in (page.url or ""):
-                _click_if_present(
-                    page,
-                    [
-                        'button:has-text("Accept all")',
-                        'button:has-text("I agree")',
-                        'text="I agree"',
-                        'text="Accept all"',
-                        'button:has-text(" Agree")',
-                    ],
-                )
-                page.wait_for_timeout(1000)
-                qs = parse_qs(urlparse(page.url).query)
-                cont = qs.get("continue", [None])[0]
-                if cont:
-                    target = unquote(cont)
-                    page.goto(target, wait_until="domcontentloaded", timeout=30000)
+            page.evaluate(_CLICK_CONSENT_JS)
+        except Exception:
+            pass
+        page.wait_for_timeout(1000)
+        qs = parse_qs(_parsed(page.url).query)
+        cont = qs.get("continue", [None])[0]
+        if cont:
+            target = unquote(cont)
+            page.goto(target, wait_until="domcontentloaded", timeout=30000)
+
+    if _is_news(page.url):
+        page.wait_for_timeout(1500)
+
+    final = page.url
+    if final and (not _is_news(final)) and (not _is_consent(final)):
+        return final
+    return None
+
+
+class _PlaywrightSession:
+    """
+    Ein Chromium pro Resolver, lazy gestartet und über Auflösungen hinweg wiederverwendet.
+    Die Sync-API von Playwright ist thread-gebunden -> alle Aufrufe laufen in einem eigenen Worker-Thread;
+    pro Auflösung nur ein frischer Context (Cookies isoliert), kein neuer Browser-Prozess.
+    """
 
-            if _is_news(page.url):
-                page.wait_for_timeout(1500)
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+        self._pw = None
+        self._browser = None
 
-            final = page.url
-            if final and (not _is_news(final)) and (not _is_consent(final)):
-                return final
-            return None
+    def resolve(self, url: str) -> Optional[str]:
+        return self._executor.submit(self._resolve, url).result()
+
+    def close(self) -> None:
+        try:
+            self._executor.submit(self._shutdown).result()
+        except RuntimeError:
+            pass  # Executor bereits beendet (Interpreter-Shutdown)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def _resolve(self, url: str) -> Optional[str]:
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=True)
+        ctx = self._browser.new_context()
+        try:
+            return _resolve_on_page(ctx.new_page(), url)
+        except Exception:
+            # Browser abgestürzt -> beim nächsten Aufruf neu starten
+            if not self._browser.is_connected():
+                self._shutdown()
+            raise
+        finally:
+            try:
+                ctx.close()
+            except Exception:
+                pass
+
+    def _shutdown(self) -> None:
+        browser, pw = self._browser, self._pw
+        self._browser = self._pw = None
+        try:
+            if browser is not None:
+                browser.close()
+        except Exception:
+            pass
         finally:
-            browser.close()
\ No newline at end of file
+            if pw is not None:
+                pw.stop()
@@ -3,24 +3,50 @@ from __future__ import annotations
 
 import logging
 import time
-from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional, Sequence, Set
-from urllib.parse import urlencode, quote_plus
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlencode, quote_plus, urlparse
 import xml.etree.ElementTree as ET
 import email.utils as eut
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
-from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
+from com.lingenhag.rrp.features.news.application.ports import (
+    FeedCachePort,
+    FeedEntry,
+    HarvestCriteriaDTO,
+    ResolvedUrlCachePort,
+)
 from .google_news_resolver import GoogleNewsResolver
 
 _LOG = logging.getLogger(__name__)
 
 
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+
 def _parse_pubdate(pub_date: Optional[str]) -> Optional[datetime]:
     if not pub_date:
         return None
+    # Schnellpfad für das feste Google-Format "Mon, 06 Oct 2024 12:34:56 GMT" (Slices statt Tokenizer)
+    if len(pub_date) == 29 and pub_date.endswith(" GMT") and pub_date[3] == ",":
+        try:
+            return datetime(
+                int(pub_date[12:16]), _MONTHS[pub_date[8:11]], int(pub_date[5:7]),
+                int(pub_date[17:19]), int(pub_date[20:22]), int(pub_date[23:25]),
+                tzinfo=timezone.utc,
+            )
+        except (KeyError, ValueError):
+            pass  # -> allgemeiner Parser
     try:
         dt = eut.parsedate_to_datetime(pub_date)
         if dt.tzinfo is None:
@@ -30,23 +56,76 @@ def _parse_pubdate(pub_date: Optional[str]) -> Optional[datetime]:
         return None
 
 
+_STREAM_CHUNK = 32 * 1024
+
+# (ETag, Last-Modified) einer RSS-Antwort
+_Validators = Tuple[Optional[str], Optional[str]]
+
+
+class _NotModified(Exception):
+    """HTTP 304 auf einen Conditional GET: gecachte Items weiterverwenden."""
+
+
+def _iter_feed_entries(body: str | bytes | Iterable[bytes]) -> Iterator[FeedEntry]:
+    """(title, link, pubDate, publisher) je <item>, in Feed-Reihenfolge."""
+    for item in _iter_rss_items(body):
+        yield (
+            (item.findtext("title") or "").strip(),
+            (item.findtext("link") or "").strip(),
+            item.findtext("pubDate"),
+            _find_publisher(item),
+        )
+
+
+def _iter_rss_items(body: str | bytes | Iterable[bytes]) -> Iterator[ET.Element]:
+    """
+    Liefert <item>-Elemente inkrementell via XMLPullParser (expat, C). `body` ist entweder der
+    komplette Text/Bytes-Body oder ein Chunk-Iterator (HTTP-Stream) -> Parsen beginnt, während
+    noch Bytes eintreffen. Nach der Verarbeitung werden die Elemente geleert.
+    """
+    if isinstance(body, str):
+        chunks: Iterable[bytes] = (body.encode("utf-8"),)
+    elif isinstance(body, (bytes, bytearray)):
+        chunks = (bytes(body),)
+    else:
+        chunks = body
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, el in parser.read_events():
+            if el.tag == "item":
+                yield el
+                el.clear()
+    parser.close()  # ParseError bei abgeschnittenem Dokument
+    for _, el in parser.read_events():
+        if el.tag == "item":
+            yield el
+            el.clear()
+
+
 def _within_range(ts: Optional[datetime], start: datetime, end: datetime) -> bool:
     if ts is None:
         return True
     return start <= ts <= end
 
 
+_SOURCE_TAGS = frozenset({"source", "{http://www.w3.org/2005/Atom}source"})
+
+
 def _find_publisher(item: ET.Element) -> Optional[str]:
-    # robust gegen Namespaces
-    src_el = item.find("source")
+    # robust gegen Namespaces: ein Durchlauf über die Kinder, bekannte Tags per Set-Lookup,
+    # beliebige andere Namespaces nur als Fallback
+    src_el: Optional[ET.Element] = None
+    fallback: Optional[ET.Element] = None
+    for child in item:
+        tag = child.tag
+        if tag in _SOURCE_TAGS:
+            src_el = child
+            break
+        if fallback is None and isinstance(tag, str) and tag.endswith("}source"):
+            fallback = child
     if src_el is None:
-        src_el = item.find("{http://www.w3.org/2005/Atom}source")
-    if src_el is None:
-        for child in list(item):
-            tag = child.tag
-            if isinstance(tag, str) and tag.rsplit("}", 1)[-1] == "source":
-                src_el = child
-                break
+        src_el = fallback
     if src_el is None:
         return None
     text = (src_el.text or "").strip()
@@ -56,6 +135,25 @@ def _find_publisher(item: ET.Element) -> Optional[str]:
     return url_attr or None
 
 
+_CRYPTO_CONTEXT = " AND (crypto OR cryptocurrency OR blockchain OR token OR defi OR nft)"
+
+
+@lru_cache(maxsize=512)
+def _query_prefix(sym: str, use_context: bool) -> str:
+    """Fertiger Query-Teil ohne Datum je (Symbol, Kontext) – pro Lauf nur noch ein f-String."""
+    core_terms: List[str] = [sym]
+    if sym == "BTC":
+        core_terms.append('"Bitcoin"')
+    core = "(" + " OR ".join(core_terms) + ")"
+    return core + (_CRYPTO_CONTEXT if use_context else "")
+
+
+@lru_cache(maxsize=512)
+def _build_url_cached(base_url: str, query: str, hl: str, gl: str, ceid: str) -> str:
+    params = {"q": query, "hl": hl, "gl": gl, "ceid": ceid}
+    return f"{base_url}?{urlencode(params, quote_via=quote_plus)}"
+
+
 @dataclass
 class GoogleNewsRssClient:
     """
@@ -68,75 +166,185 @@ class GoogleNewsRssClient:
     resolve_redirects: bool = True
     max_workers: int = 4
     metrics: Optional[Metrics] = None
-    http_fetch: Optional[Callable[[str, int], str]] = None  # (url, timeout) -> text
+    http_fetch: Optional[Callable[[str, int], str | bytes]] = None  # (url, timeout) -> text/bytes (ohne Streaming)
     resolver: Optional[GoogleNewsResolver] = None
+    url_cache: Optional[ResolvedUrlCachePort] = None  # persistente Redirect-Auflösungen
+    feed_cache: Optional[FeedCachePort] = None  # persistenter Conditional-GET-Zustand je Feed-URL
 
     # Neu: konfigurierbare Kontext-Politik
     major_assets_without_context: Optional[Set[str]] = None
     enforce_context_assets: Optional[Set[str]] = None
 
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+    # Einmal normalisierte Kontext-Sets (Großschreibung), siehe __post_init__
+    _major_upper: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _enforce_upper: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
     SOURCE_NAME: str = "google_rss"  # ← zurück auf den erwarteten Namen
     BASE_URL: str = "https://news.google.com/rss/search"
 
-    def _default_http_fetch(self, url: str, timeout: int) -> str:
-        r = requests.get(
-            url,
-            headers={"User-Agent": "ch.lingenhag.rrp/1.0 (+https://example.local) python-requests"},
-            timeout=timeout,
+    def __post_init__(self) -> None:
+        self._major_upper = frozenset(a.upper() for a in (self.major_assets_without_context or ()))
+        self._enforce_upper = frozenset(a.upper() for a in (self.enforce_context_assets or ()))
+        workers = max(1, int(self.max_workers))
+        # Ein Resolver pro Client: Session und (lazy) Headless-Browser überleben einzelne Fetches.
+        # max_workers (--rss-workers) begrenzt die parallelen Auflösungen und den Verbindungs-Pool.
+        if self.resolver is None and self.resolve_redirects:
+            self.resolver = GoogleNewsResolver(timeout=self.timeout, metrics=self.metrics, max_concurrency=workers)
+        # Geteilte Session (Keep-Alive) für alle RSS-Requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=workers,
+            pool_maxsize=workers * 2,
+            max_retries=Retry(total=2, backoff_factor=0.1),
         )
-        r.raise_for_status()
-        return r.text
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Gibt HTTP-Session und Resolver (inkl. Headless-Browser) frei."""
+        self._session.close()
+        close = getattr(self.resolver, "close", None)
+        if close is not None:
+            close()
+
+    def _default_http_stream(
+            self, url: str, timeout: int, validators: Optional[_Validators] = None
+    ) -> Tuple[Iterator[bytes], _Validators]:
+        """
+        Öffnet den RSS-Request gestreamt (Status wird sofort geprüft) und liefert den Body in Chunks
+        plus die Cache-Validatoren (ETag, Last-Modified) der Antwort.
+        Mit `validators` wird ein Conditional GET gesendet; 304 -> _NotModified.
+        Die Verbindung wird freigegeben, sobald der Iterator erschöpft oder geschlossen ist.
+        """
+        headers = {"User-Agent": "ch.lingenhag.rrp/1.0 (+https://example.local) python-requests"}
+        if validators is not None:
+            etag, last_modified = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        r = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+        if r.status_code == 304:
+            r.close()
+            raise _NotModified(url)
+        try:
+            r.raise_for_status()
+        except Exception:
+            r.close()
+            raise
+
+        def _chunks() -> Iterator[bytes]:
+            try:
+                yield from r.iter_content(chunk_size=_STREAM_CHUNK)
+            finally:
+                r.close()
+
+        return _chunks(), (r.headers.get("ETag"), r.headers.get("Last-Modified"))
 
     def _should_use_crypto_context(self, asset_symbol: str) -> bool:
-        major = {a.upper() for a in (self.major_assets_without_context or set())}
-        enforce = {a.upper() for a in (self.enforce_context_assets or set())}
         sym = (asset_symbol or "").upper()
-        if sym in enforce:
+        if sym in self._enforce_upper:
             return True
-        if sym in major:
-            return False
-        return True  # Default: Kontext aktiv
+        return sym not in self._major_upper  # Default: Kontext aktiv
+
+    def build_query_core(self, asset_symbol: str) -> str:
+        """Google-News-Query ohne Datum: (SYMBOL OR "Langname") [+ optionaler Kontext]."""
+        return _query_prefix(asset_symbol.upper(), self._should_use_crypto_context(asset_symbol))
 
     def _build_query(self, criteria: HarvestCriteriaDTO) -> str:
         """
         Google-News-Query: (SYMBOL OR "Langname") [+ optionaler Kontext] + after:/before:
         """
-        use_context = self._should_use_crypto_context(criteria.asset_symbol)
-        hard_name = "Bitcoin" if criteria.asset_symbol.upper() == "BTC" else None
-        core_terms: List[str] = [criteria.asset_symbol.upper()]
-        if hard_name:
-            core_terms.append(f'"{hard_name}"')
-        core = "(" + " OR ".join(core_terms) + ")"
-
-        if use_context:
-            context = " AND (crypto OR cryptocurrency OR blockchain OR token OR defi OR nft)"
-        else:
-            context = ""
-
-        start_d = criteria.start.date().isoformat()
-        end_d = criteria.end.date().isoformat()
-        date_clause = f" after:{start_d} before:{end_d}"
-
-        q = core + context + date_clause
+        prefix = (criteria.query_cores or {}).get(self.SOURCE_NAME) or self.build_query_core(criteria.asset_symbol)
+        q = f"{prefix} after:{criteria.start.date().isoformat()} before:{criteria.end.date().isoformat()}"
         _LOG.info("GoogleNewsRssClient query: %s", q)
         return q
 
     def _build_url(self, query: str) -> str:
-        params = {"q": query, "hl": self.hl, "gl": self.gl, "ceid": self.ceid}
-        return f"{self.BASE_URL}?{urlencode(params, quote_via=quote_plus)}"
+        return _build_url_cached(self.BASE_URL, query, self.hl, self.gl, self.ceid)
+
+    def _resolve_links(self, links: List[str]) -> List[str]:
+        """
+        RSS-Links -> Publisher-URLs. Bekannte Auflösungen kommen aus `url_cache` (ein Lookup pro
+        Feed); nur der Rest geht ans Netzwerk und wird danach im Cache abgelegt.
+        """
+        cached: Dict[str, str] = {}
+        if self.url_cache is not None:
+            try:
+                cached = self.url_cache.get_many(links)
+            except Exception as e:  # noqa: BLE001 - Cache ist "best effort"
+                _LOG.warning("GoogleNewsRssClient: resolver cache lookup failed: %s", e)
+
+        misses = list(dict.fromkeys(l for l in links if l not in cached))
+        if misses:
+            resolver = self.resolver or GoogleNewsResolver(
+                timeout=self.timeout, metrics=self.metrics, max_concurrency=max(1, int(self.max_workers))
+            )
+            resolve_many = getattr(resolver, "resolve_many", None)
+            if resolve_many is not None:
+                resolved = resolve_many(misses)
+            else:
+                # Fremder UrlResolverPort ohne Batch-API
+                workers = max(1, min(int(self.max_workers), len(misses)))
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    resolved = list(ex.map(resolver.resolve, misses))
+            # Ergebnis wie ohne Cache (r or link); gemerkt werden nur echte Publisher-Auflösungen,
+            # Fallbacks auf news.google.com werden im nächsten Lauf erneut versucht
+            fresh = [
+                (link, r) for link, r in zip(misses, resolved)
+                if r and r != link and urlparse(r).hostname != "news.google.com"
+            ]
+            cached.update((link, r) for link, r in zip(misses, resolved) if r)
+            if self.url_cache is not None and fresh:
+                try:
+                    self.url_cache.put_many(fresh)
+                except Exception as e:  # noqa: BLE001
+                    _LOG.warning("GoogleNewsRssClient: resolver cache write failed: %s", e)
+
+        return [cached.get(link) or link for link in links]
+
+    def _feed_cache_get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], List[FeedEntry]]]:
+        # Injizierter Fetcher (Tests) kennt keine Validatoren -> kein Conditional GET
+        if self.feed_cache is None or self.http_fetch is not None:
+            return None
+        try:
+            return self.feed_cache.get(url)
+        except Exception as e:  # noqa: BLE001 - Cache ist "best effort"
+            _LOG.warning("GoogleNewsRssClient: feed cache lookup failed: %s", e)
+            return None
+
+    def _feed_cache_put(self, url: str, validators: _Validators, entries: Sequence[FeedEntry]) -> None:
+        try:
+            self.feed_cache.put(url, validators[0], validators[1], entries)
+        except Exception as e:  # noqa: BLE001
+            _LOG.warning("GoogleNewsRssClient: feed cache write failed: %s", e)
 
     def fetch_documents(self, criteria: HarvestCriteriaDTO) -> List[Dict]:
         query = self._build_query(criteria)
         url = self._build_url(query)
         _LOG.info("GoogleNewsRssClient: fetching RSS for query=%s", query)
 
-        fetch = self.http_fetch or self._default_http_fetch
         t0 = time.time()
         source_label = self.SOURCE_NAME
         asset_label = criteria.asset_symbol.upper()
+        limit = max(1, int(criteria.limit))
+
+        # Conditional GET: die Feed-URL enthält das Tagesfenster (after:/before:) und ist damit der Schlüssel
+        cached = self._feed_cache_get(url)
+        validators: _Validators = (None, None)
+        body = None
+        entries: Iterable[FeedEntry] = ()
+        not_modified = False
 
         try:
-            xml_text = fetch(url, self.timeout)
+            if self.http_fetch is not None:
+                # Injizierter Fetcher (Tests) liefert den kompletten Body; Default streamt.
+                body = self.http_fetch(url, self.timeout)
+            else:
+                body, validators = self._default_http_stream(
+                    url, self.timeout, (cached[0], cached[1]) if cached else None
+                )
             if self.metrics:
                 self.metrics.track_news_source_fetch(source=source_label, asset=asset_label, outcome="success")
                 self.metrics.track_news_source_duration(
@@ -145,6 +353,13 @@ class GoogleNewsRssClient:
                 # legacy generic metrics
                 self.metrics.track_api_request("google_news_rss", "success")
                 self.metrics.track_api_duration("google_news_rss", max(0.0, time.time() - t0))
+        except _NotModified:
+            _LOG.info("GoogleNewsRssClient: feed not modified, reusing %d cached items.", len(cached[2]))
+            not_modified = True
+            if self.metrics:
+                self.metrics.track_api_request("google_news_rss", "success")
+                self.metrics.track_api_duration("google_news_rss", max(0.0, time.time() - t0))
+            entries = cached[2]
         except Exception as e:
             _LOG.warning("GoogleNewsRssClient: fetch error for %s: %s", url, e)
             if self.metrics:
@@ -156,36 +371,50 @@ class GoogleNewsRssClient:
                 self.metrics.track_api_duration("google_news_rss", max(0.0, time.time() - t0))
             return []
 
+        # Phase 1: Kandidaten im Zeitfenster sammeln (bis zum Limit)
+        candidates: List[Tuple[str, str, Optional[str], Optional[datetime], Optional[str]]] = []
+
+        # Streaming-Parse: Items werden einzeln verarbeitet und verworfen; Abbruch beim Limit
+        # beendet auch Download und Parsen des Rests. Gecachte Items (304) laufen durch denselben Filter.
         try:
-            root = ET.fromstring(xml_text)
+            if body is not None:
+                entries = _iter_feed_entries(body)
+                if self.feed_cache is not None and validators != (None, None):
+                    # Für den Cache den ganzen Feed lesen: spätere Läufe filtern mit eigenem Fenster/Limit
+                    entries = list(entries)
+                    self._feed_cache_put(url, validators, entries)
+            start, end = criteria.start, criteria.end
+            for title, link, pub_raw, publisher_name in entries:
+                published_at = _parse_pubdate(pub_raw)
+                if not _within_range(published_at, start, end):
+                    continue
+                candidates.append((title, link, pub_raw, published_at, publisher_name))
+                if len(candidates) >= limit:
+                    break
         except ET.ParseError as e:
             _LOG.warning("GoogleNewsRssClient: XML parse error: %s", e)
             if self.metrics:
                 self.metrics.track_news_source_fetch(source=source_label, asset=asset_label, outcome="parse_error")
             return []
+        except requests.RequestException as e:
+            # Abbruch während des Body-Streams
+            _LOG.warning("GoogleNewsRssClient: stream error for %s: %s", url, e)
+            if self.metrics:
+                self.metrics.track_news_source_fetch(source=source_label, asset=asset_label, outcome="error")
+            return []
+        finally:
+            close = getattr(body, "close", None)
+            if close is not None:
+                close()
 
-        items: List[Dict] = []
-
-        # Resolver bereitstellen (mit Metrics)
-        resolver = self.resolver or GoogleNewsResolver(timeout=self.timeout, metrics=self.metrics)
-
-        for item in root.findall(".//item"):
-            title = (item.findtext("title") or "").strip()
-            link = (item.findtext("link") or "").strip()
-            pub_raw = item.findtext("pubDate")
-            published_at = _parse_pubdate(pub_raw)
-
-            publisher_name = _find_publisher(item)
-
-            if not _within_range(published_at, criteria.start, criteria.end):
-                continue
-
-            final_url = link
-            if self.resolve_redirects:
-                resolved = resolver.resolve(link)
-                if resolved:
-                    final_url = resolved
+        # Phase 2: Redirects gebündelt und parallel auflösen (IO-bound); Reihenfolge bleibt erhalten
+        links = [c[1] for c in candidates]
+        final_urls = links
+        if self.resolve_redirects and links:
+            final_urls = self._resolve_links(links)
 
+        items: List[Dict] = []
+        for (title, link, pub_raw, published_at, publisher_name), final_url in zip(candidates, final_urls):
             raw = {
                 "rss_link": link,
                 "query": query,
@@ -195,7 +424,6 @@ class GoogleNewsRssClient:
                 "pubDate": pub_raw,
                 "publisher": publisher_name,
             }
-
             items.append(
                 {
                     "url": final_url,
@@ -206,10 +434,8 @@ class GoogleNewsRssClient:
                     "raw": raw,
                 }
             )
-            if len(items) >= max(1, int(criteria.limit)):
-                break
 
-        outcome = "no_items" if not items else "assembled"
+        outcome = "not_modified" if not_modified else ("no_items" if not items else "assembled")
         if self.metrics:
             self.metrics.track_news_source_fetch(source=source_label, asset=asset_label, outcome=outcome)
 
@@ -1,6 +1,8 @@
 # src/com/lingenhag/rrp/features/news/infrastructure/repositories/domain_policy_adapter.py
 from __future__ import annotations
 
+from typing import Dict, Sequence
+
 from com.lingenhag.rrp.features.news.application.ports import DomainPolicyPort
 from .duckdb_domain_policy_repository import DuckDBDomainPolicyRepository
 
@@ -13,18 +15,34 @@ class DomainPolicyAdapter(DomainPolicyPort):
 
     def __init__(self, repo: DuckDBDomainPolicyRepository) -> None:
         self._repo = repo
+        # Policies pro Asset einmal laden; danach ist is_allowed ein Dict-Lookup statt DB-Abfrage.
+        self._policies: Dict[str, Dict[str, bool]] = {}
+
+    def _policies_for(self, asset_symbol: str) -> Dict[str, bool]:
+        policies = self._policies.get(asset_symbol)
+        if policies is None:
+            policies = self._policies[asset_symbol] = self._repo.load_policies(asset_symbol)
+        return policies
 
     # ---- DomainPolicyPort ----
     def is_allowed(self, asset_symbol: str, domain: str) -> bool | None:
         # Repository ist fail-open; None (keine Policy) signalisieren wir hier nicht,
         # da is_allowed bereits bool liefert. Für Kompatibilität geben wir bool zurück.
-        return self._repo.is_allowed(asset_symbol, domain)
+        return self._policies_for(asset_symbol).get(domain, True)
 
     def set_policy(self, *, asset_symbol: str, domain: str, allowed: bool) -> None:
         self._repo.allow(asset_symbol, domain, allowed=allowed)
+        if asset_symbol in self._policies:
+            self._policies[asset_symbol][domain] = allowed
 
     def record_harvest(self, *, asset_symbol: str, domain: str, stored: bool) -> None:
         self._repo.record_harvest(asset_symbol, domain, stored=stored)
 
+    def record_harvest_bulk(self, asset_symbol: str, outcomes: Sequence[tuple[str, bool]]) -> None:
+        self._repo.record_harvest_bulk(asset_symbol, outcomes)
+
     def record_llm_decision(self, *, asset_symbol: str, domain: str, relevant: bool) -> None:
-        self._repo.record_llm_decision(asset_symbol, domain, accepted=relevant)
\ No newline at end of file
+        self._repo.record_llm_decision(asset_symbol, domain, accepted=relevant)
+
+    def flush(self) -> None:
+        self._repo.flush()
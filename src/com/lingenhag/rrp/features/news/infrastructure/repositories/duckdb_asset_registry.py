@@ -1,7 +1,7 @@
 # src/com/lingenhag/rrp/features/news/infrastructure/repositories/duckdb_asset_registry.py
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Optional, Sequence
 
 import duckdb
 
@@ -15,11 +15,19 @@ class DuckDBAssetRegistryRepository(AssetRegistryPort):
       - asset_aliases(symbol TEXT, alias TEXT)
       - asset_negative_terms(symbol TEXT, term TEXT)
     """
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, *, conn: Optional[duckdb.DuckDBPyConnection] = None) -> None:
         self.db_path = db_path
+        # Optional gemeinsame Verbindung des Aufrufers (schließt dieser selbst).
+        self._owns_con = conn is None
+        self._con = duckdb.connect(db_path) if conn is None else conn
+
+    def close(self) -> None:
+        if self._owns_con:
+            self._con.close()
 
     def _connect(self) -> duckdb.DuckDBPyConnection:
-        con = duckdb.connect(self.db_path)
+        # Cursor auf der persistenten Verbindung; Settings gelten pro Cursor.
+        con = self._con.cursor()
         try:
             con.execute("SET TimeZone='UTC'")
         except Exception:
@@ -1,17 +1,42 @@
 # src/com/lingenhag/rrp/features/news/infrastructure/repositories/duckdb_domain_policy_repository.py
 from __future__ import annotations
 
+import threading
+from collections import defaultdict
+
 import duckdb
 from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Spaltenreihenfolge im Zähler-Puffer: [harvested, stored, llm_accepted, llm_rejected]
+_COUNTER_COLS = ("harvested_total", "stored_total", "llm_accepted", "llm_rejected")
 
 
 class DuckDBDomainPolicyRepository:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        flush_threshold: int = 1000,
+        conn: Optional[duckdb.DuckDBPyConnection] = None,
+    ) -> None:
         self.db_path = db_path
+        # Persistente (ggf. vom Aufrufer geteilte) Verbindung; pro Aufruf nur ein Cursor.
+        self._owns_con = conn is None
+        self._con = duckdb.connect(db_path) if conn is None else conn
+        # Zähler werden im Speicher gesammelt und per flush() gebündelt geschrieben.
+        self._counter_buffer: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        self._buffer_lock = threading.Lock()
+        self._flush_threshold = max(1, flush_threshold)
         self._ensure_schema()
 
-    def _connect(self):
-        return duckdb.connect(self.db_path)
+    def close(self) -> None:
+        self.flush()
+        if self._owns_con:
+            self._con.close()
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        return self._con.cursor()
 
     def _ensure_schema(self) -> None:
         with self._connect() as con:
@@ -60,6 +85,19 @@ class DuckDBDomainPolicyRepository:
             # Fail-open
             return True
 
+    def load_policies(self, asset_symbol: str) -> Dict[str, bool]:
+        """Alle Policies eines Assets als {domain: allowed} (ein SELECT statt einer Abfrage pro URL)."""
+        try:
+            with self._connect() as con:
+                rows = con.execute(
+                    "SELECT domain, allowed FROM news_domain_policy WHERE asset_symbol = ?",
+                    (asset_symbol,),
+                ).fetchall()
+        except duckdb.Error:
+            # Fail-open: ohne Policies ist alles erlaubt
+            return {}
+        return {domain: bool(allowed) for domain, allowed in rows}
+
     def allow(self, asset_symbol: str, domain: str, allowed: bool = True) -> None:
         with self._connect() as con:
             now = self._now()
@@ -75,31 +113,50 @@ class DuckDBDomainPolicyRepository:
 
     # ---------- Stats (low-level) ----------
     def bump_harvested(self, asset_symbol: str, domain: str, by: int = 1) -> None:
-        self._upsert_counter(asset_symbol, domain, "harvested_total", by)
+        self._bump(asset_symbol, domain, 0, by)
 
     def bump_stored(self, asset_symbol: str, domain: str, by: int = 1) -> None:
-        self._upsert_counter(asset_symbol, domain, "stored_total", by)
+        self._bump(asset_symbol, domain, 1, by)
 
     def bump_llm_accepted(self, asset_symbol: str, domain: str, by: int = 1) -> None:
-        self._upsert_counter(asset_symbol, domain, "llm_accepted", by)
+        self._bump(asset_symbol, domain, 2, by)
 
     def bump_llm_rejected(self, asset_symbol: str, domain: str, by: int = 1) -> None:
-        self._upsert_counter(asset_symbol, domain, "llm_rejected", by)
-
-    def _upsert_counter(self, asset_symbol: str, domain: str, col: str, by: int) -> None:
+        self._bump(asset_symbol, domain, 3, by)
+
+    def _bump(self, asset_symbol: str, domain: str, idx: int, by: int) -> None:
+        with self._buffer_lock:
+            self._counter_buffer[(asset_symbol, domain)][idx] += by
+            full = len(self._counter_buffer) >= self._flush_threshold
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Schreibt den Zähler-Puffer mit einem executemany-Upsert in einer Transaktion."""
+        with self._buffer_lock:
+            if not self._counter_buffer:
+                return
+            buffered = self._counter_buffer
+            self._counter_buffer = defaultdict(lambda: [0, 0, 0, 0])
+        rows = [(asset, domain, *counts) for (asset, domain), counts in buffered.items()]
+        updates = ",\n".join(f"{c} = news_domain_stats.{c} + excluded.{c}" for c in _COUNTER_COLS)
         with self._connect() as con:
-            con.execute(
-                """
-                INSERT INTO news_domain_stats (asset_symbol, domain, harvested_total, stored_total, llm_accepted, llm_rejected)
-                VALUES (?, ?, 0, 0, 0, 0)
-                    ON CONFLICT (asset_symbol, domain) DO NOTHING
-                """,
-                (asset_symbol, domain),
-            )
-            con.execute(
-                f"UPDATE news_domain_stats SET {col} = {col} + ? WHERE asset_symbol = ? AND domain = ?",
-                (by, asset_symbol, domain),
-            )
+            try:
+                con.begin()
+                con.executemany(
+                    f"""
+                    INSERT INTO news_domain_stats (asset_symbol, domain, {", ".join(_COUNTER_COLS)})
+                    VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (asset_symbol, domain) DO UPDATE SET {updates}
+                    """,
+                    rows,
+                )
+                con.commit()
+            except Exception:
+                con.rollback()
+                # Zähler nicht verlieren: für den nächsten flush() zurücklegen.
+                self._merge_into_buffer(buffered)
+                raise
 
     # ---------- Stats (high-level, NEU) ----------
     def record_harvest(self, asset_symbol: str, domain: str, *, stored: bool) -> None:
@@ -108,8 +165,33 @@ class DuckDBDomainPolicyRepository:
         if stored:
             self.bump_stored(asset_symbol, domain, 1)
 
+    def record_harvest_bulk(self, asset_symbol: str, outcomes: Iterable[Tuple[str, bool]]) -> None:
+        """Wie record_harvest, aber pro Domain aggregiert; schreibt den Puffer sofort weg."""
+        deltas: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        for domain, stored in outcomes:
+            c = deltas[(asset_symbol, domain)]
+            c[0] += 1
+            if stored:
+                c[1] += 1
+        self.flush_counters(deltas)
+
+    def flush_counters(self, deltas: Mapping[Tuple[str, str], Sequence[int]]) -> None:
+        """
+        Verbucht bereits aggregierte Deltas {(asset, domain): [harvested, stored, accepted, rejected]}
+        zusammen mit dem Puffer in einem Upsert.
+        """
+        self._merge_into_buffer(deltas)
+        self.flush()
+
+    def _merge_into_buffer(self, deltas: Mapping[Tuple[str, str], Sequence[int]]) -> None:
+        with self._buffer_lock:
+            for key, counts in deltas.items():
+                acc = self._counter_buffer[key]
+                for i, v in enumerate(counts):
+                    acc[i] += v
+
     def record_llm_decision(self, asset_symbol: str, domain: str, *, accepted: bool) -> None:
-        """LLM-Entscheidungen verbuchen."""
+        """LLM-Entscheidungen verbuchen (gepuffert, siehe flush())."""
         if accepted:
             self.bump_llm_accepted(asset_symbol, domain, 1)
         else:
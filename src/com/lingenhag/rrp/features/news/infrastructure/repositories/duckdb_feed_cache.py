@@ -0,0 +1,65 @@
+# src/com/lingenhag/rrp/features/news/infrastructure/repositories/duckdb_feed_cache.py
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence, Tuple
+
+import duckdb
+
+from com.lingenhag.rrp.features.news.application.ports import FeedCachePort, FeedEntry
+
+
+class DuckDBFeedCacheRepository(FeedCachePort):
+    """
+    Persistiert Conditional-GET-Zustand von RSS-Feeds in DuckDB.
+    Erwartet Tabelle:
+      - rss_feed_cache(feed_url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, entries TEXT, fetched_at TIMESTAMP)
+    """
+    def __init__(self, db_path: str, *, conn: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+        self.db_path = db_path
+        # Optional gemeinsame Verbindung des Aufrufers (schließt dieser selbst).
+        self._owns_con = conn is None
+        self._con = duckdb.connect(db_path) if conn is None else conn
+
+    def close(self) -> None:
+        if self._owns_con:
+            self._con.close()
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        # Cursor auf der persistenten Verbindung; Settings gelten pro Cursor.
+        con = self._con.cursor()
+        try:
+            con.execute("SET TimeZone='UTC'")
+        except Exception:
+            pass
+        return con
+
+    def get(self, feed_url: str) -> Optional[Tuple[Optional[str], Optional[str], List[FeedEntry]]]:
+        with self._connect() as con:
+            row = con.execute(
+                "SELECT etag, last_modified, entries FROM rss_feed_cache WHERE feed_url = ?",
+                (feed_url,),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, entries = row
+        return etag, last_modified, [tuple(e) for e in json.loads(entries)]
+
+    def put(
+            self, feed_url: str, etag: Optional[str], last_modified: Optional[str], entries: Sequence[FeedEntry]
+    ) -> None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with self._connect() as con:
+            con.execute(
+                """
+                INSERT INTO rss_feed_cache (feed_url, etag, last_modified, entries, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (feed_url) DO UPDATE
+                                              SET etag = excluded.etag,
+                                                  last_modified = excluded.last_modified,
+                                                  entries = excluded.entries,
+                                                  fetched_at = excluded.fetched_at
+                """,
+                (feed_url, etag, last_modified, json.dumps([list(e) for e in entries]), now),
+            )
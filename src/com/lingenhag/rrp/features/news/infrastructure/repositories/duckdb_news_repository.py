@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
+import queue
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 import duckdb
 
@@ -18,17 +20,43 @@ class DuckDBNewsRepository(NewsRepositoryPort):
     """
     Persistence adapter for news using DuckDB.
     - Stores all timestamps as **UTC-naive** TIMESTAMP (session TZ = UTC).
-    - Normalizes incoming aware datetimes to UTC and strips tzinfo.
+    - Binds datetimes as-is: DuckDB converts aware values to UTC via the session TZ,
+      naive values are taken as UTC already.
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+            self,
+            db_path: str,
+            *,
+            conn: Optional[duckdb.DuckDBPyConnection] = None,
+            pool_size: int = 4,
+    ) -> None:
         self.db_path = db_path
+        # One database handle per repository (or one shared by the caller via `conn`);
+        # calls borrow pooled cursors on it instead of re-opening the file each time.
+        self._owns_con = conn is None
+        self._con = duckdb.connect(db_path) if conn is None else conn
+        # Idle cursors (timezone already set), reused across calls; at most pool_size are kept.
+        self._pool: "queue.Queue[duckdb.DuckDBPyConnection]" = queue.Queue(maxsize=max(1, pool_size))
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        # A shared handle belongs to the caller and is closed there.
+        if self._owns_con:
+            self._con.close()
 
     # ----------------------------------
     # Internal
     # ----------------------------------
-    def _connect(self) -> duckdb.DuckDBPyConnection:
-        con = duckdb.connect(self.db_path)
+    def _new_cursor(self) -> duckdb.DuckDBPyConnection:
+        # A cursor is an independent connection to the same database: safe to
+        # use from worker threads. Settings are per cursor, so the timezone
+        # is set once when the cursor is created.
+        con = self._con.cursor()
         try:
             # Critical: Set session timezone to UTC for naive TIMESTAMP interpretation.
             con.execute("SET TimeZone='UTC'")
@@ -36,14 +64,26 @@ class DuckDBNewsRepository(NewsRepositoryPort):
             logger.warning(f"Failed to set UTC timezone: {e}")
         return con
 
-    @staticmethod
-    def _to_utc_naive(dt: Optional[datetime]) -> Optional[datetime]:
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            # Assumption: already UTC-naive
-            return dt
-        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    @contextmanager
+    def _connect(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Borrows a cursor from the pool (or creates one if all are in use) and
+        returns it afterwards. A cursor whose block raised is closed instead,
+        so no half-finished transaction state is handed to the next caller.
+        """
+        try:
+            con = self._pool.get_nowait()
+        except queue.Empty:
+            con = self._new_cursor()
+        try:
+            yield con
+        except BaseException:
+            con.close()
+            raise
+        try:
+            self._pool.put_nowait(con)
+        except queue.Full:
+            con.close()
 
     # ----------------------------------
     # Port Implementations
@@ -68,47 +108,32 @@ class DuckDBNewsRepository(NewsRepositoryPort):
             - is_duplicate: True if (a) or (b) applies; else False.
         """
         with self._connect() as con:
-            try:
-                con.begin()  # Start transaction for atomicity
-
-                # (b) Already processed (summarized_articles) or rejected?
-                #     -> Do not re-add to inbox.
-                already_processed = con.execute(
-                    """
-                    SELECT 1 FROM summarized_articles
+            # (a)/(b) in one lookup: kind 1 = processed, 2 = rejected, 3 = already harvested.
+            hit = con.execute(
+                """
+                SELECT kind, id FROM (
+                    SELECT 1 AS kind, NULL::INTEGER AS id FROM summarized_articles
                     WHERE url = ? AND asset_symbol = ?
-                        LIMIT 1
-                    """,
-                    (url, asset_symbol),
-                ).fetchone()
-
-                already_rejected = None
-                if already_processed is None:
-                    already_rejected = con.execute(
-                        """
-                        SELECT 1 FROM rejections
-                        WHERE url = ? AND asset_symbol = ?
-                            LIMIT 1
-                        """,
-                        (url, asset_symbol),
-                    ).fetchone()
-
-                if already_processed is not None or already_rejected is not None:
-                    # Already known (processed or rejected) -> count as duplicate.
-                    return 0, True
-
-                # (a) Already in url_harvests?
-                existing = con.execute(
-                    "SELECT id FROM url_harvests WHERE url = ? AND asset_symbol = ?",
-                    (url, asset_symbol),
-                ).fetchone()
-                if existing:
-                    return existing[0], True
+                    UNION ALL
+                    SELECT 2, NULL FROM rejections
+                    WHERE url = ? AND asset_symbol = ?
+                    UNION ALL
+                    SELECT 3, id FROM url_harvests
+                    WHERE url = ? AND asset_symbol = ?
+                )
+                ORDER BY kind
+                LIMIT 1
+                """,
+                (url, asset_symbol) * 3,
+            ).fetchone()
+            if hit is not None:
+                # Processed/rejected -> (0, True); existing harvest -> (id, True)
+                return (hit[1], True) if hit[0] == 3 else (0, True)
 
-                # Insert new
-                pa = self._to_utc_naive(published_at)
-                discovered = self._to_utc_naive(datetime.now(timezone.utc))
+            discovered = datetime.now(timezone.utc)
 
+            try:
+                con.begin()
                 row = con.execute(
                     """
                     INSERT INTO url_harvests
@@ -116,7 +141,7 @@ class DuckDBNewsRepository(NewsRepositoryPort):
                     VALUES (?, ?, ?, ?, ?, ?)
                         RETURNING id
                     """,
-                    (url, asset_symbol, source, pa, title, discovered),
+                    (url, asset_symbol, source, published_at, title, discovered),
                 ).fetchone()
                 con.commit()
                 return row[0], False
@@ -126,6 +151,110 @@ class DuckDBNewsRepository(NewsRepositoryPort):
                 logger.error(f"Failed to save URL harvest for {url}: {e}")
                 raise
 
+    def existing_urls(self, asset_symbol: str, since: Optional[datetime] = None) -> Set[str]:
+        """
+        Returns the URLs already known for the asset, i.e. what save_url_harvest
+        would treat as a duplicate. With `since`, only rows discovered/ingested/
+        rejected at or after that instant are returned (bounded memory for the
+        pre-filter; older duplicates are still caught by filter_existing).
+        """
+        with self._connect() as con:
+            rows = con.execute(
+                """
+                SELECT url FROM url_harvests
+                WHERE asset_symbol = ? AND (?::TIMESTAMP IS NULL OR discovered_at >= ?::TIMESTAMP)
+                UNION
+                SELECT url FROM summarized_articles
+                WHERE asset_symbol = ? AND (?::TIMESTAMP IS NULL OR ingested_at >= ?::TIMESTAMP)
+                UNION
+                SELECT url FROM rejections
+                WHERE asset_symbol = ? AND url IS NOT NULL AND (?::TIMESTAMP IS NULL OR created_at >= ?::TIMESTAMP)
+                """,
+                (asset_symbol, since, since) * 3,
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def filter_existing(self, asset_symbol: str, urls: Sequence[str]) -> Set[str]:
+        """
+        Returns the subset of `urls` already known for the asset (same sources as
+        existing_urls), resolved with a single query for the whole batch.
+        """
+        if not urls:
+            return set()
+        with self._connect() as con:
+            rows = con.execute(
+                """
+                WITH batch AS (SELECT DISTINCT UNNEST(?::TEXT[]) AS url)
+                SELECT b.url FROM batch b
+                WHERE EXISTS (SELECT 1 FROM url_harvests h WHERE h.url = b.url AND h.asset_symbol = ?)
+                   OR EXISTS (SELECT 1 FROM summarized_articles sa WHERE sa.url = b.url AND sa.asset_symbol = ?)
+                   OR EXISTS (SELECT 1 FROM rejections r WHERE r.url = b.url AND r.asset_symbol = ?)
+                """,
+                (list(urls), asset_symbol, asset_symbol, asset_symbol),
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def save_url_harvests_bulk(
+            self,
+            rows: Sequence[Tuple[str, str, Optional[str], Optional[datetime], Optional[str]]],
+    ) -> Set[str]:
+        """
+        Bulk variant of save_url_harvest for (url, asset_symbol, source, published_at, title).
+
+        Same duplicate rules as the single-row path (url_harvests, summarized_articles,
+        rejections), but as a single INSERT ... SELECT with ON CONFLICT DO NOTHING.
+        Repeated (url, asset_symbol) pairs inside the batch are inserted once.
+
+        Returns:
+            Set of URLs that were newly inserted.
+        """
+        unique: Dict[Tuple[str, str], Tuple[str, str, Optional[str], Optional[datetime], Optional[str]]] = {}
+        for url, asset_symbol, source, published_at, title in rows:
+            unique.setdefault(
+                (url, asset_symbol),
+                (url, asset_symbol, source, published_at, title),
+            )
+        if not unique:
+            return set()
+
+        urls, assets, sources, published, titles = (list(c) for c in zip(*unique.values()))
+        discovered = datetime.now(timezone.utc)
+
+        with self._connect() as con:
+            try:
+                con.begin()
+                inserted = con.execute(
+                    """
+                    INSERT INTO url_harvests
+                        (url, asset_symbol, source, published_at, title, discovered_at)
+                    SELECT n.url, n.asset_symbol, n.source, n.published_at, n.title, ?
+                    FROM (
+                        SELECT UNNEST(?::TEXT[])      AS url,
+                               UNNEST(?::TEXT[])      AS asset_symbol,
+                               UNNEST(?::TEXT[])      AS source,
+                               UNNEST(?::TIMESTAMP[]) AS published_at,
+                               UNNEST(?::TEXT[])      AS title
+                    ) n
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM summarized_articles sa
+                        WHERE sa.url = n.url AND sa.asset_symbol = n.asset_symbol
+                    )
+                      AND NOT EXISTS (
+                        SELECT 1 FROM rejections r
+                        WHERE r.url = n.url AND r.asset_symbol = n.asset_symbol
+                    )
+                    ON CONFLICT (url, asset_symbol) DO NOTHING
+                    RETURNING url
+                    """,
+                    (discovered, urls, assets, sources, published, titles),
+                ).fetchall()
+                con.commit()
+            except Exception as e:
+                con.rollback()
+                logger.error(f"Failed to bulk save {len(unique)} URL harvests: {e}")
+                raise
+        return {r[0] for r in inserted}
+
     def save_summarized_article(self, article: SummarizedArticle) -> int:
         """
         Saves a summarized article with sentiment.
@@ -134,8 +263,7 @@ class DuckDBNewsRepository(NewsRepositoryPort):
         with self._connect() as con:
             try:
                 con.begin()
-                ingested = self._to_utc_naive(article.ingested_at or datetime.now(timezone.utc))
-                pa = self._to_utc_naive(article.published_at)
+                ingested = article.ingested_at or datetime.now(timezone.utc)
 
                 row = con.execute(
                     """
@@ -146,7 +274,7 @@ class DuckDBNewsRepository(NewsRepositoryPort):
                     """,
                     (
                         article.url,
-                        pa,
+                        article.published_at,
                         article.summary,
                         article.asset_symbol,
                         article.source,
@@ -180,7 +308,7 @@ class DuckDBNewsRepository(NewsRepositoryPort):
         with self._connect() as con:
             try:
                 con.begin()
-                created = self._to_utc_naive(datetime.now(timezone.utc))
+                created = datetime.now(timezone.utc)
                 row = con.execute(
                     """
                     INSERT INTO rejections
@@ -243,27 +371,27 @@ class DuckDBNewsRepository(NewsRepositoryPort):
                     """
             if since_utc is not None:
                 query += " AND discovered_at >= ?"
-                params.append(self._to_utc_naive(since_utc))
+                params.append(since_utc)
             query += " ORDER BY discovered_at ASC LIMIT ?"
             params.append(int(limit))
 
             rows = con.execute(query, params).fetchall()
 
-            harvests = []
-            for row in rows:
-                published_at = self.parse_datetime(row[4])
-                discovered_at = self.parse_datetime(row[6])
-                harvest = {
-                    "id": row[0],
-                    "url": row[1],
-                    "asset_symbol": row[2],
-                    "source": row[3],
-                    "published_at": published_at,
-                    "title": row[5],
-                    "discovered_at": discovered_at,
-                }
-                harvests.append(harvest)
-            return harvests
+        # TIMESTAMP columns come back as naive datetimes (session TZ = UTC),
+        # so tagging tzinfo is enough; no generic parse_datetime per value.
+        utc = timezone.utc
+        return [
+            {
+                "id": hid,
+                "url": url,
+                "asset_symbol": sym,
+                "source": source,
+                "published_at": published.replace(tzinfo=utc) if published is not None else None,
+                "title": title,
+                "discovered_at": discovered.replace(tzinfo=utc) if discovered is not None else None,
+            }
+            for hid, url, sym, source, published, title, discovered in rows
+        ]
 
     def fetch_rejections(self, asset_symbol: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -282,17 +410,18 @@ class DuckDBNewsRepository(NewsRepositoryPort):
                 (asset_symbol, int(limit)),
             ).fetchall()
 
-            return [
-                {
-                    "id": row[0],
-                    "url": row[1],
-                    "reason": row[2],
-                    "source": row[3],
-                    "context": row[4],
-                    "created_at": self.parse_datetime(row[5]),
-                }
-                for row in rows
-            ]
+        utc = timezone.utc
+        return [
+            {
+                "id": rid,
+                "url": url,
+                "reason": reason,
+                "source": source,
+                "context": context,
+                "created_at": created.replace(tzinfo=utc) if created is not None else None,
+            }
+            for rid, url, reason, source, context, created in rows
+        ]
 
     def delete_url_harvest(self, harvest_id: int) -> None:
         """Deletes a processed URL harvest."""
@@ -0,0 +1,72 @@
+# src/com/lingenhag/rrp/features/news/infrastructure/repositories/duckdb_resolved_url_cache.py
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence, Tuple
+
+import duckdb
+
+from com.lingenhag.rrp.features.news.application.ports import ResolvedUrlCachePort
+
+
+class DuckDBResolvedUrlCacheRepository(ResolvedUrlCachePort):
+    """
+    Persistiert aufgelöste RSS-Redirects in DuckDB.
+    Erwartet Tabelle:
+      - rss_resolved_urls(rss_link TEXT PRIMARY KEY, final_url TEXT, fetched_at TIMESTAMP)
+    """
+    def __init__(self, db_path: str, *, conn: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+        self.db_path = db_path
+        # Optional gemeinsame Verbindung des Aufrufers (schließt dieser selbst).
+        self._owns_con = conn is None
+        self._con = duckdb.connect(db_path) if conn is None else conn
+
+    def close(self) -> None:
+        if self._owns_con:
+            self._con.close()
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        # Cursor auf der persistenten Verbindung; Settings gelten pro Cursor.
+        con = self._con.cursor()
+        try:
+            con.execute("SET TimeZone='UTC'")
+        except Exception:
+            pass
+        return con
+
+    def get_many(self, links: Sequence[str]) -> Dict[str, str]:
+        unique = list(dict.fromkeys(l for l in links if l))
+        if not unique:
+            return {}
+        with self._connect() as con:
+            rows = con.execute(
+                """
+                SELECT r.rss_link, r.final_url
+                FROM rss_resolved_urls r
+                WHERE r.rss_link IN (SELECT UNNEST(?::TEXT[]))
+                """,
+                (unique,),
+            ).fetchall()
+        return {link: final for link, final in rows}
+
+    def put_many(self, pairs: Sequence[Tuple[str, str]]) -> None:
+        rows = list(dict(p for p in pairs if p[0] and p[1]).items())
+        if not rows:
+            return
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with self._connect() as con:
+            try:
+                con.begin()
+                con.executemany(
+                    """
+                    INSERT INTO rss_resolved_urls (rss_link, final_url, fetched_at)
+                    VALUES (?, ?, ?)
+                        ON CONFLICT (rss_link) DO UPDATE
+                                                  SET final_url = excluded.final_url, fetched_at = excluded.fetched_at
+                    """,
+                    [(link, final, now) for link, final in rows],
+                )
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Set
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -17,17 +18,28 @@ class QuerySpec:
     negative_terms: Sequence[str] = ()
     min_token_quote_len: int = 4
 
+    def __post_init__(self) -> None:
+        # Sequenzen als Tupel fixieren: Spec wird hashbar und taugt als Cache-Key
+        for name in ("aliases", "extra_positive_terms", "negative_terms"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value or ()))
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def canonical(cls, symbol: str, require_crypto_context: bool = True) -> "QuerySpec":
+        """Eine gemeinsame Instanz pro Symbol/Kontext (ohne Aliases/Negativbegriffe)."""
+        return cls(asset_symbol=symbol.upper(), require_crypto_context=require_crypto_context)
+
 
 def _norm_terms(terms: Iterable[str]) -> List[str]:
-    seen: Set[str] = set()
-    out: List[str] = []
+    # Ein Dict (Einfügereihenfolge) statt set + list: lower() einmal, erstes Vorkommen gewinnt
+    seen: Dict[str, str] = {}
     for t in terms:
         t = (t or "").strip()
-        if not t or t.lower() in seen:
-            continue
-        seen.add(t.lower())
-        out.append(t)
-    return out
+        if t:
+            seen.setdefault(t.lower(), t)
+    return list(seen.values())
 
 
 def _render_term(t: str, *, min_quote_len: int) -> str:
@@ -40,22 +52,35 @@ def _render_term(t: str, *, min_quote_len: int) -> str:
     return t
 
 
+# Harte Synonyme je Symbol (Großschreibung); Erweiterung = neuer Eintrag, kein neuer Branch
+_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "BTC": ("Bitcoin",),
+    "ETH": ("Ethereum",),
+    "DOT": ("Polkadot",),
+    "SOL": ("Solana",),
+}
+
+
 def _symbol_synonyms(symbol: str) -> List[str]:
     sym = (symbol or "").strip()
     if not sym:
         return []
-    out = [sym, sym.upper(), sym.lower()]
-    if sym.upper() == "BTC":
-        out.append("Bitcoin")
-    if sym.upper() == "ETH":
-        out.append("Ethereum")
-    if sym.upper() == "DOT":
-        out.append("Polkadot")
-    if sym.upper() == "SOL":
-        out.append("Solana")
-    return _norm_terms(out)
+    u = sym.upper()
+    return _norm_terms([sym, u, sym.lower(), *_SYNONYMS.get(u, ())])
+
+
+# Krypto-Kontext ist konstant -> fertiger Block einmal beim Import
+_CRYPTO_CTX_BLOCK = "(crypto OR cryptocurrency OR blockchain OR token OR defi OR nft)"
 
 
+def _or_block(terms: Sequence[str], min_quote_len: int) -> Optional[str]:
+    rendered = [r for t in terms if (r := _render_term(t, min_quote_len=min_quote_len))]
+    if not rendered:
+        return None
+    return rendered[0] if len(rendered) == 1 else "(" + " OR ".join(rendered) + ")"
+
+
+@lru_cache(maxsize=256)
 def build_boolean_core(spec: QuerySpec) -> str:
     """
     Baut den kombinierten Boolean-Query-String, der in GDELT/Google News
@@ -63,37 +88,21 @@ def build_boolean_core(spec: QuerySpec) -> str:
     Struktur:
       (aliases/symbole) AND (crypto-kontext) [AND extra] [NOT negatives]
     """
-    positives = _norm_terms([*_symbol_synonyms(spec.asset_symbol), *spec.aliases, *spec.extra_positive_terms])
-    crypto_ctx = ["crypto", "cryptocurrency", "blockchain", "token", "defi", "nft"] if spec.require_crypto_context else []
-    negatives = _norm_terms(spec.negative_terms)
-
-    def or_block(terms: Sequence[str]) -> Optional[str]:
-        if not terms:
-            return None
-        rendered = [_render_term(t, min_quote_len=spec.min_token_quote_len) for t in terms]
-        rendered = [t for t in rendered if t]
-        if not rendered:
-            return None
-        return "(" + " OR ".join(rendered) + ")" if len(rendered) > 1 else rendered[0]
-
-    must_pos = or_block(positives)
-    must_ctx = or_block(crypto_ctx)
-    not_block = or_block(negatives)
-
+    mql = spec.min_token_quote_len
     parts: List[str] = []
-    if must_pos:
-        parts.append(must_pos)
-    if must_ctx:
-        parts.append(must_ctx)
-    if spec.extra_positive_terms:
-        extra_block = or_block(spec.extra_positive_terms)
-        if extra_block:
-            parts.append(extra_block)
-    if not_block:
-        parts.append(f"NOT {not_block}")
+    if block := _or_block(
+            _norm_terms([*_symbol_synonyms(spec.asset_symbol), *spec.aliases, *spec.extra_positive_terms]), mql
+    ):
+        parts.append(block)
+    if spec.require_crypto_context:
+        parts.append(_CRYPTO_CTX_BLOCK)
+    if spec.extra_positive_terms and (block := _or_block(spec.extra_positive_terms, mql)):
+        parts.append(block)
+    if block := _or_block(_norm_terms(spec.negative_terms), mql):
+        parts.append(f"NOT {block}")
 
     if not parts:
-        parts.append(_render_term(spec.asset_symbol, min_quote_len=spec.min_token_quote_len))
+        parts.append(_render_term(spec.asset_symbol, min_quote_len=mql))
 
     return " AND ".join(parts)
 
@@ -103,5 +112,11 @@ def build_gdelt_query(spec: QuerySpec) -> str:
 
 
 def build_google_news_query(spec: QuerySpec, *, start_iso_date: str, end_iso_date: str) -> str:
+    # Kern kommt aus dem Cache; die Datumsvariante bewusst nicht cachen (unbeschränkte Keys)
     core = build_boolean_core(spec)
-    return f"{core} after:{start_iso_date} before:{end_iso_date}"
\ No newline at end of file
+    return f"{core} after:{start_iso_date} before:{end_iso_date}"
+
+
+def cache_clear() -> None:
+    """Leert den Query-Cache (Tests, geänderte Synonyme)."""
+    build_boolean_core.cache_clear()
\ No newline at end of file
@@ -1,18 +1,40 @@
 # src/com/lingenhag/rrp/features/news/infrastructure/sources/base_source.py
 from __future__ import annotations
 
-from typing import Any, Dict, Sequence
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Iterator, List, Sequence
 
 from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO, NewsSourcePort
 
 
+@dataclass(frozen=True, slots=True)
 class BaseNewsSource(NewsSourcePort):
-    SOURCE_NAME: str = "base"
+    SOURCE_NAME: ClassVar[str] = "base"
 
-    def __init__(self, client):
-        self.client = client
-        self.storage_name = self.SOURCE_NAME
+    client: Any
+    storage_name: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # frozen → Zuweisung nur über object.__setattr__
+        object.__setattr__(self, "storage_name", self.SOURCE_NAME)
 
     def fetch_documents(self, criteria: HarvestCriteriaDTO) -> Sequence[Dict[str, Any]]:
         # Direkte Rückgabe von List[Dict] aus dem jeweiligen Client.
-        return self.client.fetch_documents(criteria)
\ No newline at end of file
+        return self.client.fetch_documents(criteria)
+
+    def build_query_core(self, asset_symbol: str) -> str:
+        return self.client.build_query_core(asset_symbol)
+
+    def iter_documents(self, criteria: HarvestCriteriaDTO) -> Iterator[List[Dict[str, Any]]]:
+        # Batches, falls der Client streamen kann; sonst ein einziger Batch.
+        iter_client = getattr(self.client, "iter_documents", None)
+        if iter_client is not None:
+            yield from iter_client(criteria)
+        else:
+            yield list(self.client.fetch_documents(criteria))
+
+    def close(self) -> None:
+        # Ressourcen des Clients (Session, Browser, Worker) freigeben, falls vorhanden.
+        close_client = getattr(self.client, "close", None)
+        if close_client is not None:
+            close_client()
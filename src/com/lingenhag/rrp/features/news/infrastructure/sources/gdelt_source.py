@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from com.lingenhag.rrp.features.news.infrastructure.sources.base_source import BaseNewsSource
 from com.lingenhag.rrp.features.news.infrastructure.gdelt_client import GdeltClient
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GdeltNewsSource(BaseNewsSource):
     client: GdeltClient
-    SOURCE_NAME: str = "gdelt_news"
\ No newline at end of file
+    SOURCE_NAME: ClassVar[str] = "gdelt_news"
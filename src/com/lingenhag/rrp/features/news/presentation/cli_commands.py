@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -15,9 +16,11 @@ from com.lingenhag.rrp.features.news.application.usecases.harvest_urls import Ha
 from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
 from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_news_repository import DuckDBNewsRepository
 from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_domain_policy_repository import DuckDBDomainPolicyRepository
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_resolved_url_cache import DuckDBResolvedUrlCacheRepository
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_feed_cache import DuckDBFeedCacheRepository
 from com.lingenhag.rrp.features.news.infrastructure.repositories.domain_policy_adapter import DomainPolicyAdapter
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
-from com.lingenhag.rrp.platform.persistence.migrator import apply_migrations
+from com.lingenhag.rrp.platform.persistence.migrator import apply_migrations, pending_migrations
 
 _LOG = logging.getLogger(__name__)
 
@@ -62,10 +65,12 @@ def add_news_subparser(root_subparsers: argparse._SubParsersAction[argparse.Argu
 
 
 def _parse_iso(value: str) -> datetime:
-    v = value.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(v)
+    try:
+        dt = datetime.fromisoformat(value)  # ab 3.11 inkl. "Z" – ohne String-Kopie
+    except ValueError:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
@@ -84,39 +89,49 @@ def _build_time_range(days: int, date_from: Optional[str], date_to: Optional[str
     return now - timedelta(days=days), now
 
 
+_MIGRATIONS_PATH = Path("src/com/lingenhag/rrp/platform/persistence/migrations")
+
+# Prozess-Cache: DB-Pfade (absolut), deren Migrationsstand bereits geprüft wurde
+_SCHEMA_OK: set[str] = set()
+
+
 def _ensure_schema(db_path: str, auto_migrate: bool) -> None:
     """
-    Minimal-Check: Wenn `assets` fehlt, laufen die News-Migrationen (001..005) einmalig durch.
-    Hinweis: Market-Migrationen (003, 006, 007) sind für Harvest nicht notwendig.
+    Prüft den Migrationsstand über die `migrations`-Tabelle (ein SELECT, kein Katalog-Scan)
+    und wendet nur an, wenn Dateien ausstehen. Ergebnis wird pro Prozess gecacht.
     """
     if not auto_migrate:
         _LOG.info("Skipping schema check as --auto-migrate is not set")
         return
+    key = str(Path(db_path).resolve())
+    if key in _SCHEMA_OK:
+        return
     try:
-        repo = DuckDBNewsRepository(db_path=db_path)
-        with repo._connect() as con:
-            tables = con.execute("SHOW TABLES").fetchall()
-            table_names = {row[0] for row in tables}
-            if "assets" not in table_names:
-                migrations_path = Path("src/com/lingenhag/rrp/platform/persistence/migrations")
-                applied = apply_migrations(db_path, str(migrations_path))
-                if applied:
-                    _LOG.info("[migrate] Applied: %s", ", ".join(applied))
-                else:
-                    raise RuntimeError("Schema initialization failed")
-            else:
-                _LOG.info("Schema OK")
-    except duckdb.IOException as e:
-        raise SystemExit(f"Database error: {e}") from e
-    except Exception as e:
-        # Falls der erste Check fehlschlägt, versuche es proaktiv mit den Migrationen.
-        _LOG.warning("Schema check failed (%s), trying migrations", e)
-        migrations_path = Path("src/com/lingenhag/rrp/platform/persistence/migrations")
-        applied = apply_migrations(db_path, str(migrations_path))
-        if applied:
+        pending = pending_migrations(db_path, str(_MIGRATIONS_PATH))
+        if pending:
+            applied = apply_migrations(db_path, str(_MIGRATIONS_PATH))
+            if not applied:
+                raise SystemExit("Schema initialization failed")
             _LOG.info("[migrate] Applied: %s", ", ".join(applied))
         else:
-            raise SystemExit("Schema initialization failed")
+            _LOG.info("Schema OK")
+        _SCHEMA_OK.add(key)
+    except duckdb.IOException as e:
+        raise SystemExit(f"Database error: {e}") from e
+
+
+def _open_connection(db_path: str, config: Settings) -> duckdb.DuckDBPyConnection:
+    """
+    Eine Verbindung pro Lauf, geteilt von allen Repositories (ein Buffer-Pool,
+    einmaliger Verbindungsaufbau). Threads/Memory-Limit optional über `database.*`.
+    """
+    con = duckdb.connect(db_path)
+    threads = int(config.get("database", "threads", os.cpu_count() or 1))
+    con.execute(f"PRAGMA threads={max(1, threads)}")
+    memory_limit = config.get("database", "memory_limit", None)
+    if memory_limit:
+        con.execute(f"PRAGMA memory_limit='{memory_limit}'")
+    return con
 
 
 def _cmd_news_harvest(args: argparse.Namespace, *, config: Settings, metrics: Metrics) -> None:
@@ -131,17 +146,26 @@ def _cmd_news_harvest(args: argparse.Namespace, *, config: Settings, metrics: Me
 
     asset = args.asset.upper()
     start, end = _build_time_range(args.days, args.date_from, args.date_to)
-    criteria = HarvestCriteriaDTO(asset_symbol=asset, start=start, end=end, limit=args.limit)
 
-    repo = DuckDBNewsRepository(db_path=args.db)
-    domain_repo = DuckDBDomainPolicyRepository(db_path=args.db)
+    con = _open_connection(args.db, config)
+    repo = DuckDBNewsRepository(db_path=args.db, conn=con)
+    domain_repo = DuckDBDomainPolicyRepository(db_path=args.db, conn=con)
     domain_policy = DomainPolicyAdapter(domain_repo)
 
     # Config-Default lesen; via CLI-Flag kann man es erzwingen
     enforce_cfg = bool(config.get("news_domain_filter", "enforce", False))
     enforce = bool(getattr(args, "enforce_domain_filter", False) or enforce_cfg)
 
-    sources = NewsSourceFactory(config, metrics).create_sources(args.source, args.rss_workers)
+    url_cache = DuckDBResolvedUrlCacheRepository(db_path=args.db, conn=con)
+    feed_cache = DuckDBFeedCacheRepository(db_path=args.db, conn=con)
+    factory = NewsSourceFactory(config, metrics, url_cache=url_cache, feed_cache=feed_cache)
+    sources = factory.create_sources(args.source, args.rss_workers)
+
+    # Query-Kerne einmal pro Lauf; die Quellen hängen nur noch Datum/API-Parameter an
+    criteria = HarvestCriteriaDTO(
+        asset_symbol=asset, start=start, end=end, limit=args.limit,
+        query_cores=factory.build_query_cores(asset, sources),
+    )
     svc = HarvestUrls(
         sources=sources,
         repo=repo,
@@ -151,7 +175,17 @@ def _cmd_news_harvest(args: argparse.Namespace, *, config: Settings, metrics: Me
     )
 
     start_time = time.time()
-    summary = svc.run(criteria=criteria, verbose=bool(getattr(args, "verbose", False)), progress_every=25)
+    try:
+        summary = svc.run(criteria=criteria, verbose=bool(getattr(args, "verbose", False)), progress_every=25)
+    finally:
+        # Quellen-Clients deterministisch schließen (Session, Headless-Browser, Worker-Thread)
+        for src in sources:
+            close_source = getattr(src, "close", None)
+            if close_source is not None:
+                close_source()
+        # Gepufferte Domain-Zähler schreiben, bevor die geteilte Verbindung schließt
+        domain_repo.close()
+        con.close()
     metrics.track_harvest_duration(asset, time.time() - start_time)
     print(
         f"[news/harvest] asset={asset} "
@@ -2,31 +2,57 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib
 import logging
 import sys
+from typing import Optional, Sequence
 
 from com.lingenhag.rrp.platform.config.settings import Settings
 from com.lingenhag.rrp.platform.monitoring.metrics import Metrics
-from com.lingenhag.rrp.features.news.presentation.cli_commands import add_news_subparser
-from com.lingenhag.rrp.features.market.presentation.cli_commands import add_market_subparser
-# Wichtig: _build_llm_from_config NICHT auf Modulebene importieren → Lazy-Import im LLM-Zweig
-from com.lingenhag.rrp.features.llm.presentation.cli_commands import add_llm_subparser
-
-from com.lingenhag.rrp.features.market.infrastructure.coingecko_client import CoinGeckoClient
-from com.lingenhag.rrp.features.market.infrastructure.repositories.duckdb_market_repository import (
-    DuckDBMarketRepository,
-)
 
 logging.basicConfig(level=logging.INFO)
 
-
-def build_parser() -> argparse.ArgumentParser:
+# Slice -> (Modul, Registrierungsfunktion). Module werden erst beim Bau des Parsers importiert,
+# und nur für den angefragten Slice (z. B. lädt `rrp news ...` weder Market- noch LLM-Stack).
+_SLICES: dict[str, tuple[str, str]] = {
+    "news": ("com.lingenhag.rrp.features.news.presentation.cli_commands", "add_news_subparser"),
+    "market": ("com.lingenhag.rrp.features.market.presentation.cli_commands", "add_market_subparser"),
+    "llm": ("com.lingenhag.rrp.features.llm.presentation.cli_commands", "add_llm_subparser"),
+}
+
+# Root-Optionen mit Wert (für das Vorab-Erkennen des Slices in argv)
+_ROOT_OPTS_WITH_VALUE = frozenset({"--config", "--metrics-port"})
+
+
+def _requested_slice(argv: Optional[Sequence[str]]) -> Optional[str]:
+    """Erstes Positionsargument in argv, falls es ein bekannter Slice ist; sonst None (→ alle laden)."""
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok in _ROOT_OPTS_WITH_VALUE:
+            i += 2
+            continue
+        if tok.startswith("-"):
+            i += 1
+            continue
+        return tok if tok in _SLICES else None
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(feature: Optional[str] = None) -> argparse.ArgumentParser:
     """
     Root-CLI für modulare Slices (News/Market/LLM).
     Beispiel:
       rrp news harvest --asset DOT --days 1
       rrp market factors --asset BTC --days 365
       rrp llm process --asset ETH --days 1
+
+    Mit `feature` wird nur dieser Slice registriert (Lazy-Import); ohne alle (Hilfe/Fehler).
+    Der Parser wird pro Prozess und Slice einmal gebaut und wiederverwendet (wiederholte
+    main(argv)-Aufrufe, z. B. aus Schedulern/Tests). parse_args() mutiert ihn nicht.
     """
     parser = argparse.ArgumentParser(prog="rrp", description="com.lingenhag.rrp – Modular CLI")
     parser.add_argument(
@@ -43,14 +69,9 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="feature", required=True)
 
-    # ---- News-Slice ----
-    add_news_subparser(subparsers)
-
-    # ---- Market-Slice ----
-    add_market_subparser(subparsers)
-
-    # ---- LLM-Slice ----
-    add_llm_subparser(subparsers)
+    for name in ([feature] if feature in _SLICES else _SLICES):
+        module_name, func_name = _SLICES[name]
+        getattr(importlib.import_module(module_name), func_name)(subparsers)
 
     return parser
 
@@ -68,7 +89,7 @@ def _resolve_db_path(config: Settings, args_db: str | None) -> str:
 
 
 def main(argv: list[str] | None = None) -> None:
-    parser = build_parser()
+    parser = build_parser(_requested_slice(argv))
     args = parser.parse_args(argv)
 
     config = Settings.load(args.config)
@@ -97,6 +118,12 @@ def main(argv: list[str] | None = None) -> None:
 
     # Market-Slice: Source (CoinGeckoClient) + Repository injizieren
     if args.feature == "market":
+        # Lazy-Import: Infrastruktur (requests/duckdb) nur für den Market-Zweig laden
+        from com.lingenhag.rrp.features.market.infrastructure.coingecko_client import CoinGeckoClient
+        from com.lingenhag.rrp.features.market.infrastructure.repositories.duckdb_market_repository import (
+            DuckDBMarketRepository,
+        )
+
         source = CoinGeckoClient(
             api_base=str(config.get("coingecko", "api_base", "https://api.coingecko.com/api/v3")),
             api_key=config.get("coingecko", "api_key", None),
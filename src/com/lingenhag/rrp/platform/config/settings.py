@@ -3,31 +3,55 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+# libyaml-Loader (C) wenn vorhanden, sonst der reine Python-SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML ohne libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 load_dotenv()
 
 
 @dataclass(frozen=True)
 class Settings:
     config: Dict[str, Any]
+    # (section, key) -> value, einmal beim Erzeugen abgeflacht; get() ist ein einzelner Lookup
+    _flat: Dict[Tuple[str, str], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        flat = {
+            (section, key): value
+            for section, values in self.config.items()
+            if isinstance(values, dict)
+            for key, value in values.items()
+        }
+        object.__setattr__(self, "_flat", flat)
 
     @classmethod
+    @lru_cache(maxsize=4)
     def load(cls, config_path: str = "config.yaml") -> "Settings":
+        """Lädt config.yaml einmal pro Pfad (Settings ist frozen); nach Dateiänderungen load.cache_clear()."""
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=_YamlLoader) or {}
         except FileNotFoundError:
             logging.warning(f"Konfigurationsdatei {config_path} nicht gefunden. Verwende Defaults.")
             config = {}
         return cls(config=config)
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
-        return self.config.get(section, {}).get(key, default)
+        return self._flat.get((section, key), default)
+
+    def section(self, name: str) -> Dict[str, Any]:
+        """Ganze Sektion als Mapping (leer, falls nicht vorhanden) – für mehrere Lookups am Stück."""
+        return self.config.get(name) or {}
 
     def get_api_key(self, key_name: str, section: str) -> str | None:
         return self.config.get(section, {}).get("api_key") or os.getenv(key_name)
\ No newline at end of file
@@ -1,7 +1,40 @@
 # src/com/lingenhag/rrp/platform/monitoring/metrics.py
 from __future__ import annotations
 
-from prometheus_client import Counter, Histogram, start_http_server
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, Tuple
+
+from prometheus_client import (
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
+    REGISTRY,
+    Counter,
+    Histogram,
+    disable_created_metrics,
+    start_http_server,
+)
+
+_LOG = logging.getLogger(__name__)
+
+# Bekannte Label-Alphabete der News-Counter (siehe Clients/Resolver); Children werden beim
+# Start einmal materialisiert. Unbekannte Kombinationen landen weiterhin über _child im Cache.
+_NEWS_SOURCES = ("gdelt", "google_rss")
+_NEWS_SOURCE_OUTCOMES = (
+    "success", "no_data", "error", "not_modified", "parse_error", "no_items", "assembled",
+)
+_NEWS_RESOLVERS = ("google_news_resolver",)
+_NEWS_RESOLVER_OUTCOMES = (
+    "unknown", "consent_missing_continue", "returned_news_url", "resolved_publisher",
+    "fallback_news", "passthrough", "headless_resolved", "headless_failed",
+    "headless_unavailable", "error",
+)
+
+# Keine *_created-Serien (verdoppeln sonst die Counter-Serien); wir werten sie nicht aus
+disable_created_metrics()
 
 
 class Metrics:
@@ -18,85 +51,160 @@ class Metrics:
             ["client"],
             buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")),
         )
+        # Laufzeit-Histogramme ohne Asset-Label (jeder Bucket wäre sonst eine Serie pro Asset);
+        # Läufe pro Asset zählen die zugehörigen *_runs_total-Counter.
         self.harvest_duration_seconds = Histogram(
             "harvest_duration_seconds",
             "Duration of URL harvesting in seconds",
-            ["asset_symbol"],
             buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")),
         )
+        self.harvest_runs_total = Counter(
+            "harvest_runs_total",
+            "Completed URL harvesting runs (per asset)",
+            ["asset_symbol"],
+        )
         self.summarize_duration_seconds = Histogram(
             "summarize_duration_seconds",
             "Duration of article summarization in seconds",
-            ["asset_symbol", "mode"],
+            ["mode"],
             buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")),
         )
+        self.summarize_runs_total = Counter(
+            "summarize_runs_total",
+            "Completed article summarization runs (per asset/mode)",
+            ["asset_symbol", "mode"],
+        )
         self.compute_factors_duration_seconds = Histogram(
             "compute_factors_duration_seconds",
             "Duration of factors computation in seconds",
-            ["asset_symbol"],
             buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")),
         )
+        self.compute_factors_runs_total = Counter(
+            "compute_factors_runs_total",
+            "Completed factors computations (per asset)",
+            ["asset_symbol"],
+        )
 
         # ---- NEWS-specific metrics (NEW) ----
-        # Label-Set: asset, source/resolver, outcome
+        # Label-Set: source/resolver, outcome. Das Asset ist bewusst kein Label
+        # (Kardinalität wächst sonst mit dem Asset-Universum); es steht nur im Debug-Log.
         self.news_source_fetch_total = Counter(
             "news_source_fetch_total",
-            "Outcome counter for news source fetches (per asset/source/outcome).",
-            ["source", "asset", "outcome"],
+            "Outcome counter for news source fetches (per source/outcome).",
+            ["source", "outcome"],
         )
         self.news_source_fetch_duration_seconds = Histogram(
             "news_source_fetch_duration_seconds",
             "Duration of news source fetch calls (per source).",
             ["source"],
-            buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")),
+            # Wenige Buckets (je Bucket eine Serie pro Quelle); Fetches dauern Sekunden
+            buckets=(1.0, 5.0, 30.0, float("inf")),
         )
         self.news_resolver_total = Counter(
             "news_resolver_total",
-            "Outcome counter for URL resolver (per resolver/asset/outcome).",
-            ["resolver", "asset", "outcome"],
+            "Outcome counter for URL resolver (per resolver/outcome).",
+            ["resolver", "outcome"],
         )
         self.news_resolver_duration_seconds = Histogram(
             "news_resolver_duration_seconds",
             "Duration of URL resolver operations (per resolver).",
             ["resolver"],
-            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, float("inf")),
+            buckets=(0.05, 0.25, 1.0, float("inf")),
         )
 
+        # Gecachte Label-Children: (Metrik, Label-Werte) -> Child (ein Tupel-Lookup statt labels())
+        self._children: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+
+        # Direkter Zugriff (source|resolver, outcome) -> Child für die heißen News-Counter
+        self._source_fetch_children: Dict[Tuple[str, str], Any] = {
+            (src, out): self._child(self.news_source_fetch_total, src, out)
+            for src in _NEWS_SOURCES
+            for out in _NEWS_SOURCE_OUTCOMES
+        }
+        self._resolver_children: Dict[Tuple[str, str], Any] = {
+            (res, out): self._child(self.news_resolver_total, res, out)
+            for res in _NEWS_RESOLVERS
+            for out in _NEWS_RESOLVER_OUTCOMES
+        }
+
         self._port = port
         self._started = False
+        self._start_lock = threading.Lock()
+
+    def _child(self, metric: Any, *values: str) -> Any:
+        """Label-Child in Deklarationsreihenfolge der Labels; pro Kombination einmal aufgelöst."""
+        key = (metric, values)
+        child = self._children.get(key)
+        if child is None:
+            # Label-Werte interniert ablegen: gleiche Strings (source/outcome/...) teilen sich
+            # über alle Serien ein Objekt statt je Serie eine Kopie zu halten.
+            interned = tuple(sys.intern(str(v)) for v in values)
+            child = self._children.setdefault((metric, interned), metric.labels(*interned))
+        return child
 
     # ---- Server lifecycle ----
-    def start_server(self) -> None:
-        if not self._started:
+    def start_server(self, *, default_collectors: bool = False) -> None:
+        # Lock: parallele Aufrufe dürfen den Port nicht doppelt binden
+        with self._start_lock:
+            if self._started:
+                return
+            if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+                # Multiprocess-Modus (z. B. gunicorn --preload): Worker schreiben in die mmap-Dateien,
+                # exportiert wird zentral über einen MultiProcessCollector – hier kein eigener Server.
+                _LOG.info("[monitoring] PROMETHEUS_MULTIPROC_DIR set; skipping per-process metrics server")
+                self._started = True
+                return
+            if not default_collectors:
+                # Prozess-/Plattform-/GC-Metriken werden nicht genutzt -> nicht exportieren
+                for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+                    try:
+                        REGISTRY.unregister(collector)
+                    except KeyError:
+                        pass  # bereits entfernt (z. B. zweite Metrics-Instanz)
             start_http_server(self._port)
             self._started = True
             print(f"[monitoring] Prometheus metrics server started on port {self._port}")
 
     # ---- Existing helpers (backward-compat) ----
     def track_api_request(self, client: str, status: str) -> None:
-        self.api_requests_total.labels(client=client, status=status).inc()
+        self._child(self.api_requests_total, client, status).inc()
 
     def track_api_duration(self, client: str, duration: float) -> None:
-        self.api_request_duration_seconds.labels(client=client).observe(duration)
+        self._child(self.api_request_duration_seconds, client).observe(duration)
 
     def track_harvest_duration(self, asset_symbol: str, duration: float) -> None:
-        self.harvest_duration_seconds.labels(asset_symbol=asset_symbol).observe(duration)
+        self.harvest_duration_seconds.observe(duration)
+        self._child(self.harvest_runs_total, asset_symbol).inc()
 
     def track_summarize_duration(self, asset_symbol: str, mode: str, duration: float) -> None:
-        self.summarize_duration_seconds.labels(asset_symbol=asset_symbol, mode=mode).observe(duration)
+        self._child(self.summarize_duration_seconds, mode).observe(duration)
+        self._child(self.summarize_runs_total, asset_symbol, mode).inc()
 
     def track_compute_factors_duration(self, asset_symbol: str, duration: float) -> None:
-        self.compute_factors_duration_seconds.labels(asset_symbol=asset_symbol).observe(duration)
+        self.compute_factors_duration_seconds.observe(duration)
+        self._child(self.compute_factors_runs_total, asset_symbol).inc()
 
     # ---- NEWS-specific helpers (NEW) ----
     def track_news_source_fetch(self, *, source: str, asset: str, outcome: str) -> None:
-        self.news_source_fetch_total.labels(source=source, asset=asset, outcome=outcome).inc()
+        child = self._source_fetch_children.get((source, outcome))
+        if child is None:
+            child = self._source_fetch_children[(source, outcome)] = self._child(
+                self.news_source_fetch_total, source, outcome
+            )
+        child.inc()
+        _LOG.debug("news source fetch: source=%s asset=%s outcome=%s", source, asset, outcome)
 
     def track_news_source_duration(self, *, source: str, duration: float) -> None:
-        self.news_source_fetch_duration_seconds.labels(source=source).observe(duration)
+        self._child(self.news_source_fetch_duration_seconds, source).observe(duration)
 
     def track_news_resolver(self, *, resolver: str, asset: str, outcome: str) -> None:
-        self.news_resolver_total.labels(resolver=resolver, asset=asset, outcome=outcome).inc()
+        child = self._resolver_children.get((resolver, outcome))
+        if child is None:
+            child = self._resolver_children[(resolver, outcome)] = self._child(
+                self.news_resolver_total, resolver, outcome
+            )
+        child.inc()
+        _LOG.debug("news resolver: resolver=%s asset=%s outcome=%s", resolver, asset, outcome)
 
     def track_news_resolver_duration(self, *, resolver: str, duration: float) -> None:
-        self.news_resolver_duration_seconds.labels(resolver=resolver).observe(duration)
\ No newline at end of file
+        self._child(self.news_resolver_duration_seconds, resolver).observe(duration)
\ No newline at end of file
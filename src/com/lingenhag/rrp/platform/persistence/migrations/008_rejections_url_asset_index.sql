@@ -0,0 +1,12 @@
+-- src/com/lingenhag/rrp/platform/persistence/migrations/008_rejections_url_asset_index.sql
+-- =============================================================================
+-- Index für den Duplikat-Check beim Harvest (url, asset_symbol).
+-- url_harvests und summarized_articles haben ihn bereits über ihre
+-- UNIQUE-Constraints; rejections bisher nur auf asset_symbol.
+-- =============================================================================
+
+BEGIN TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_rejections_url_asset ON rejections(url, asset_symbol);
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- src/com/lingenhag/rrp/platform/persistence/migrations/009_rss_resolved_urls.sql
+-- =============================================================================
+-- Cache für aufgelöste Google-News-Redirects (RSS-Link -> Publisher-URL).
+-- Wird vor dem Netzwerk-Resolve konsultiert; fetched_at ist UTC-naiv.
+-- =============================================================================
+
+BEGIN TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS rss_resolved_urls
+(
+    rss_link   TEXT PRIMARY KEY,
+    final_url  TEXT NOT NULL,
+    fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
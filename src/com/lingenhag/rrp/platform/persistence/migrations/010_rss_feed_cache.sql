@@ -0,0 +1,20 @@
+-- src/com/lingenhag/rrp/platform/persistence/migrations/010_rss_feed_cache.sql
+-- =============================================================================
+-- Conditional-GET-Cache für Google-News-RSS-Feeds (Feed-URL inkl. Tagesfenster).
+-- entries: JSON-Liste [title, link, pubDate, publisher] aller Items der letzten
+-- 200-Antwort; bei 304 werden sie erneut gegen Zeitfenster/Limit gefiltert.
+-- fetched_at ist UTC-naiv.
+-- =============================================================================
+
+BEGIN TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS rss_feed_cache
+(
+    feed_url      TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    entries       TEXT      NOT NULL,
+    fetched_at    TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMIT;
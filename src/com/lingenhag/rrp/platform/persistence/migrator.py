@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import duckdb  # type: ignore[import-untyped]
 
@@ -12,23 +13,52 @@ logger = logging.getLogger(__name__)
 def _split_sql(sql: str) -> List[str]:
     """
     Simple statement splitter: Splits on ';' at line ends.
-    Ignores empty/whitespace blocks. Sufficient for our migration files.
+    Ignores empty/whitespace blocks. Only used to pinpoint a failing statement.
+    Single forward scan via str.find (no per-line list/join).
     """
     parts: List[str] = []
-    buf: list[str] = []
-    for line in sql.splitlines():
-        buf.append(line)
-        if line.strip().endswith(";"):
-            stmt = "\n".join(buf).strip()
-            if stmt:
-                parts.append(stmt)
-            buf = []
+    start = pos = 0
+    n = len(sql)
+    while True:
+        j = sql.find(";", pos)
+        if j < 0:
+            break
+        eol = sql.find("\n", j)
+        if eol < 0:
+            eol = n
+        pos = j + 1
+        # Nur ';' am Zeilenende trennt (Rest der Zeile leer)
+        if sql[pos:eol].strip():
+            continue
+        stmt = sql[start:eol].strip()
+        if stmt:
+            parts.append(stmt)
+        start = pos = eol
     # Trailing without semicolon
-    tail = "\n".join(buf).strip()
+    tail = sql[start:].strip()
     if tail:
         parts.append(tail)
     return parts
 
+# BEGIN/COMMIT-Zeilen in den Dateien; der Migrator klammert selbst (inkl. Eintrag in 'migrations')
+_TX_CONTROL = re.compile(r"^[ \t]*(?:BEGIN(?:[ \t]+TRANSACTION)?|COMMIT|END)[ \t]*;[ \t]*$", re.IGNORECASE | re.MULTILINE)
+
+def _locate_failure(con, sql: str) -> Tuple[int, str]:
+    """
+    Nur im Fehlerfall: Statements einzeln in einer Wegwerf-Transaktion ausführen,
+    um das fehlerhafte zu benennen. Liefert (Nummer, Statement) oder (0, "").
+    """
+    con.begin()
+    try:
+        for idx, stmt in enumerate(_split_sql(sql), start=1):
+            try:
+                con.execute(stmt)
+            except Exception:  # noqa: BLE001
+                return idx, stmt
+    finally:
+        con.rollback()
+    return 0, ""
+
 def _init_migrations_table(con) -> None:
     """Initialize tracking table for applied migrations."""
     con.execute("""
@@ -38,10 +68,25 @@ def _init_migrations_table(con) -> None:
                 )
                 """)
 
+def pending_migrations(db_path: str, migrations_dir: str) -> List[str]:
+    """
+    Liefert die noch nicht angewendeten Migrationsdateien (sortiert) via einem
+    SELECT auf 'migrations' – ohne Katalog-Scan und ohne etwas anzuwenden.
+    """
+    files = sorted(p.name for p in Path(migrations_dir).glob("*.sql"))
+    with duckdb.connect(db_path) as con:
+        has_table = con.execute(
+            "SELECT 1 FROM duckdb_tables() WHERE table_name = 'migrations'"
+        ).fetchone()
+        done = {row[0] for row in con.execute("SELECT filename FROM migrations").fetchall()} if has_table else set()
+    return [f for f in files if f not in done]
+
 def apply_migrations(db_path: str, migrations_dir: str) -> List[str]:
     """
-    Applies SQL migrations file-by-file, statement-by-statement with clear errors.
-    Tracks applied migrations in 'migrations' table; skips existing.
+    Applies SQL migrations file-by-file (one execute per file); on failure the
+    statements are replayed one by one to report the failing one.
+    Each file runs in one transaction together with its 'migrations' entry
+    (BEGIN/COMMIT inside the file are ignored); already applied files are skipped.
     """
     migrations_path = Path(migrations_dir)
     applied: List[str] = []
@@ -49,27 +94,34 @@ def apply_migrations(db_path: str, migrations_dir: str) -> List[str]:
     with duckdb.connect(db_path) as con:
         con.execute("SET TimeZone='UTC'")
         _init_migrations_table(con)
+        # Angewendete Dateien einmal laden statt einer Abfrage pro Datei
+        done = {row[0] for row in con.execute("SELECT filename FROM migrations").fetchall()}
 
         for migration_file in sorted(migrations_path.glob("*.sql")):
             filename = migration_file.name
             # Check if already applied
-            if con.execute("SELECT 1 FROM migrations WHERE filename = ?", [filename]).fetchone():
+            if filename in done:
                 logger.info(f"Skipping applied migration: {filename}")
                 continue
 
-            with open(migration_file, "r", encoding="utf-8") as f:
-                sql = f.read()
-            statements = _split_sql(sql)
+            sql = migration_file.read_text(encoding="utf-8")
+            # Ganze Datei in einem execute(): DuckDB parst die Statements nativ
+            body = _TX_CONTROL.sub("", sql)
+            # Datei + Eintrag in 'migrations' in einer Transaktion: ein Commit pro Datei,
+            # und eine abgebrochene Migration hinterlässt weder Schema- noch Tracking-Reste.
+            con.begin()
             try:
-                for idx, stmt in enumerate(statements, start=1):
-                    con.execute(stmt)
+                con.execute(body)
                 # Mark as applied
                 con.execute("INSERT INTO migrations (filename) VALUES (?)", [filename])
-                applied.append(filename)
-                logger.info(f"Applied migration: {filename}")
+                con.commit()
             except Exception as e:  # noqa: BLE001
+                con.rollback()
+                idx, stmt = _locate_failure(con, body)
                 raise RuntimeError(
                     f"Migration '{filename}' failed at statement #{idx}:\n{stmt}\nError: {e}"
                 ) from e
+            applied.append(filename)
+            logger.info(f"Applied migration: {filename}")
 
     return applied
\ No newline at end of file
@@ -0,0 +1,118 @@
+# tests/features/market/test_coingecko_client.py
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from com.lingenhag.rrp.features.market.infrastructure.coingecko_client import (
+    CircuitOpenError,
+    CoinGeckoClient,
+    _CircuitState,
+)
+
+
+def _open_circuit(cool_off: float) -> _CircuitState:
+    state = _CircuitState(threshold=2, cool_off=cool_off)
+    state.record_failure()
+    state.record_failure()
+    return state
+
+
+def test_open_circuit_rejects_until_cool_off():
+    state = _open_circuit(cool_off=60.0)
+    with pytest.raises(CircuitOpenError):
+        state.check()
+
+
+def test_half_open_admits_single_probe_then_closes_on_success():
+    state = _open_circuit(cool_off=0.01)
+    time.sleep(0.02)
+
+    assert state.check() is True  # Probe
+    with pytest.raises(CircuitOpenError):
+        state.check()  # weitere Aufrufer warten auf den Ausgang der Probe
+
+    state.record_success()
+    assert state.check() is False
+    assert state.failures == 0
+
+
+def test_half_open_probe_failure_reopens():
+    state = _open_circuit(cool_off=0.05)
+    time.sleep(0.06)
+
+    assert state.check() is True
+    state.record_failure()
+
+    assert state.probe_in_flight is False
+    assert state.opened_at is not None
+    with pytest.raises(CircuitOpenError):
+        state.check()
+
+
+def test_release_probe_without_verdict_admits_callers_again():
+    state = _open_circuit(cool_off=0.01)
+    time.sleep(0.02)
+
+    assert state.check() is True
+    state.release_probe()
+    assert state.check() is False
+
+
+def test_fetch_histories_returns_results_for_all_ids(monkeypatch):
+    monkeypatch.setattr(
+        CoinGeckoClient, "fetch_history_range", lambda self, pid, vs, ts_from, ts_to: [pid, vs]
+    )
+    client = CoinGeckoClient(api_key=None)
+
+    out = client.fetch_histories(["bitcoin", "ethereum", "bitcoin", ""], "usd", 0, 1, max_workers=2)
+
+    assert out == {"bitcoin": ["bitcoin", "usd"], "ethereum": ["ethereum", "usd"]}
+
+
+def test_fetch_histories_reraises_first_error_and_cancels_pending(monkeypatch):
+    started = []
+
+    def fake(self, pid, vs, ts_from, ts_to):
+        started.append(pid)
+        if pid == "bad":
+            raise ValueError("boom")
+        time.sleep(0.05)
+        return []
+
+    monkeypatch.setattr(CoinGeckoClient, "fetch_history_range", fake)
+    client = CoinGeckoClient(api_key=None)
+    ids = ["bad"] + [f"id{i}" for i in range(10)]
+
+    with pytest.raises(ValueError, match="boom"):
+        client.fetch_histories(ids, "usd", 0, 1, max_workers=1)
+
+    # Ein Worker: nach dem Fehler läuft höchstens der bereits gestartete nächste Request
+    assert len(started) <= 2
+
+
+def test_fetch_histories_respects_max_in_flight():
+    client = CoinGeckoClient(api_key=None, max_in_flight=2)
+    lock = threading.Lock()
+    open_now = peak = 0
+    body = json.dumps({"prices": [[0, 1.0]], "market_caps": [], "total_volumes": []})
+
+    def fake_request(**kwargs):
+        nonlocal open_now, peak
+        with lock:
+            open_now += 1
+            peak = max(peak, open_now)
+        time.sleep(0.02)
+        with lock:
+            open_now -= 1
+        resp = Mock(status_code=200, content=body.encode(), text=body, url=kwargs["url"])
+        resp.json.return_value = json.loads(body)
+        return resp
+
+    client._session.request = fake_request
+    out = client.fetch_histories([f"id{i}" for i in range(8)], "usd", 0, 1, max_workers=8)
+
+    assert len(out) == 8
+    assert peak == 2  # parallel, aber nie über max_in_flight
@@ -1,6 +1,4 @@
 # tests/features/news/conftest.py
-import os
-import tempfile
 import pytest
 from unittest.mock import Mock
 from datetime import datetime, timezone
@@ -10,12 +8,34 @@ from com.lingenhag.rrp.features.news.application.ports import (
 from com.lingenhag.rrp.features.news.application.usecases.harvest_urls import HarvestUrls
 from com.lingenhag.rrp.domain.models import UrlHarvest, HarvestSummary
 from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_news_repository import DuckDBNewsRepository
+from com.lingenhag.rrp.platform.persistence import migrations
+from pathlib import Path
 import duckdb
 
+_MIGRATIONS_DIR = Path(migrations.__file__).parent
+
+
+# Mock(spec=...) introspiziert den Port bei jeder Konstruktion -> einmal pro Modul bauen,
+# pro Test nur zurücksetzen und die Defaults neu setzen (Isolation bleibt erhalten).
+@pytest.fixture(scope="module")
+def _shared_news_source() -> NewsSourcePort:
+    return Mock(spec=NewsSourcePort)
+
+
+@pytest.fixture(scope="module")
+def _shared_repo() -> NewsRepositoryPort:
+    return Mock(spec=NewsRepositoryPort)
+
+
+@pytest.fixture(scope="module")
+def _shared_domain_policy() -> DomainPolicyPort:
+    return Mock(spec=DomainPolicyPort)
+
 
 @pytest.fixture
-def mock_news_source() -> NewsSourcePort:
-    source = Mock(spec=NewsSourcePort)
+def mock_news_source(_shared_news_source) -> NewsSourcePort:
+    source = _shared_news_source
+    source.reset_mock(return_value=True, side_effect=True)
     source.SOURCE_NAME = "test_source"
     source.fetch_documents.return_value = [
         {"url": "https://test.com/1", "title": "Test1", "published_at": "2025-10-01T00:00:00Z"}
@@ -24,17 +44,22 @@ def mock_news_source() -> NewsSourcePort:
 
 
 @pytest.fixture
-def mock_repo() -> NewsRepositoryPort:
-    repo = Mock(spec=NewsRepositoryPort)
+def mock_repo(_shared_repo) -> NewsRepositoryPort:
+    repo = _shared_repo
+    repo.reset_mock(return_value=True, side_effect=True)
     repo.save_url_harvest.return_value = (1, False)
+    repo.existing_urls.return_value = set()
+    repo.filter_existing.return_value = set()
+    repo.save_url_harvests_bulk.side_effect = lambda rows: {r[0] for r in rows}
     repo.save_rejection.return_value = 1
     repo.now_utc.return_value = datetime.now(timezone.utc)
     return repo
 
 
 @pytest.fixture
-def mock_domain_policy() -> DomainPolicyPort:
-    policy = Mock(spec=DomainPolicyPort)
+def mock_domain_policy(_shared_domain_policy) -> DomainPolicyPort:
+    policy = _shared_domain_policy
+    policy.reset_mock(return_value=True, side_effect=True)
     policy.is_allowed.return_value = True
     return policy
 
@@ -49,72 +74,105 @@ def sample_criteria():
     )
 
 
-@pytest.fixture
-def in_memory_repo():
-    # Make a temp directory and point DuckDB at a file that doesn't exist yet
-    tmpdir = tempfile.TemporaryDirectory()
-    db_path = os.path.join(tmpdir.name, "test.duckdb")
-    repo = DuckDBNewsRepository(db_path)
+@pytest.fixture(scope="session")
+def news_template_db(tmp_path_factory):
+    # Schema + Seed einmal pro Session; Tests kopieren sie nur noch in eine In-Memory-DB
+    db_path = str(tmp_path_factory.mktemp("news_template") / "template.duckdb")
+    con = duckdb.connect(db_path)
     try:
-        with repo._connect() as con:
-            # Assets
-            con.execute("CREATE SEQUENCE assets_seq START 1;")
-            con.execute("""
-                        CREATE TABLE assets (
-                                                id INTEGER PRIMARY KEY DEFAULT nextval('assets_seq'),
-                                                symbol TEXT UNIQUE NOT NULL,
-                                                name TEXT NOT NULL
-                        );
-                        """)
-            con.execute("INSERT INTO assets VALUES (nextval('assets_seq'), 'BTC', 'Bitcoin');")
-            # URL Harvests
-            con.execute("CREATE SEQUENCE url_harvests_seq START 1;")
-            con.execute("""
-                        CREATE TABLE url_harvests (
-                                                      id INTEGER PRIMARY KEY DEFAULT nextval('url_harvests_seq'),
-                                                      source TEXT,
-                                                      url TEXT NOT NULL,
-                                                      asset_symbol TEXT NOT NULL,
-                                                      published_at TIMESTAMP,
-                                                      title TEXT,
-                                                      discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                                                      FOREIGN KEY (asset_symbol) REFERENCES assets(symbol)
-                        );
-                        """)
-            con.execute("CREATE UNIQUE INDEX uq_url_harvest_url_asset ON url_harvests(url, asset_symbol);")
-            # Summarized Articles
-            con.execute("CREATE SEQUENCE summarized_articles_seq START 1;")
-            con.execute("""
-                        CREATE TABLE summarized_articles (
-                                                             id INTEGER PRIMARY KEY DEFAULT nextval('summarized_articles_seq'),
-                                                             url TEXT NOT NULL,
-                                                             published_at TIMESTAMP,
-                                                             summary TEXT,
-                                                             asset_symbol TEXT NOT NULL,
-                                                             source TEXT,
-                                                             ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                                                             model TEXT NOT NULL,
-                                                             sentiment DOUBLE,
-                                                             FOREIGN KEY (asset_symbol) REFERENCES assets(symbol),
-                                                             CONSTRAINT uq_summarized_url_asset UNIQUE (url, asset_symbol)
-                        );
-                        """)
-            # Rejections
-            con.execute("CREATE SEQUENCE rejections_seq START 1;")
-            con.execute("""
-                        CREATE TABLE rejections (
-                                                    id INTEGER PRIMARY KEY DEFAULT nextval('rejections_seq'),
-                                                    url TEXT,
-                                                    asset_symbol TEXT NOT NULL,
-                                                    reason TEXT,
-                                                    source TEXT,
-                                                    context TEXT NOT NULL,
-                                                    article_id INTEGER,
-                                                    model TEXT,
-                                                    details JSON,
-                                                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        );
-                        """)
-        yield repo
+        # Gesamtes Schema in einem execute(): DuckDB parst die Statements selbst
+        con.execute("""
+            -- Assets
+            CREATE SEQUENCE assets_seq START 1;
+            CREATE TABLE assets (
+                id INTEGER PRIMARY KEY DEFAULT nextval('assets_seq'),
+                symbol TEXT UNIQUE NOT NULL,
+                name TEXT NOT NULL
+            );
+            INSERT INTO assets VALUES (nextval('assets_seq'), 'BTC', 'Bitcoin');
+
+            -- URL Harvests
+            CREATE SEQUENCE url_harvests_seq START 1;
+            CREATE TABLE url_harvests (
+                id INTEGER PRIMARY KEY DEFAULT nextval('url_harvests_seq'),
+                source TEXT,
+                url TEXT NOT NULL,
+                asset_symbol TEXT NOT NULL,
+                published_at TIMESTAMP,
+                title TEXT,
+                discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (asset_symbol) REFERENCES assets(symbol)
+            );
+            CREATE UNIQUE INDEX uq_url_harvest_url_asset ON url_harvests(url, asset_symbol);
+
+            -- Summarized Articles
+            CREATE SEQUENCE summarized_articles_seq START 1;
+            CREATE TABLE summarized_articles (
+                id INTEGER PRIMARY KEY DEFAULT nextval('summarized_articles_seq'),
+                url TEXT NOT NULL,
+                published_at TIMESTAMP,
+                summary TEXT,
+                asset_symbol TEXT NOT NULL,
+                source TEXT,
+                ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                model TEXT NOT NULL,
+                sentiment DOUBLE,
+                FOREIGN KEY (asset_symbol) REFERENCES assets(symbol),
+                CONSTRAINT uq_summarized_url_asset UNIQUE (url, asset_symbol)
+            );
+
+            -- Rejections
+            CREATE SEQUENCE rejections_seq START 1;
+            CREATE TABLE rejections (
+                id INTEGER PRIMARY KEY DEFAULT nextval('rejections_seq'),
+                url TEXT,
+                asset_symbol TEXT NOT NULL,
+                reason TEXT,
+                source TEXT,
+                context TEXT NOT NULL,
+                article_id INTEGER,
+                model TEXT,
+                details JSON,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
     finally:
-        tmpdir.cleanup()
\ No newline at end of file
+        # close() checkpointet: die Vorlage ist danach ohne WAL vollständig lesbar
+        con.close()
+    return db_path
+
+
+@pytest.fixture
+def in_memory_repo(news_template_db):
+    # Fresh in-memory database per test, filled from the prepared template (no files written)
+    repo = DuckDBNewsRepository(":memory:")
+    with repo._connect() as con:
+        con.execute(
+            f"ATTACH '{news_template_db}' AS tpl (READ_ONLY); COPY FROM DATABASE tpl TO memory; DETACH tpl"
+        )
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def repo_con(in_memory_repo):
+    # One cursor on the repository's connection for all assertions of a test
+    with in_memory_repo._connect() as con:
+        yield con
+
+
+@pytest.fixture
+def migrated_con():
+    # In-Memory-DB mit den angegebenen Migrationsdateien (z. B. "009_rss_resolved_urls.sql")
+    cons = []
+
+    def _open(*names: str) -> duckdb.DuckDBPyConnection:
+        con = duckdb.connect(":memory:")
+        for name in names:
+            con.execute((_MIGRATIONS_DIR / name).read_text(encoding="utf-8"))
+        cons.append(con)
+        return con
+
+    yield _open
+    for con in cons:
+        con.close()
@@ -0,0 +1,14 @@
+# tests/features/news/test_base_source.py
+from unittest.mock import Mock
+
+from com.lingenhag.rrp.features.news.infrastructure.sources.base_source import BaseNewsSource
+
+
+def test_close_delegates_to_client():
+    client = Mock()
+    BaseNewsSource(client=client).close()
+    client.close.assert_called_once_with()
+
+
+def test_close_without_client_close_is_noop():
+    BaseNewsSource(client=object()).close()
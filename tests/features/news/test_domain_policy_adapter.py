@@ -0,0 +1,20 @@
+# tests/features/news/test_domain_policy_adapter.py
+from com.lingenhag.rrp.features.news.infrastructure.repositories.domain_policy_adapter import DomainPolicyAdapter
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_domain_policy_repository import (
+    DuckDBDomainPolicyRepository,
+)
+
+
+def test_is_allowed_uses_policies_loaded_once(tmp_path):
+    repo = DuckDBDomainPolicyRepository(str(tmp_path / "test.duckdb"))
+    repo.allow("BTC", "spam.com", allowed=False)
+    adapter = DomainPolicyAdapter(repo)
+
+    assert adapter.is_allowed("BTC", "spam.com") is False
+    assert adapter.is_allowed("BTC", "news.com") is True
+    assert adapter.is_allowed("ETH", "spam.com") is True
+
+    adapter.set_policy(asset_symbol="BTC", domain="news.com", allowed=False)
+    assert adapter.is_allowed("BTC", "news.com") is False
+    assert repo.load_policies("BTC") == {"spam.com": False, "news.com": False}
+    repo.close()
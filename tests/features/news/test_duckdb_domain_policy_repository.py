@@ -0,0 +1,69 @@
+# tests/features/news/test_duckdb_domain_policy_repository.py
+import duckdb
+import pytest
+
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_domain_policy_repository import (
+    DuckDBDomainPolicyRepository,
+)
+
+
+@pytest.fixture
+def con():
+    con = duckdb.connect(":memory:")
+    yield con
+    con.close()
+
+
+def _stats(con):
+    rows = con.execute(
+        """
+        SELECT domain, harvested_total, stored_total, llm_accepted, llm_rejected
+        FROM news_domain_stats ORDER BY domain
+        """
+    ).fetchall()
+    return {r[0]: r[1:] for r in rows}
+
+
+def test_counters_are_buffered_until_flush_threshold(con):
+    repo = DuckDBDomainPolicyRepository(":memory:", conn=con, flush_threshold=2)
+
+    repo.record_harvest("BTC", "a.com", stored=True)
+    repo.record_llm_decision("BTC", "a.com", accepted=False)
+    assert _stats(con) == {}  # ein Schlüssel im Puffer < Schwelle
+
+    repo.record_harvest("BTC", "b.com", stored=False)  # zweiter Schlüssel -> flush
+    assert _stats(con) == {"a.com": (1, 1, 0, 1), "b.com": (1, 0, 0, 0)}
+
+
+def test_close_flushes_buffer(con):
+    repo = DuckDBDomainPolicyRepository(":memory:", conn=con)
+    repo.record_llm_decision("BTC", "a.com", accepted=True)
+    assert _stats(con) == {}
+
+    repo.close()
+
+    assert _stats(con) == {"a.com": (0, 0, 1, 0)}
+
+
+def test_record_harvest_bulk_adds_to_existing_rows(con):
+    repo = DuckDBDomainPolicyRepository(":memory:", conn=con)
+    repo.record_harvest_bulk("BTC", [("a.com", True), ("a.com", False)])
+    repo.record_llm_decision("BTC", "a.com", accepted=True)  # gepuffert, geht mit dem nächsten Bulk raus
+
+    repo.record_harvest_bulk("BTC", [("a.com", True), ("b.com", False)])
+
+    assert _stats(con) == {"a.com": (3, 2, 1, 0), "b.com": (1, 0, 0, 0)}
+
+
+def test_failed_write_keeps_counters_in_buffer(con):
+    repo = DuckDBDomainPolicyRepository(":memory:", conn=con)
+    repo.record_harvest("BTC", "a.com", stored=True)
+    con.execute("DROP TABLE news_domain_stats")
+
+    with pytest.raises(duckdb.Error):
+        repo.flush()
+
+    repo._ensure_schema()
+    repo.record_harvest("BTC", "a.com", stored=False)
+    repo.flush()
+    assert _stats(con) == {"a.com": (2, 1, 0, 0)}
@@ -1,11 +1,11 @@
 # tests/features/news/test_duckdb_news_repository.py
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_news_repository import DuckDBNewsRepository
 # No import for in_memory_repo – fixture auto-injected
 
 
-def test_save_url_harvest_new(in_memory_repo):
+def test_save_url_harvest_new(in_memory_repo, repo_con):
     repo = in_memory_repo
     now = datetime.now(timezone.utc)
     id_, is_dup = repo.save_url_harvest(
@@ -20,10 +20,9 @@ def test_save_url_harvest_new(in_memory_repo):
     assert not is_dup
 
     # Verify inserted
-    with repo._connect() as con:
-        row = con.execute("SELECT url, asset_symbol FROM url_harvests WHERE id = ?", (id_,)).fetchone()
-        assert row[0] == "https://test.com/new"
-        assert row[1] == "BTC"
+    row = repo_con.execute("SELECT url, asset_symbol FROM url_harvests WHERE id = ?", (id_,)).fetchone()
+    assert row[0] == "https://test.com/new"
+    assert row[1] == "BTC"
 
 
 def test_save_url_harvest_duplicate(in_memory_repo):
@@ -36,7 +35,7 @@ def test_save_url_harvest_duplicate(in_memory_repo):
     assert is_dup  # Duplicate detected
 
 
-def test_save_rejection(in_memory_repo):
+def test_save_rejection(in_memory_repo, repo_con):
     repo = in_memory_repo
     id_ = repo.save_rejection(
         url="https://test.com/reject",
@@ -49,9 +48,8 @@ def test_save_rejection(in_memory_repo):
     assert id_ > 0
 
     # Verify
-    with repo._connect() as con:
-        row = con.execute("SELECT reason FROM rejections WHERE id = ?", (id_,)).fetchone()
-        assert row[0] == "Irrelevant"
+    row = repo_con.execute("SELECT reason FROM rejections WHERE id = ?", (id_,)).fetchone()
+    assert row[0] == "Irrelevant"
 
 
 def test_fetch_url_harvest_batch(in_memory_repo):
@@ -63,4 +61,71 @@ def test_fetch_url_harvest_batch(in_memory_repo):
     batch = repo.fetch_url_harvest_batch("BTC", limit=2)
 
     assert len(batch) == 2
-    assert batch[0]["url"] == "https://test.com/1"
\ No newline at end of file
+    assert batch[0]["url"] == "https://test.com/1"
+
+def test_save_url_harvests_bulk(in_memory_repo, repo_con):
+    repo = in_memory_repo
+    repo.save_url_harvest(url="https://test.com/old", asset_symbol="BTC", source=None, published_at=None, title=None)
+    repo.save_rejection(url="https://test.com/rej", asset_symbol="BTC", reason="irrelevant", source=None, context="llm")
+    rows = [
+        ("https://test.com/old", "BTC", None, None, None),
+        ("https://test.com/rej", "BTC", None, None, None),
+        ("https://test.com/new", "BTC", "src", datetime(2025, 10, 1, tzinfo=timezone.utc), "New"),
+        ("https://test.com/new", "BTC", "src", None, "New"),
+    ]
+
+    inserted = repo.save_url_harvests_bulk(rows)
+
+    assert inserted == {"https://test.com/new"}
+    assert repo_con.execute("SELECT COUNT(*) FROM url_harvests").fetchone()[0] == 2
+
+
+def test_existing_urls(in_memory_repo):
+    repo = in_memory_repo
+    repo.save_url_harvest(url="https://test.com/1", asset_symbol="BTC", source=None, published_at=None, title=None)
+    repo.save_rejection(url="https://test.com/2", asset_symbol="BTC", reason="irrelevant", source=None, context="llm")
+
+    assert repo.existing_urls("BTC") == {"https://test.com/1", "https://test.com/2"}
+    assert repo.existing_urls("BTC", since=datetime.now(timezone.utc) - timedelta(days=1)) == {
+        "https://test.com/1", "https://test.com/2"
+    }
+    assert repo.existing_urls("BTC", since=datetime.now(timezone.utc) + timedelta(days=1)) == set()
+
+
+def test_filter_existing(in_memory_repo):
+    repo = in_memory_repo
+    repo.save_url_harvest(url="https://test.com/1", asset_symbol="BTC", source=None, published_at=None, title=None)
+
+    assert repo.filter_existing("BTC", ["https://test.com/1", "https://test.com/2"]) == {"https://test.com/1"}
+    assert repo.filter_existing("BTC", []) == set()
+
+
+def test_save_url_harvest_skips_rejected(in_memory_repo):
+    repo = in_memory_repo
+    repo.save_rejection(url="https://test.com/rej", asset_symbol="BTC", reason="irrelevant", source=None, context="llm")
+
+    id_, is_dup = repo.save_url_harvest(url="https://test.com/rej", asset_symbol="BTC", source=None, published_at=None, title=None)
+
+    assert (id_, is_dup) == (0, True)
+
+
+def test_shared_connection_stays_open_after_close(in_memory_repo):
+    shared = DuckDBNewsRepository(in_memory_repo.db_path, conn=in_memory_repo._con)
+    shared.save_url_harvest(url="https://test.com/s", asset_symbol="BTC", source=None, published_at=None, title=None)
+    shared.close()
+
+    assert in_memory_repo.existing_urls("BTC") == {"https://test.com/s"}
+
+
+def test_connect_reuses_pooled_cursor(in_memory_repo):
+    with in_memory_repo._connect() as first:
+        pass
+    with in_memory_repo._connect() as second:
+        assert second is first
+        assert second.execute("SELECT current_setting('TimeZone')").fetchone()[0] == "UTC"
+
+    with pytest.raises(RuntimeError):
+        with in_memory_repo._connect():
+            raise RuntimeError("boom")
+    with in_memory_repo._connect() as third:
+        assert third is not first
@@ -0,0 +1,25 @@
+# tests/features/news/test_duckdb_resolved_url_cache.py
+import pytest
+
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_resolved_url_cache import (
+    DuckDBResolvedUrlCacheRepository,
+)
+
+
+@pytest.fixture
+def url_cache(migrated_con):
+    return DuckDBResolvedUrlCacheRepository(":memory:", conn=migrated_con("009_rss_resolved_urls.sql"))
+
+
+def test_get_many_returns_only_known_links(url_cache):
+    url_cache.put_many([("https://g/a", "https://a.com/1"), ("https://g/b", "https://b.com/2")])
+
+    assert url_cache.get_many(["https://g/a", "https://g/x", "https://g/a", ""]) == {"https://g/a": "https://a.com/1"}
+    assert url_cache.get_many([]) == {}
+
+
+def test_put_many_upserts_and_skips_empty_pairs(url_cache):
+    url_cache.put_many([("https://g/a", "https://a.com/old")])
+    url_cache.put_many([("https://g/a", "https://a.com/new"), ("https://g/b", ""), ("", "https://c.com")])
+
+    assert url_cache.get_many(["https://g/a", "https://g/b"]) == {"https://g/a": "https://a.com/new"}
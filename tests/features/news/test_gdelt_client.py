@@ -0,0 +1,33 @@
+# tests/features/news/test_gdelt_client.py
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
+from com.lingenhag.rrp.features.news.infrastructure.gdelt_client import GdeltClient
+
+
+def test_iter_documents_does_not_fetch_ahead_of_slow_consumer():
+    client = GdeltClient(max_workers=2)
+    fetched = []
+    lock = threading.Lock()
+
+    def fake_fetch(query, asset_upper, q_start, q_end, day_start, per_day_limit):
+        with lock:
+            fetched.append(day_start)
+        return [{"url": f"https://example.com/{day_start:%Y%m%d}", "published_at": day_start}]
+
+    client._fetch_one_day = fake_fetch
+    end = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    criteria = HarvestCriteriaDTO(asset_symbol="BTC", start=end - timedelta(days=10), end=end, limit=5)
+
+    days = []
+    for i, batch in enumerate(client.iter_documents(criteria)):
+        time.sleep(0.02)  # langsamer Konsument: Worker hätten Zeit, vorzulaufen
+        with lock:
+            assert len(fetched) <= i + client.max_workers
+        days.append(batch[0]["published_at"])
+
+    assert len(days) == 10
+    assert days == sorted(days)
+    assert len(fetched) == 10
@@ -0,0 +1,122 @@
+# tests/features/news/test_google_news_rss_client.py
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
+from com.lingenhag.rrp.features.news.infrastructure.google_news_rss_client import GoogleNewsRssClient
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_feed_cache import DuckDBFeedCacheRepository
+from com.lingenhag.rrp.features.news.infrastructure.repositories.duckdb_resolved_url_cache import (
+    DuckDBResolvedUrlCacheRepository,
+)
+
+_FEED = b"""<?xml version="1.0"?>
+<rss><channel>
+<item><title>A</title><link>https://news.google.com/rss/articles/a</link>
+<pubDate>Wed, 01 Oct 2025 08:00:00 GMT</pubDate><source url="https://a.com">A Pub</source></item>
+<item><title>B</title><link>https://news.google.com/rss/articles/b</link>
+<pubDate>Wed, 01 Oct 2025 14:00:00 GMT</pubDate><source url="https://b.com">B Pub</source></item>
+</channel></rss>"""
+
+
+def _response(status, body=b"", headers=None):
+    resp = Mock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.iter_content.side_effect = lambda chunk_size: iter([body])
+    return resp
+
+
+def _client(feed_cache, response):
+    client = GoogleNewsRssClient(resolve_redirects=False, feed_cache=feed_cache)
+    client._session.close()
+    client._session = Mock()
+    client._session.get.return_value = response
+    return client
+
+
+def _criteria(start_hour=0):
+    return HarvestCriteriaDTO(
+        asset_symbol="BTC",
+        start=datetime(2025, 10, 1, start_hour, tzinfo=timezone.utc),
+        end=datetime(2025, 10, 2, tzinfo=timezone.utc),
+        limit=10,
+    )
+
+
+@pytest.fixture
+def feed_cache(migrated_con):
+    return DuckDBFeedCacheRepository(":memory:", conn=migrated_con("010_rss_feed_cache.sql"))
+
+
+def test_not_modified_feed_is_served_from_persistent_cache(feed_cache):
+    first = _client(feed_cache, _response(200, _FEED, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025"}))
+    fresh = first.fetch_documents(_criteria())
+    assert [d["title"] for d in fresh] == ["A", "B"]
+    assert "If-None-Match" not in first._session.get.call_args.kwargs["headers"]
+
+    # Neuer Client = neuer CLI-Lauf; Zustand kommt nur aus der DB
+    second = _client(feed_cache, _response(304))
+    cached = second.fetch_documents(_criteria())
+
+    headers = second._session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Wed, 01 Oct 2025"
+    assert [(d["url"], d["title"], d["raw"]["publisher"]) for d in cached] == [
+        (d["url"], d["title"], d["raw"]["publisher"]) for d in fresh
+    ]
+
+
+def test_cached_items_are_filtered_by_the_current_window(feed_cache):
+    _client(feed_cache, _response(200, _FEED, {"ETag": '"v1"'})).fetch_documents(_criteria())
+
+    cached = _client(feed_cache, _response(304)).fetch_documents(_criteria(start_hour=12))
+
+    assert [d["title"] for d in cached] == ["B"]
+
+
+def test_response_without_validators_is_not_cached(feed_cache):
+    client = _client(feed_cache, _response(200, _FEED))
+    client.fetch_documents(_criteria())
+
+    assert feed_cache.get(client._build_url(client._build_query(_criteria()))) is None
+
+
+class _FakeResolver:
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def resolve_many(self, urls):
+        self.calls.append(list(urls))
+        return [self.answers.get(u) for u in urls]
+
+
+@pytest.fixture
+def url_cache(migrated_con):
+    return DuckDBResolvedUrlCacheRepository(":memory:", conn=migrated_con("009_rss_resolved_urls.sql"))
+
+
+def test_resolve_links_uses_cache_and_stores_only_publisher_urls(url_cache):
+    g = "https://news.google.com/rss/articles/"
+    url_cache.put_many([(g + "cached", "https://cached.com/x")])
+    resolver = _FakeResolver({
+        g + "pub": "https://pub.com/story",
+        g + "fallback": "https://news.google.com/articles/fallback",  # kein Publisher gefunden
+        g + "same": g + "same",
+        g + "none": None,
+    })
+    client = GoogleNewsRssClient(resolver=resolver, url_cache=url_cache)
+    links = [g + "cached", g + "pub", g + "fallback", g + "same", g + "none", g + "pub"]
+
+    out = client._resolve_links(links)
+    client._session.close()
+
+    assert out == [
+        "https://cached.com/x", "https://pub.com/story", "https://news.google.com/articles/fallback",
+        g + "same", g + "none", "https://pub.com/story",
+    ]
+    assert resolver.calls == [[g + "pub", g + "fallback", g + "same", g + "none"]]
+    # Fallbacks auf news.google.com und unveränderte Links werden beim nächsten Lauf erneut versucht
+    assert url_cache.get_many(links) == {g + "cached": "https://cached.com/x", g + "pub": "https://pub.com/story"}
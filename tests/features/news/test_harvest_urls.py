@@ -1,8 +1,8 @@
 # tests/features/news/test_harvest_urls.py
 from unittest.mock import Mock, patch
 import pytest
-from datetime import datetime, timezone
-from com.lingenhag.rrp.features.news.application.usecases.harvest_urls import HarvestUrls, is_valid_news_url
+from datetime import datetime, timedelta, timezone
+from com.lingenhag.rrp.features.news.application.usecases.harvest_urls import HarvestUrls, is_valid_news_url, _hostname
 from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO, NewsSourcePort
 from com.lingenhag.rrp.domain.models import HarvestSummary
 # No conftest import – fixtures auto-injected
@@ -13,6 +13,28 @@ def test_is_valid_news_url():
     assert is_valid_news_url("https://test.com/image.jpg") is False
     assert is_valid_news_url("ftp://invalid") is False
     assert is_valid_news_url("") is False
+    assert is_valid_news_url("https://test.com/image.jpg?w=640") is False
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTPS://x.com/a", False),  # Schema case-sensitiv
+        ("Https://x.com/article", False),
+        ("https://x.com/a.pdf#p2", True),  # nur "?" beendet den geprüften Teil
+        ("https://x.com/a#b.pdf", False),
+        ("https://example.jpg", False),  # reine Hosts werden ebenfalls per Endung geprüft
+        ("https://x.com/a.PDF", False),
+    ],
+)
+def test_is_valid_news_url_edge_cases(url, expected):
+    assert is_valid_news_url(url) is expected
+
+
+def test_hostname():
+    assert _hostname("https://News.Example.com:443/a?b=1") == "news.example.com"
+    assert _hostname("https://user:pw@example.com/a") == "example.com"
+    assert _hostname("not a url") is None
 
 
 def test_harvest_urls_basic_flow(mock_news_source, mock_repo, mock_domain_policy, sample_criteria):
@@ -22,9 +44,9 @@ def test_harvest_urls_basic_flow(mock_news_source, mock_repo, mock_domain_policy
     summary = svc.run(criteria=sample_criteria, verbose=False)
 
     mock_news_source.fetch_documents.assert_called_once_with(sample_criteria)
-    mock_repo.save_url_harvest.assert_called_once()
+    mock_repo.save_url_harvests_bulk.assert_called_once()
     mock_domain_policy.is_allowed.assert_called_once()
-    mock_domain_policy.record_harvest.assert_called_once()
+    mock_domain_policy.record_harvest_bulk.assert_called_once_with("BTC", [("test.com", True)])
 
     assert summary.total_docs == 1
     assert summary.after_assemble == 1
@@ -35,7 +57,8 @@ def test_harvest_urls_basic_flow(mock_news_source, mock_repo, mock_domain_policy
 
 
 def test_harvest_urls_duplicate(mock_news_source, mock_repo, mock_domain_policy, sample_criteria):
-    mock_repo.save_url_harvest.return_value = (1, True)  # Duplicate
+    mock_repo.save_url_harvests_bulk.side_effect = None
+    mock_repo.save_url_harvests_bulk.return_value = set()  # Duplicate
     sources = [mock_news_source]
     svc = HarvestUrls(sources=sources, repo=mock_repo, domain_policy=mock_domain_policy)
 
@@ -54,7 +77,7 @@ def test_harvest_urls_invalid_url(mock_news_source, mock_repo, mock_domain_polic
 
     summary = svc.run(criteria=sample_criteria, verbose=False)
 
-    mock_repo.save_url_harvest.assert_not_called()
+    mock_repo.save_url_harvests_bulk.assert_not_called()
     assert summary.rejected_invalid == 1
     assert summary.after_assemble == 0
 
@@ -82,4 +105,46 @@ def test_harvest_urls_multiple_sources(mock_news_source, mock_repo, mock_domain_
     summary = svc.run(criteria=sample_criteria, verbose=False)
 
     assert summary.total_docs == 2
-    assert mock_repo.save_url_harvest.call_count == 2
\ No newline at end of file
+    assert mock_repo.save_url_harvests_bulk.call_count == 2
+    assert summary.saved == 2
+
+def test_harvest_urls_repeated_url_counts_as_duplicate(mock_news_source, mock_repo, mock_domain_policy, sample_criteria):
+    doc = {"url": "https://test.com/1", "title": "Test1"}
+    mock_news_source.fetch_documents.return_value = [doc, dict(doc)]
+    svc = HarvestUrls(sources=[mock_news_source], repo=mock_repo, domain_policy=mock_domain_policy)
+
+    summary = svc.run(criteria=sample_criteria, verbose=False)
+
+    assert summary.after_dedupe == 2
+    assert summary.saved == 1
+    assert summary.skipped_duplicates == 1
+
+
+def test_harvest_urls_skips_known_urls(mock_news_source, mock_repo, mock_domain_policy, sample_criteria):
+    mock_repo.existing_urls.return_value = {"https://test.com/1"}
+    svc = HarvestUrls(sources=[mock_news_source], repo=mock_repo, domain_policy=mock_domain_policy)
+
+    summary = svc.run(criteria=sample_criteria, verbose=False)
+
+    mock_repo.existing_urls.assert_called_once_with("BTC", since=sample_criteria.start - timedelta(days=14))
+    mock_repo.save_url_harvests_bulk.assert_not_called()
+    assert summary.after_dedupe == 1
+    assert summary.skipped_duplicates == 1
+    assert summary.saved == 0
+
+
+def test_harvest_urls_consumes_streamed_batches(mock_repo, mock_domain_policy, sample_criteria):
+    class StreamingSource:
+        SOURCE_NAME = "streaming"
+
+        def iter_documents(self, criteria):
+            yield [{"url": "https://test.com/a", "title": "A"}]
+            yield [{"url": "https://test.com/b", "title": "B"}, {"url": "https://test.com/a", "title": "A"}]
+
+    svc = HarvestUrls(sources=[StreamingSource()], repo=mock_repo, domain_policy=mock_domain_policy)
+
+    summary = svc.run(criteria=sample_criteria, verbose=False)
+
+    assert summary.total_docs == 3
+    assert summary.saved == 2
+    assert summary.skipped_duplicates == 1
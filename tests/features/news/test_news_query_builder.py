@@ -21,39 +21,57 @@ def mock_registry():
     return registry
 
 
-def test_news_query_builder_core(mock_registry):
+@pytest.mark.parametrize(
+    "method_name,args,aliases,require_context,expected_substrings,absent_substrings",
+    [
+        # (SOL OR Solana OR "Solana Labs") AND (crypto OR ...) AND NOT (solar OR peru)
+        (
+            "build_core_boolean", ("SOL",), ["Solana Labs"], True,
+            ['SOL OR Solana OR "Solana Labs"', "crypto OR cryptocurrency", "NOT (solar OR peru)"], [],
+        ),
+        # Harte Synonyme, ohne Krypto-Kontext
+        ("build_core_boolean", ("BTC",), [], False, ["Bitcoin"], ["crypto"]),
+        ("build_for_gdelt", ("DOT",), ["Solana Labs"], True, ["Polkadot"], []),
+        (
+            "build_for_rss", ("ETH", "2025-10-01", "2025-10-02"), ["Solana Labs"], True,
+            ["after:2025-10-01 before:2025-10-02", "Ethereum"], [],
+        ),
+    ],
+    ids=["core", "no_context", "gdelt", "rss"],
+)
+def test_news_query_builder_queries(
+        mock_registry, method_name, args, aliases, require_context, expected_substrings, absent_substrings
+):
+    mock_registry.get_aliases.return_value = aliases
+    builder = NewsQueryBuilder(
+        asset_registry=mock_registry, params=QueryBuildParams(require_crypto_context=require_context)
+    )
+    query = getattr(builder, method_name)(*args)
+
+    for part in expected_substrings:
+        assert part in query
+    for part in absent_substrings:
+        assert part not in query
+
+
+def test_news_query_builder_caches_registry_lookups(mock_registry):
     builder = NewsQueryBuilder(asset_registry=mock_registry)
-    query = builder.build_core_boolean("SOL")
+    first = builder.build_for_gdelt("SOL")
+    builder.build_core_boolean("SOL")
+    builder.build_for_rss("SOL", "2025-10-01", "2025-10-02")
 
-    # Expected: (SOL OR sol OR "Solana Labs") AND (crypto OR ...) NOT (solar OR peru)
-    # Actual has mixed case – check lowercase
-    lower_query = query.lower()
-    assert "sol or solana or \"solana labs\"" in lower_query
-    assert "crypto or cryptocurrency" in lower_query
-    assert "not (solar or peru)" in lower_query
+    assert builder.build_for_gdelt("SOL") == first
+    assert mock_registry.get_aliases.call_count == 1
+    assert mock_registry.get_negative_terms.call_count == 1
 
+    builder.clear_cache()
+    builder.build_for_gdelt("SOL")
+    assert mock_registry.get_aliases.call_count == 2
 
-def test_news_query_builder_no_context(mock_registry):
-    mock_registry.get_aliases.return_value = []
-    # Create new params instance to avoid frozen error
-    params = QueryBuildParams(require_crypto_context=False)
-    builder = NewsQueryBuilder(asset_registry=mock_registry, params=params)
-    query = builder.build_core_boolean("BTC")
 
-    assert "Bitcoin" in query  # Hard synonym
-    assert "crypto" not in query  # No context
-
-
-def test_news_query_builder_gdelt(mock_registry):
-    builder = NewsQueryBuilder(asset_registry=mock_registry)
-    query = builder.build_for_gdelt("DOT")
-
-    assert "Polkadot" in query  # Synonym
-
-
-def test_news_query_builder_rss(mock_registry):
+def test_news_query_builder_normalizes_symbol_once(mock_registry):
     builder = NewsQueryBuilder(asset_registry=mock_registry)
-    query = builder.build_for_rss("ETH", "2025-10-01", "2025-10-02")
 
-    assert "after:2025-10-01 before:2025-10-02" in query
-    assert "Ethereum" in query
\ No newline at end of file
+    assert builder.build_for_gdelt(" sol ") == builder.build_for_gdelt("SOL")
+    assert builder.build_query_spec("sol").asset_symbol == "SOL"
+    mock_registry.get_aliases.assert_called_once_with("SOL")
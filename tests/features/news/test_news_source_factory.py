@@ -0,0 +1,56 @@
+# tests/features/news/test_news_source_factory.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from com.lingenhag.rrp.platform.config.settings import Settings
+from com.lingenhag.rrp.features.news.application.factories import NewsSourceFactory
+from com.lingenhag.rrp.features.news.application.ports import HarvestCriteriaDTO
+from com.lingenhag.rrp.features.news.infrastructure.gdelt_client import GdeltClient
+
+
+@pytest.fixture
+def sources():
+    config = Settings(config={
+        "news_query": {
+            "major_assets_without_context": ["BTC", "ETH"],
+            "enforce_context_assets": ["SOL"],
+        },
+        "google_news": {"resolve_redirects": False},
+    })
+    srcs = NewsSourceFactory(config, Mock()).create_sources("all", 2)
+    yield srcs
+    for src in srcs:
+        src.close()
+
+
+def _criteria(sym, query_cores=None):
+    end = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return HarvestCriteriaDTO(
+        asset_symbol=sym, start=end - timedelta(days=2), end=end, limit=5, query_cores=query_cores
+    )
+
+
+def _gdelt_queries(client, criteria):
+    seen = []
+    client._fetch_one_day = lambda query, *args: seen.append(query) or []
+    list(client.iter_documents(criteria))
+    return seen
+
+
+@pytest.mark.parametrize("sym", ["BTC", "ETH", "SOL", "ADA"])
+def test_precomputed_query_cores_match_per_source_queries(sources, sym):
+    gdelt = next(s for s in sources if isinstance(s, GdeltClient))
+    rss = next(s for s in sources if s.SOURCE_NAME == "google_rss")
+    cores = NewsSourceFactory.build_query_cores(sym, sources)
+
+    assert _gdelt_queries(gdelt, _criteria(sym, cores)) == _gdelt_queries(gdelt, _criteria(sym))
+    assert rss.client._build_query(_criteria(sym, cores)) == rss.client._build_query(_criteria(sym))
+
+
+def test_query_cores_keep_source_specific_context(sources):
+    cores = NewsSourceFactory.build_query_cores("BTC", sources)
+    # GDELT: Kontext immer aktiv; RSS: Major-Assets ohne Kontext, mit zitiertem Langnamen
+    assert "crypto" in cores["gdelt"]
+    assert cores["google_rss"] == '(BTC OR "Bitcoin")'
@@ -0,0 +1,35 @@
+# tests/features/news/test_search_query.py
+from com.lingenhag.rrp.features.news.infrastructure import search_query
+from com.lingenhag.rrp.features.news.infrastructure.search_query import (
+    QuerySpec,
+    build_boolean_core,
+    build_google_news_query,
+)
+
+
+def test_query_spec_is_hashable_with_list_fields():
+    spec = QuerySpec(asset_symbol="SOL", aliases=["Solana Labs"], negative_terms=["solar"])
+
+    assert spec.aliases == ("Solana Labs",)
+    assert spec == QuerySpec(asset_symbol="SOL", aliases=("Solana Labs",), negative_terms=("solar",))
+    assert hash(spec) == hash(QuerySpec(asset_symbol="SOL", aliases=("Solana Labs",), negative_terms=("solar",)))
+
+
+def test_build_boolean_core_is_memoized():
+    search_query.cache_clear()
+    spec = QuerySpec(asset_symbol="ETH")
+
+    first = build_boolean_core(spec)
+    assert build_boolean_core(QuerySpec(asset_symbol="ETH")) == first
+    assert build_boolean_core.cache_info().hits == 1
+
+    query = build_google_news_query(spec, start_iso_date="2025-10-01", end_iso_date="2025-10-02")
+    assert query == f"{first} after:2025-10-01 before:2025-10-02"
+
+
+def test_canonical_spec_is_shared_per_symbol():
+    spec = QuerySpec.canonical("btc")
+
+    assert spec is QuerySpec.canonical("btc")
+    assert spec == QuerySpec(asset_symbol="BTC")
+    assert QuerySpec.canonical("btc", False).require_crypto_context is False